@@ -0,0 +1,50 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+EXAMPLE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(EXAMPLE_DIRECTORY), "src")
+
+STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+from mercury_model import mercury_model
+imported = time.perf_counter()
+mercury_model()
+built = time.perf_counter()
+print(imported - start, built - imported)
+"""
+
+
+def measure_startup() -> tuple:
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        path for path in [SOURCE_DIRECTORY, EXAMPLE_DIRECTORY, environment.get("PYTHONPATH")] if path
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT], env=environment, capture_output=True, text=True, check=True
+    ).stdout
+    import_time, build_time = output.split()
+    return float(import_time), float(build_time)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="measure import and model build time in fresh interpreters")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=1.0, help="maximum median startup time in seconds")
+    args = parser.parse_args()
+
+    import_times, build_times = zip(*[measure_startup() for _ in range(args.runs)])
+    total_times = [i + b for i, b in zip(import_times, build_times)]
+    print(f"import: median {statistics.median(import_times):.3f}s, min {min(import_times):.3f}s")
+    print(f"build:  median {statistics.median(build_times):.3f}s, min {min(build_times):.3f}s")
+    print(f"total:  median {statistics.median(total_times):.3f}s, max {max(total_times):.3f}s")
+
+    if statistics.median(total_times) > args.budget:
+        sys.exit(f"median startup time exceeds the budget of {args.budget}s")
+
+
+if __name__ == "__main__":
+    main()
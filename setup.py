@@ -30,6 +30,8 @@ setup(
     setup_requires=['flake8'],
     extras_require={  
         "dev": ["check-manifest"],
+        "parquet": ["pyarrow"],
+        "toml": ['tomli; python_version < "3.11"'],
         "test": [
             "pytest",
             "numpy",
@@ -37,7 +39,9 @@ setup(
             "coverage",
             "pytest-cov",
             "cvxpy",
-            "cylp"
+            "cylp",
+            "pyarrow",
+            'tomli; python_version < "3.11"',
         ],
     },
 )
@@ -0,0 +1,187 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from common.model.component import GridLine, BUS_ID
+from common.model.grid_network_util import DCPowerFlowSolver
+
+BASE_CASE = -1
+ISLANDING_TOLERANCE = 1e-8
+
+
+@dataclass
+class ContingencyViolationTable:
+    outage_line_index: np.ndarray = field(default_factory=lambda: np.array([], dtype=int))
+    line_index: np.ndarray = field(default_factory=lambda: np.array([], dtype=int))
+    operating_point_index: np.ndarray = field(default_factory=lambda: np.array([], dtype=int))
+    line_power: np.ndarray = field(default_factory=lambda: np.array([]))
+    limit: np.ndarray = field(default_factory=lambda: np.array([]))
+    islanding_outages: np.ndarray = field(default_factory=lambda: np.array([], dtype=int))
+
+    def __len__(self):
+        return len(self.line_index)
+
+    @classmethod
+    def concatenate(cls, tables: List["ContingencyViolationTable"]) -> "ContingencyViolationTable":
+        if len(tables) == 0:
+            return cls()
+
+        return cls(
+            outage_line_index=np.concatenate([t.outage_line_index for t in tables]),
+            line_index=np.concatenate([t.line_index for t in tables]),
+            operating_point_index=np.concatenate([t.operating_point_index for t in tables]),
+            line_power=np.concatenate([t.line_power for t in tables]),
+            limit=np.concatenate([t.limit for t in tables]),
+            islanding_outages=np.concatenate([t.islanding_outages for t in tables]),
+        )
+
+    def get_outage_violations(self, outage_line_index: int) -> "ContingencyViolationTable":
+        mask = self.outage_line_index == outage_line_index
+        return ContingencyViolationTable(
+            outage_line_index=self.outage_line_index[mask],
+            line_index=self.line_index[mask],
+            operating_point_index=self.operating_point_index[mask],
+            line_power=self.line_power[mask],
+            limit=self.limit[mask],
+            islanding_outages=self.islanding_outages[self.islanding_outages == outage_line_index],
+        )
+
+
+class _ContingencyScreeningState:
+    def __init__(self, solver: DCPowerFlowSolver, base_line_power: np.ndarray, tolerance: float):
+        self.solver = solver
+        self.base_line_power = base_line_power
+        self.lower_limit, self.upper_limit = line_limits(solver.grid_lines)
+        self.tolerance = tolerance
+
+
+_worker_state: Optional[_ContingencyScreeningState] = None
+
+
+def _initialise_worker(*args):
+    global _worker_state
+    _worker_state = _ContingencyScreeningState(*args)
+
+
+def _screen_worker_outages(outage_lines: List[int]) -> ContingencyViolationTable:
+    return screen_outages(_worker_state, outage_lines)
+
+
+def line_limits(grid_lines: List[GridLine]) -> Tuple[np.ndarray, np.ndarray]:
+    lower_limit = np.array([-np.inf if line.bounds is None else line.bounds.min for line in grid_lines])
+    upper_limit = np.array([np.inf if line.bounds is None else line.bounds.max for line in grid_lines])
+    return lower_limit, upper_limit
+
+
+def find_violations(
+    line_power: np.ndarray, lower_limit: np.ndarray, upper_limit: np.ndarray, tolerance: float, outage_line: int
+) -> ContingencyViolationTable:
+    upper_violation = line_power > upper_limit[:, np.newaxis] + tolerance
+    lower_violation = line_power < lower_limit[:, np.newaxis] - tolerance
+    line_index, operating_point_index = np.nonzero(upper_violation | lower_violation)
+
+    return ContingencyViolationTable(
+        outage_line_index=np.full(len(line_index), outage_line, dtype=int),
+        line_index=line_index,
+        operating_point_index=operating_point_index,
+        line_power=line_power[line_index, operating_point_index],
+        limit=np.where(
+            upper_violation[line_index, operating_point_index], upper_limit[line_index], lower_limit[line_index]
+        ),
+    )
+
+
+def line_outage_distribution_factors(solver: DCPowerFlowSolver, outage_lines: List[int]) -> np.ndarray:
+    line_vectors = solver.incidence_matrix[outage_lines].T.toarray()
+    transfer_factors = solver.line_power(None, phase_angle=solver.phase_angle(line_vectors))
+    self_transfer_factor = transfer_factors[outage_lines, np.arange(len(outage_lines))]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        distribution_factors = transfer_factors / (1 - self_transfer_factor)
+    distribution_factors[outage_lines, np.arange(len(outage_lines))] = -1
+    distribution_factors[:, np.abs(1 - self_transfer_factor) < ISLANDING_TOLERANCE] = np.nan
+    return distribution_factors
+
+
+def screen_outages(state: _ContingencyScreeningState, outage_lines: List[int]) -> ContingencyViolationTable:
+    distribution_factors = line_outage_distribution_factors(state.solver, outage_lines)
+    tables = []
+    islanding_outages = []
+
+    for count, outage_line in enumerate(outage_lines):
+        if np.isnan(distribution_factors[:, count]).any():
+            islanding_outages.append(outage_line)
+            continue
+
+        line_power = state.base_line_power + np.outer(
+            distribution_factors[:, count], state.base_line_power[outage_line]
+        )
+        tables.append(
+            find_violations(line_power, state.lower_limit, state.upper_limit, state.tolerance, outage_line)
+        )
+
+    violation_table = ContingencyViolationTable.concatenate(tables)
+    violation_table.islanding_outages = np.array(islanding_outages, dtype=int)
+    return violation_table
+
+
+class ContingencyAnalysis:
+    def __init__(
+        self,
+        buses: List[BUS_ID],
+        grid_lines: List[GridLine],
+        line_status: Optional[np.ndarray] = None,
+        max_workers: int = 1,
+        chunk_size: int = 64,
+        tolerance: float = 1e-6,
+    ):
+        self._buses = list(buses)
+        self._grid_lines = list(grid_lines)
+        self._solver = DCPowerFlowSolver(self._buses, self._grid_lines, line_status=line_status)
+        self._max_workers = max_workers
+        self._chunk_size = chunk_size
+        self._tolerance = tolerance
+
+    @property
+    def solver(self) -> DCPowerFlowSolver:
+        return self._solver
+
+    def _outage_chunks(self) -> List[List[int]]:
+        outage_lines = np.flatnonzero(self._solver.line_status).tolist()
+        return [outage_lines[i: i + self._chunk_size] for i in range(0, len(outage_lines), self._chunk_size)]
+
+    def base_line_power(self, bus_power: np.ndarray) -> np.ndarray:
+        bus_power = np.asarray(bus_power, dtype=float)
+        if bus_power.ndim == 1:
+            bus_power = bus_power[:, np.newaxis]
+        return self._solver.line_power(bus_power)
+
+    def post_contingency_line_power(self, bus_power: np.ndarray, outage_line: int) -> np.ndarray:
+        base_line_power = self.base_line_power(bus_power)
+        distribution_factors = line_outage_distribution_factors(self._solver, [outage_line])
+        if np.isnan(distribution_factors).any():
+            raise IslandingContingencyError(f"outage of line {outage_line} islands the grid network")
+        return base_line_power + np.outer(distribution_factors[:, 0], base_line_power[outage_line])
+
+    def screen(self, bus_power: np.ndarray) -> ContingencyViolationTable:
+        base_line_power = self.base_line_power(bus_power)
+        lower_limit, upper_limit = line_limits(self._grid_lines)
+        base_violations = find_violations(base_line_power, lower_limit, upper_limit, self._tolerance, BASE_CASE)
+        state_args = (self._solver, base_line_power, self._tolerance)
+
+        if self._max_workers <= 1:
+            state = _ContingencyScreeningState(*state_args)
+            outage_tables = [screen_outages(state, chunk) for chunk in self._outage_chunks()]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self._max_workers, initializer=_initialise_worker, initargs=state_args
+            ) as executor:
+                outage_tables = list(executor.map(_screen_worker_outages, self._outage_chunks()))
+
+        return ContingencyViolationTable.concatenate([base_violations] + outage_tables)
+
+
+class IslandingContingencyError(ValueError):
+    pass
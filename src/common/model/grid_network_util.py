@@ -1,8 +1,11 @@
-from typing import List
+import copy
+from typing import List, Dict, Optional
 
 import numpy as np
+from scipy import sparse
 
 from common.model.component import GridLine, BUS_ID
+from common.model.grid_topology import GridTopologyIndex
 
 
 class GridNetworkUtils:
@@ -12,9 +15,10 @@ class GridNetworkUtils:
             return True
         else:
             try:
+                bus_set = set(buses)
                 for line in grid_lines:
-                    assert line.to_bus in buses
-                    assert line.from_bus in buses
+                    assert line.to_bus in bus_set
+                    assert line.from_bus in bus_set
                     assert line.to_bus != line.from_bus
 
                 return True
@@ -25,77 +29,218 @@ class GridNetworkUtils:
     def _get_bus_grid_line(bus_id: BUS_ID, grid_lines: List[GridLine]) -> List[GridLine]:
         return [line for line in grid_lines if line.is_connected_to_bus(bus_id)]
 
+    @staticmethod
+    def get_bus_index(buses: List[BUS_ID]) -> Dict[BUS_ID, int]:
+        return {bus_id: count for count, bus_id in enumerate(buses)}
+
+    @classmethod
+    def calculate_incidence_matrix(cls, buses: List[BUS_ID], grid_lines: List[GridLine]) -> sparse.csr_matrix:
+        bus_index = cls.get_bus_index(buses)
+        num_lines = len(grid_lines)
+        rows = np.repeat(np.arange(num_lines), 2)
+        cols = np.array(
+            [bus_index[bus_id] for line in grid_lines for bus_id in (line.from_bus, line.to_bus)], dtype=int
+        )
+        data = np.tile([1.0, -1.0], num_lines)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(num_lines, len(buses)))
+
+    @classmethod
+    def calculate_sparse_admittance_matrix(cls, buses: List[BUS_ID], grid_lines: List[GridLine]) -> sparse.csc_matrix:
+        incidence = cls.calculate_incidence_matrix(buses, grid_lines)
+        admittance = np.array([line.admittance for line in grid_lines], dtype=float)
+        return (incidence.T @ sparse.diags(admittance) @ incidence).tocsc()
+
     @classmethod
     def calculate_admittance_matrix(cls, buses: List[BUS_ID], grid_lines: List[GridLine]):
         if cls.check_bus_grid_lines(buses, grid_lines):
-            admittance_matrix = np.zeros((len(buses), len(buses)))
-            for count, bus_id in enumerate(buses):
-                lines = cls._get_bus_grid_line(bus_id, grid_lines)
-                for line in lines:
-                    if line.to_bus == bus_id:
-                        from_bus_index = buses.index(line.from_bus)
-                        admittance_matrix[count, from_bus_index] = -line.admittance
-                    else:
-                        to_bus_index = buses.index(line.to_bus)
-                        admittance_matrix[count, to_bus_index] = -line.admittance
-
-            admittance_matrix = admittance_matrix + np.diag(
-                [-admittance_matrix[i, :].sum() for i in range(0, len(buses))]
-            )
-            return admittance_matrix
+            return cls.calculate_sparse_admittance_matrix(buses, grid_lines).toarray()
 
     @classmethod
     def calculate_dc_power_flow_matrix(cls, buses: List[BUS_ID], grid_lines: List[GridLine]):
         connected_status = cls.check_grid_network_connected(grid_lines)
 
         if connected_status and cls.check_bus_grid_lines(buses, grid_lines):
-            num_buses = len(buses)
-            dc_power_flow = cls.calculate_admittance_matrix(buses, grid_lines)
-            dc_power_flow[0, :] = np.zeros((1, num_buses))
-            dc_power_flow[:, 0] = np.zeros((num_buses,))
-            dc_power_flow[0, 0] = 1
-            dc_power_flow = np.linalg.inv(dc_power_flow)
-            return dc_power_flow
+            return DCPowerFlowSolver(buses, grid_lines).dc_power_flow_matrix()
         else:
             return np.array([])
 
-    @classmethod
-    def check_grid_network_connected(cls, grid_lines: List[GridLine]) -> bool:
-        bus_set = []
-        for line in grid_lines:
-            bus_set = cls._update_bus_set(line, bus_set)
-
-        if len(bus_set) == 1:
-            return True
-        else:
-            return False
-
     @staticmethod
-    def _update_bus_set(line: GridLine, list_set_buses: List[List[BUS_ID]]):
-        if len(list_set_buses) == 0:
-            list_set_buses.append([line.to_bus, line.from_bus])
+    def check_grid_network_connected(grid_lines: List[GridLine]) -> bool:
+        return GridTopologyIndex(grid_lines).is_connected()
+
+
+class DCPowerFlowSolver:
+    def __init__(
+        self,
+        buses: List[BUS_ID],
+        grid_lines: List[GridLine],
+        line_status: Optional[np.ndarray] = None,
+        max_rank_updates: int = 32,
+    ):
+        self._buses = list(buses)
+        self._grid_lines = list(grid_lines)
+        self._bus_index = GridNetworkUtils.get_bus_index(self._buses)
+        self._incidence_matrix = GridNetworkUtils.calculate_incidence_matrix(self._buses, self._grid_lines)
+        self._line_admittance = np.array([line.admittance for line in self._grid_lines], dtype=float)
+        self._max_rank_updates = max_rank_updates
+        if line_status is None:
+            self._line_status = np.ones(len(self._grid_lines), dtype=bool)
+        else:
+            self._line_status = np.array(line_status, dtype=bool)
+        self._refactorise()
+
+    def _refactorise(self):
+        self._factor = self._factorise()
+        self._factorised_line_status = self._line_status.copy()
+        self._correction_basis: Dict[int, np.ndarray] = {}
+        self._correction_lines: List[int] = []
+        self._capacitance_inverse: Optional[np.ndarray] = None
+
+    def _factorise(self):
+        if len(self._buses) <= 1:
+            return None
+
+        from scipy.sparse.linalg import splu
+
+        admittance = self._line_admittance * self._line_status
+        susceptance = (self._incidence_matrix.T @ sparse.diags(admittance) @ self._incidence_matrix).tocsc()
+        try:
+            return splu(susceptance[1:, 1:].tocsc(), permc_spec="MMD_AT_PLUS_A")
+        except RuntimeError as err:
+            raise SingularGridNetworkError(f"reduced susceptance matrix cannot be factorised: {err}")
+
+    @property
+    def buses(self) -> List[BUS_ID]:
+        return self._buses
+
+    @property
+    def bus_index(self) -> Dict[BUS_ID, int]:
+        return self._bus_index
+
+    @property
+    def grid_lines(self) -> List[GridLine]:
+        return self._grid_lines
+
+    @property
+    def incidence_matrix(self) -> sparse.csr_matrix:
+        return self._incidence_matrix
+
+    @property
+    def line_admittance(self) -> np.ndarray:
+        return self._line_admittance
+
+    @property
+    def line_status(self) -> np.ndarray:
+        return self._line_status
+
+    @property
+    def number_rank_updates(self) -> int:
+        return len(self._correction_lines)
+
+    def copy(self) -> "DCPowerFlowSolver":
+        solver = copy.copy(self)
+        solver._line_status = self._line_status.copy()
+        solver._correction_basis = dict(self._correction_basis)
+        solver._correction_lines = list(self._correction_lines)
+        return solver
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_factor"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._refactorise()
+
+    def _reduced_line_vector(self, line_index: int) -> np.ndarray:
+        return self._incidence_matrix.getrow(line_index).toarray()[0, 1:]
+
+    def set_line_status(self, line_index: int, status: bool):
+        if bool(self._line_status[line_index]) == status:
+            return
+
+        previous_line_status = self._line_status.copy()
+        self._line_status[line_index] = status
+        correction_lines = np.flatnonzero(self._line_status != self._factorised_line_status).tolist()
+
+        try:
+            if self._factor is None:
+                return
+            elif len(correction_lines) > self._max_rank_updates:
+                self._refactorise()
+            else:
+                correction_basis = {
+                    index: self._correction_basis[index]
+                    if index in self._correction_basis
+                    else self._solve_base(self._reduced_line_vector(index))
+                    for index in correction_lines
+                }
+                self._capacitance_inverse = self._calculate_capacitance_inverse(correction_lines, correction_basis)
+                self._correction_basis = correction_basis
+                self._correction_lines = correction_lines
+        except SingularGridNetworkError:
+            self._line_status = previous_line_status
+            raise
+
+    def _calculate_capacitance_inverse(
+        self, correction_lines: List[int], correction_basis: Dict[int, np.ndarray]
+    ) -> Optional[np.ndarray]:
+        if len(correction_lines) == 0:
+            return None
+
+        basis = np.column_stack([correction_basis[i] for i in correction_lines])
+        line_vectors = np.column_stack([self._reduced_line_vector(i) for i in correction_lines])
+        sign = np.where(self._line_status[correction_lines], 1.0, -1.0)
+        capacitance = np.diag(1 / (sign * self._line_admittance[correction_lines])) + line_vectors.T @ basis
+
+        if np.linalg.cond(capacitance) > 1 / np.finfo(float).eps:
+            raise SingularGridNetworkError("line status change islands the grid network")
+        return np.linalg.inv(capacitance)
+
+    def _stacked_correction_basis(self) -> np.ndarray:
+        return np.column_stack([self._correction_basis[i] for i in self._correction_lines])
+
+    def _solve_base(self, rhs: np.ndarray) -> np.ndarray:
+        return self._factor.solve(np.ascontiguousarray(rhs, dtype=float))
+
+    def _solve_reduced(self, rhs: np.ndarray) -> np.ndarray:
+        solution = self._solve_base(rhs)
+        if self._capacitance_inverse is not None:
+            basis = self._stacked_correction_basis()
+            solution = solution - basis @ (self._capacitance_inverse @ (basis.T @ rhs))
+        return solution
+
+    def phase_angle(self, bus_power: np.ndarray) -> np.ndarray:
+        bus_power = np.asarray(bus_power, dtype=float)
+        if bus_power.shape[0] != len(self._buses):
+            raise ValueError("bus power and number of buses in the grid network do not match")
+
+        phase_angle = np.zeros(bus_power.shape)
+        if self._factor is not None:
+            phase_angle[1:] = self._solve_reduced(bus_power[1:])
+        return phase_angle
+
+    def line_power(self, bus_power: np.ndarray, phase_angle: Optional[np.ndarray] = None) -> np.ndarray:
+        if phase_angle is None:
+            phase_angle = self.phase_angle(bus_power)
+
+        angle_difference = self._incidence_matrix @ phase_angle
+        admittance = self._line_admittance * self._line_status
+        if angle_difference.ndim == 1:
+            return admittance * angle_difference
         else:
-            to_bus_set_flag = [True if line.to_bus in s else False for s in list_set_buses]
-            from_bus_set_flag = [True if line.from_bus in s else False for s in list_set_buses]
-
-            num_to_bus_set = sum(to_bus_set_flag)
-            num_from_bus_set = sum(from_bus_set_flag)
-
-            if num_to_bus_set == 0 and num_from_bus_set == 0:
-                list_set_buses.append([line.to_bus, line.from_bus])
-            elif num_to_bus_set == 1 and num_from_bus_set == 0:
-                bus_set_index = to_bus_set_flag.index(True)
-                list_set_buses[bus_set_index].extend([line.from_bus])
-            elif num_to_bus_set == 0 and num_from_bus_set == 1:
-                bus_set_index = from_bus_set_flag.index(True)
-                list_set_buses[bus_set_index].extend([line.to_bus])
-            elif num_to_bus_set == 1 and num_from_bus_set == 1:
-                to_bus_set_index = to_bus_set_flag.index(True)
-                from_bus_set_index = from_bus_set_flag.index(True)
-                if to_bus_set_index == from_bus_set_index:
-                    pass
-                else:
-                    from_bus_set = list_set_buses.pop(from_bus_set_index)
-                    list_set_buses[to_bus_set_index] = list_set_buses[to_bus_set_index] + from_bus_set
-
-        return list_set_buses
+            return admittance[:, np.newaxis] * angle_difference
+
+    def dc_power_flow_matrix(self) -> np.ndarray:
+        num_buses = len(self._buses)
+        dc_power_flow = np.zeros((num_buses, num_buses))
+        if num_buses > 0:
+            dc_power_flow[0, 0] = 1
+        if self._factor is not None:
+            dc_power_flow[1:, 1:] = self._solve_reduced(np.eye(num_buses - 1))
+        return dc_power_flow
+
+
+class SingularGridNetworkError(ValueError):
+    pass
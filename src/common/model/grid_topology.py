@@ -0,0 +1,161 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, FrozenSet
+
+from common.model.component import GridLine, BUS_ID
+
+LINE_KEY = Tuple[FrozenSet[BUS_ID], Optional[float]]
+
+
+class DisjointSet:
+    def __init__(self):
+        self._parent: Dict[Hashable, Hashable] = {}
+        self._size: Dict[Hashable, int] = {}
+        self._number_sets = 0
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._parent
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    @property
+    def number_sets(self) -> int:
+        return self._number_sets
+
+    def add(self, item: Hashable):
+        if item not in self._parent:
+            self._parent[item] = item
+            self._size[item] = 1
+            self._number_sets += 1
+
+    def find(self, item: Hashable) -> Hashable:
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, item_a: Hashable, item_b: Hashable) -> bool:
+        root_a = self.find(item_a)
+        root_b = self.find(item_b)
+        if root_a == root_b:
+            return False
+
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        self._number_sets -= 1
+        return True
+
+    def copy(self) -> "DisjointSet":
+        disjoint_set = DisjointSet()
+        disjoint_set._parent = dict(self._parent)
+        disjoint_set._size = dict(self._size)
+        disjoint_set._number_sets = self._number_sets
+        return disjoint_set
+
+    def connected(self, item_a: Hashable, item_b: Hashable) -> bool:
+        return self.find(item_a) == self.find(item_b)
+
+    def sets(self) -> List[List[Hashable]]:
+        sets: Dict[Hashable, List[Hashable]] = {}
+        for item in self._parent:
+            sets.setdefault(self.find(item), []).append(item)
+        return list(sets.values())
+
+
+class GridTopologyIndex:
+    def __init__(self, grid_lines: Iterable[GridLine] = (), buses: Optional[Iterable[BUS_ID]] = None):
+        self._buses: Dict[BUS_ID, None] = {}
+        self._lines: Dict[LINE_KEY, List[GridLine]] = {}
+        self._duplicate_lines: List[GridLine] = []
+        self._disjoint_set = DisjointSet()
+        self._outdated = False
+
+        for bus_id in buses or []:
+            self.add_bus(bus_id)
+        for line in grid_lines:
+            self.add_line(line)
+
+    @staticmethod
+    def line_key(line: GridLine) -> LINE_KEY:
+        return frozenset((line.from_bus, line.to_bus)), line.admittance
+
+    @property
+    def buses(self) -> List[BUS_ID]:
+        return list(self._buses)
+
+    @property
+    def number_lines(self) -> int:
+        return sum(len(lines) for lines in self._lines.values())
+
+    @property
+    def number_islands(self) -> int:
+        return self._get_disjoint_set().number_sets
+
+    def _get_disjoint_set(self) -> DisjointSet:
+        if self._outdated:
+            self._disjoint_set = DisjointSet()
+            for bus_id in self._buses:
+                self._disjoint_set.add(bus_id)
+            for lines in self._lines.values():
+                self._disjoint_set.union(lines[0].to_bus, lines[0].from_bus)
+            self._outdated = False
+        return self._disjoint_set
+
+    def add_bus(self, bus_id: BUS_ID):
+        if bus_id not in self._buses:
+            self._buses[bus_id] = None
+            self._disjoint_set.add(bus_id)
+
+    def add_line(self, line: GridLine) -> bool:
+        self.add_bus(line.to_bus)
+        self.add_bus(line.from_bus)
+
+        key = self.line_key(line)
+        if key in self._lines:
+            self._lines[key].append(line)
+            self._duplicate_lines.append(line)
+            return False
+
+        self._lines[key] = [line]
+        if not self._outdated:
+            self._disjoint_set.union(line.to_bus, line.from_bus)
+        return True
+
+    def remove_line(self, line: GridLine):
+        key = self.line_key(line)
+        if key not in self._lines:
+            raise KeyError(f"line {line.from_bus}-{line.to_bus} not in the grid topology")
+
+        lines = self._lines[key]
+        lines.pop()
+        if len(lines) > 0:
+            self._duplicate_lines.remove(line)
+        else:
+            del self._lines[key]
+            self._outdated = True
+
+    def copy(self) -> "GridTopologyIndex":
+        topology = GridTopologyIndex()
+        topology._buses = dict(self._buses)
+        topology._lines = {key: list(lines) for key, lines in self._lines.items()}
+        topology._duplicate_lines = list(self._duplicate_lines)
+        topology._disjoint_set = self._disjoint_set.copy()
+        topology._outdated = self._outdated
+        return topology
+
+    def has_line(self, line: GridLine) -> bool:
+        return self.line_key(line) in self._lines
+
+    def duplicate_lines(self) -> List[GridLine]:
+        return list(self._duplicate_lines)
+
+    def is_connected(self, bus_a: Optional[BUS_ID] = None, bus_b: Optional[BUS_ID] = None) -> bool:
+        disjoint_set = self._get_disjoint_set()
+        if bus_a is None and bus_b is None:
+            return len(disjoint_set) > 0 and disjoint_set.number_sets == 1
+        return bus_a in disjoint_set and bus_b in disjoint_set and disjoint_set.connected(bus_a, bus_b)
+
+    def islands(self) -> List[List[BUS_ID]]:
+        return self._get_disjoint_set().sets()
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import List, Union, Optional
+from typing import List, Union, Optional, Sequence
+
+import numpy as np
 
 Timestamp = Union[int, float]
 
@@ -13,18 +15,20 @@ class Timestamps:
 
     def __post_init__(self):
         try:
-            assert all(
-                [self.values[i + 1] - self.values[i] > 0 for i, t in enumerate(self.values) if i < len(self.values) - 1]
-            )
-            assert all([t >= 0 for t in self.values])
+            values = np.asarray(self.values)
+            assert np.all(np.diff(values) > 0)
+            assert np.all(values >= 0)
             self._iter = 0
+            self._index_map = None
         except AssertionError:
             raise AssertionError("Timestamp values can take only positive and increasing values")
 
     def get_timestamp_index(self, timestamp: Timestamp):
+        if self._index_map is None:
+            self._index_map = {t: i for i, t in enumerate(self.values)}
         try:
-            return self.values.index(timestamp)
-        except ValueError:
+            return self._index_map[timestamp]
+        except (KeyError, TypeError):
             raise UnknownTimestampError(f"timestamp {timestamp} is not part of the timestamps")
 
     def __next__(self):
@@ -44,22 +48,103 @@ class Timestamps:
     def slice(self, from_index: int, to_index: int, delta: int = 1):
         return Timestamps(self.values[from_index:to_index:delta])
 
+    def to_array(self) -> np.ndarray:
+        return np.asarray(self.values)
 
-@dataclass
+
+class UniformTimestamps(Timestamps):
+    def __init__(self, start: Timestamp, step: Timestamp, count: int):
+        try:
+            assert start >= 0 and step > 0 and count >= 0
+        except AssertionError:
+            raise AssertionError("Timestamp values can take only positive and increasing values")
+        self.start = start
+        self.step = step
+        self.count = count
+        self._iter = 0
+
+    @classmethod
+    def from_range(cls, since: Timestamp, until: Timestamp, step: Timestamp) -> "UniformTimestamps":
+        count = max(int(np.ceil((until - since) / step)), 0) if step > 0 else 0
+        return cls(since, step, count)
+
+    @property
+    def values(self) -> Sequence[Timestamp]:
+        if isinstance(self.start, int) and isinstance(self.step, int):
+            return range(self.start, self.start + self.step * self.count, self.step)
+        return self.to_array().tolist()
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"UniformTimestamps(start={self.start}, step={self.step}, count={self.count})"
+
+    def __eq__(self, other):
+        if isinstance(other, UniformTimestamps):
+            return (self.count == other.count == 0) or (
+                (self.start, self.step, self.count) == (other.start, other.step, other.count)
+            )
+        if isinstance(other, Timestamps):
+            return list(self.values) == list(other.values)
+        return NotImplemented
+
+    def _value(self, index: int) -> Timestamp:
+        if index < 0:
+            index = index + self.count
+        if not 0 <= index < self.count:
+            raise IndexError("timestamp index out of range")
+        return self.start + index * self.step
+
+    def get_timestamp_index(self, timestamp: Timestamp):
+        index = round((timestamp - self.start) / self.step) if self.count > 0 else -1
+        if 0 <= index < self.count and self.start + index * self.step == timestamp:
+            return index
+        raise UnknownTimestampError(f"timestamp {timestamp} is not part of the timestamps")
+
+    def __iter__(self):
+        return (self.start + index * self.step for index in range(self.count))
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.values[item]
+        return self._value(item)
+
+    def slice(self, from_index: int, to_index: int, delta: int = 1):
+        if delta <= 0:
+            return super().slice(from_index, to_index, delta)
+        indices = range(self.count)[from_index:to_index:delta]
+        start = self.start + indices.start * self.step if len(indices) > 0 else self.start
+        return UniformTimestamps(start, self.step * delta, len(indices))
+
+    def to_array(self) -> np.ndarray:
+        return self.start + self.step * np.arange(self.count)
+
+
+@dataclass(eq=False)
 class TimeseriesData:
     timestamps: Timestamps
-    values: List[Optional[float]]
+    values: np.ndarray
 
     def __post_init__(self):
+        self.values = np.asarray(self.values, dtype=float)
         try:
-            assert len(self.values) == len(self.timestamps.values)
+            assert self.values.ndim == 1 and len(self.values) == len(self.timestamps)
         except AssertionError:
             raise AssertionError("data and timestamps are not of the same size")
 
+    def __eq__(self, other):
+        if not isinstance(other, TimeseriesData):
+            return NotImplemented
+        return self.timestamps == other.timestamps and np.array_equal(self.values, other.values)
+
     def get_value(self, timestamp: Timestamp):
         index = self.timestamps.get_timestamp_index(timestamp)
         return self.values[index]
 
+    def to_array(self) -> np.ndarray:
+        return self.values
+
 
 @dataclass
 class ConstantTimeseriesData:
@@ -71,8 +156,13 @@ class ConstantTimeseriesData:
         return self.value
 
     @property
-    def values(self):
-        return [self.value for _ in self.timestamps]
+    def values(self) -> np.ndarray:
+        return self.to_array()
+
+    def to_array(self) -> np.ndarray:
+        value = np.nan if self.value is None else self.value
+        values = np.broadcast_to(np.asarray(value, dtype=float), (len(self.timestamps),))
+        return values
 
 
 @dataclass
@@ -95,14 +185,24 @@ class BoundTimeseries:
 
     def __post_init__(self):
         try:
-            assert len(self.min.timestamps.values) == len(self.max.timestamps.values)
-            assert all([t_1 == t_2 for t_1, t_2 in zip(self.min.timestamps.values, self.max.timestamps.values)])
-            assert all([self.min.get_value(t) <= self.max.get_value(t) for t in self.min.timestamps.values])
+            assert len(self.min.timestamps) == len(self.max.timestamps)
+            assert self.min.timestamps is self.max.timestamps or np.array_equal(
+                self.min.timestamps.to_array(), self.max.timestamps.to_array()
+            )
+            assert np.all(self.min_array <= self.max_array)
         except AssertionError:
             raise AssertionError(
                 "min value, max value have either unequal to timestamps " "or max value less than min value"
             )
 
+    @property
+    def min_array(self) -> np.ndarray:
+        return self.min.to_array()
+
+    @property
+    def max_array(self) -> np.ndarray:
+        return self.max.to_array()
+
     @classmethod
     def constant_bound_timeseries(cls, timestamps: Timestamps, min_value: float, max_value: float) -> "BoundTimeseries":
         return cls(
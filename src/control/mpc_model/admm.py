@@ -0,0 +1,292 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cvxpy as cp
+import numpy as np
+from scipy import sparse
+
+from common.model.component import BUS_ID
+from common.model.grid_network_util import GridNetworkUtils
+from control.mpc_model.builder import CONTROL_COMPONENT_CLASSES, ControlData
+from control.mpc_model.control_data_model import ControlGridNetworkData, ControlLoadDemandData
+from control.optimisation_engine.cvx_engine.cvx_engine import CvxEngine, OptimisationEngineStatus
+from control.optimisation_engine.interface import IOptimisationEngine
+
+BALANCE_NET = "balance"
+
+
+@dataclass
+class ADMMSubproblemData:
+    name: str
+    control_data: ControlData
+    nets: List[int]
+    power_cost: float = 0
+
+
+@dataclass
+class ADMMStatistics:
+    iterations: int = 0
+    converged: bool = False
+    primal_residuals: List[float] = field(default_factory=list)
+    dual_residuals: List[float] = field(default_factory=list)
+    subproblem_solve_time: float = 0
+    solve_time: float = 0
+
+
+class ADMMSubproblem:
+    def __init__(
+        self, data: ADMMSubproblemData, rho: float, engine_factory: Callable[[], IOptimisationEngine] = CvxEngine
+    ):
+        self._data = data
+        self._component = CONTROL_COMPONENT_CLASSES[type(data.control_data)](data.control_data)
+        self._engine = engine_factory()
+        self._component.extend_optimisation_model(self._engine)
+
+        shape = (len(data.nets), len(data.control_data.timestamps))
+        identity = sparse.identity(shape[0], format="csr")
+        if isinstance(data.control_data, ControlGridNetworkData):
+            terminal_power = [bus.optimisation_value for bus in self._component.bus_power]
+            terminal_sign = -1
+            self._extend_line_flow()
+        else:
+            terminal_power = [self._component.power.optimisation_value]
+            terminal_sign = 1
+
+        self._terminal = self._engine.add_matrix_variable(
+            f"{data.name}_admm_terminal", np.full(shape, -np.inf), np.full(shape, np.inf), np.zeros(shape)
+        )
+        self._engine.add_linear_matrix_constraint(
+            f"{data.name}_admm_terminal", [(identity, [self._terminal]), (-terminal_sign * identity, terminal_power)]
+        )
+        self._target = self._engine.add_matrix_parameter(f"{data.name}_admm_target", np.zeros(shape))
+
+        power_cost = terminal_sign * data.power_cost
+        self._engine.update_objective(
+            self._terminal,
+            lambda value, target: power_cost * cp.sum(value) + rho / 2 * cp.sum_squares(value - target),
+            self._target.value,
+        )
+        self._engine.generate_optimisation_model()
+
+    def _extend_line_flow(self):
+        grid = self._component
+        if len(grid.lines) == 0:
+            return
+        line_incidence = GridNetworkUtils.calculate_incidence_matrix(list(grid.buses), grid.lines).T
+        self._engine.add_linear_matrix_constraint(
+            f"{self._data.name}_admm_line_flow",
+            [
+                (sparse.identity(len(grid.buses), format="csr"), [bus.optimisation_value for bus in grid.bus_power]),
+                (-line_incidence, [line.optimisation_value for line in grid.line_power]),
+            ],
+        )
+
+    @property
+    def name(self) -> str:
+        return self._data.name
+
+    def solve(self, target: np.ndarray) -> np.ndarray:
+        self._target.update_value(target)
+        self._engine.resolve()
+        if self._engine.status != OptimisationEngineStatus.Optimal:
+            raise ADMMSubproblemError(f"ADMM subproblem {self.name} has no optimal solution")
+        return np.asarray(self._terminal.evaluate(), dtype=float)
+
+
+def _solve_subproblems(subproblems: List[ADMMSubproblem], targets: List[np.ndarray]) -> Tuple[List[np.ndarray], float]:
+    start = time.perf_counter()
+    return [subproblem.solve(target) for subproblem, target in zip(subproblems, targets)], time.perf_counter() - start
+
+
+_worker_subproblems: List[ADMMSubproblem] = []
+
+
+def _initialise_worker(subproblem_data: List[ADMMSubproblemData], rho: float, engine_factory):
+    global _worker_subproblems
+    _worker_subproblems = [ADMMSubproblem(data, rho, engine_factory) for data in subproblem_data]
+
+
+def _solve_worker_subproblems(targets: List[np.ndarray]) -> Tuple[List[np.ndarray], float]:
+    return _solve_subproblems(_worker_subproblems, targets)
+
+
+class ADMMSolver:
+    def __init__(
+        self,
+        control_data: List[ControlData],
+        power_costs: Optional[Dict[str, float]] = None,
+        bus_ids: Optional[Dict[str, BUS_ID]] = None,
+        rho: float = 1.0,
+        tolerance: float = 1e-3,
+        max_iterations: int = 200,
+        max_workers: int = 1,
+        engine_factory: Callable[[], IOptimisationEngine] = CvxEngine,
+    ):
+        self._rho = rho
+        self._tolerance = tolerance
+        self._max_iterations = max_iterations
+        self._max_workers = max_workers
+        self._engine_factory = engine_factory
+        self._statistics = ADMMStatistics()
+        self._power: Dict[str, np.ndarray] = {}
+        self._subproblems: Optional[List[ADMMSubproblem]] = None
+        self._executors: Optional[List[ProcessPoolExecutor]] = None
+
+        power_costs = power_costs or {}
+        grids = [data for data in control_data if isinstance(data, ControlGridNetworkData)]
+        if len(grids) > 1:
+            raise ValueError("ADMM decomposition supports a single grid network")
+        if len(grids) == 1:
+            self._nets: List = list(grids[0].buses)
+            bus_ids = bus_ids or {}
+        else:
+            self._nets = [BALANCE_NET]
+        net_index = {net: i for i, net in enumerate(self._nets)}
+
+        self._subproblem_data: List[ADMMSubproblemData] = []
+        fixed_power, fixed_nets = [], []
+        for data in control_data:
+            if isinstance(data, ControlGridNetworkData):
+                nets = list(range(len(self._nets)))
+            elif len(grids) == 0:
+                nets = [0]
+            else:
+                try:
+                    nets = [net_index[bus_ids[data.name]]]
+                except KeyError as e:
+                    raise ValueError(f"unit {data.name} is not connected to a bus {e} of the grid network")
+
+            if isinstance(data, ControlLoadDemandData):
+                fixed_power.append(-data.power_forecast.to_array())
+                fixed_nets.extend(nets)
+            else:
+                self._subproblem_data.append(ADMMSubproblemData(data.name, data, nets, power_costs.get(data.name, 0)))
+
+        self._fixed_names = [data.name for data in control_data if isinstance(data, ControlLoadDemandData)]
+        self._number_timestamps = len(control_data[0].timestamps) if len(control_data) > 0 else 0
+        self._fixed_power = np.array(fixed_power, dtype=float).reshape(len(fixed_nets), self._number_timestamps)
+        self._fixed_nets = np.array(fixed_nets, dtype=int)
+        self._terminal_nets = np.concatenate(
+            [np.array(data.nets, dtype=int) for data in self._subproblem_data] + [self._fixed_nets]
+        )
+        self._net_size = np.bincount(self._terminal_nets, minlength=len(self._nets))
+        self._groups = self._worker_groups()
+
+    @property
+    def statistics(self) -> ADMMStatistics:
+        return self._statistics
+
+    @property
+    def power(self) -> Dict[str, np.ndarray]:
+        return self._power
+
+    @property
+    def nets(self) -> List:
+        return self._nets
+
+    def _net_average(self, terminal_power: np.ndarray) -> np.ndarray:
+        net_power = np.zeros((len(self._nets), self._number_timestamps))
+        np.add.at(net_power, self._terminal_nets, terminal_power)
+        return net_power / np.maximum(self._net_size, 1)[:, np.newaxis]
+
+    def _worker_groups(self) -> List[List[int]]:
+        number_workers = max(min(self._max_workers, len(self._subproblem_data)), 1)
+        return [list(range(len(self._subproblem_data)))[i::number_workers] for i in range(number_workers)]
+
+    def _solve_serial(self, group_targets: List[List[np.ndarray]]) -> List[Tuple[List[np.ndarray], float]]:
+        if self._subproblems is None:
+            self._subproblems = [
+                ADMMSubproblem(data, self._rho, self._engine_factory) for data in self._subproblem_data
+            ]
+        return [_solve_subproblems(self._subproblems, group_targets[0])]
+
+    def _solve_parallel(self, group_targets: List[List[np.ndarray]]) -> List[Tuple[List[np.ndarray], float]]:
+        if self._executors is None:
+            self._executors = [
+                ProcessPoolExecutor(
+                    max_workers=1,
+                    initializer=_initialise_worker,
+                    initargs=([self._subproblem_data[i] for i in group], self._rho, self._engine_factory),
+                )
+                for group in self._groups
+            ]
+        futures = [
+            executor.submit(_solve_worker_subproblems, targets)
+            for executor, targets in zip(self._executors, group_targets)
+        ]
+        return [future.result() for future in futures]
+
+    def _solve_groups(self, targets: List[np.ndarray]) -> List[np.ndarray]:
+        group_targets = [[targets[i] for i in group] for group in self._groups]
+        if len(self._groups) <= 1:
+            results = self._solve_serial(group_targets)
+        else:
+            results = self._solve_parallel(group_targets)
+        self._statistics.subproblem_solve_time += max([solve_time for _, solve_time in results], default=0)
+        power: List[np.ndarray] = [np.empty(0)] * len(targets)
+        for group, (group_power, _) in zip(self._groups, results):
+            for i, subproblem_power in zip(group, group_power):
+                power[i] = subproblem_power
+        return power
+
+    def _split(self, terminal_power: np.ndarray) -> List[np.ndarray]:
+        sections = np.cumsum([len(data.nets) for data in self._subproblem_data])[:-1]
+        return np.split(terminal_power[: len(self._terminal_nets) - len(self._fixed_nets)], sections)
+
+    def _iterate(self, solve_subproblems: Callable[[List[np.ndarray]], List[np.ndarray]]) -> np.ndarray:
+        terminal_power = np.concatenate(
+            [np.zeros((len(self._terminal_nets) - len(self._fixed_nets), self._number_timestamps)), self._fixed_power]
+        )
+        average_power = self._net_average(terminal_power)
+        scaled_price = np.zeros_like(average_power)
+
+        for iteration in range(1, self._max_iterations + 1):
+            deviation = terminal_power - average_power[self._terminal_nets]
+            targets = self._split(terminal_power - (average_power + scaled_price)[self._terminal_nets])
+            terminal_power = np.concatenate(solve_subproblems(targets) + [self._fixed_power])
+
+            average_power = self._net_average(terminal_power)
+            scaled_price += average_power
+
+            primal_residual = float(np.linalg.norm(average_power * self._net_size[:, np.newaxis]))
+            dual_residual = float(
+                self._rho * np.linalg.norm(terminal_power - average_power[self._terminal_nets] - deviation)
+            )
+            self._statistics.iterations = iteration
+            self._statistics.primal_residuals.append(primal_residual)
+            self._statistics.dual_residuals.append(dual_residual)
+            if primal_residual <= self._tolerance and dual_residual <= self._tolerance:
+                self._statistics.converged = True
+                break
+        return terminal_power
+
+    def solve(self) -> ADMMStatistics:
+        start = time.perf_counter()
+        self._statistics = ADMMStatistics()
+        terminal_power = self._iterate(self._solve_groups)
+
+        self._power = {
+            data.name: power[0] for data, power in zip(self._subproblem_data, self._split(terminal_power))
+            if not isinstance(data.control_data, ControlGridNetworkData)
+        }
+        self._power.update({name: -power for name, power in zip(self._fixed_names, self._fixed_power)})
+        self._statistics.solve_time = time.perf_counter() - start
+        return self._statistics
+
+    def close(self):
+        if self._executors is not None:
+            for executor in self._executors:
+                executor.shutdown()
+            self._executors = None
+
+    def __enter__(self) -> "ADMMSolver":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ADMMSubproblemError(Exception):
+    pass
@@ -0,0 +1,189 @@
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from common.model.component import BUS_ID, ComponentType, ControlComponentData, GridControlComponentData
+from common.timeseries.domain import Bounds, Timestamps, TimeseriesModel
+from control.mpc_model.component.grid_model import ControlGridNetwork
+from control.mpc_model.component.load_demand import LoadDemand
+from control.mpc_model.component.renewable_unit import RenewablePowerUnit
+from control.mpc_model.component.storage_unit import ControlStoragePowerPlant
+from control.mpc_model.component.thermal_unit import ControlThermalGenerator
+from control.mpc_model.control_data_model import (
+    ControlGridNetworkData,
+    ControlLoadDemandData,
+    ControlRenewableUnitData,
+    ControlStoragePowerPlantData,
+    ControlThermalGeneratorData,
+)
+from control.mpc_model.domain import Horizon, IControlComponent
+
+ControlData = Union[
+    ControlGridNetworkData,
+    ControlLoadDemandData,
+    ControlRenewableUnitData,
+    ControlStoragePowerPlantData,
+    ControlThermalGeneratorData,
+]
+
+CONTROL_COMPONENT_CLASSES = {
+    ControlGridNetworkData: ControlGridNetwork,
+    ControlLoadDemandData: LoadDemand,
+    ControlRenewableUnitData: RenewablePowerUnit,
+    ControlStoragePowerPlantData: ControlStoragePowerPlant,
+    ControlThermalGeneratorData: ControlThermalGenerator,
+}
+
+UPDATABLE_FIELDS = {
+    ControlGridNetworkData: set(),
+    ControlLoadDemandData: {"power_forecast"},
+    ControlRenewableUnitData: {"power_forecast"},
+    ControlStoragePowerPlantData: {"current_energy"},
+    ControlThermalGeneratorData: {"current_switch_state", "current_state_duration"},
+}
+
+UNBOUNDED_POWER = Bounds(-float("inf"), float("inf"))
+
+
+@dataclass
+class MPCModelBuildStatistics:
+    built: int = 0
+    updated: int = 0
+    removed: int = 0
+
+
+def same_timestamp_steps(timestamps: Timestamps, other: Timestamps) -> bool:
+    return len(timestamps) == len(other) and np.array_equal(
+        np.diff(timestamps.to_array()), np.diff(other.to_array())
+    )
+
+
+def same_structure(data: ControlData, other: ControlData) -> bool:
+    if type(data) is not type(other) or not same_timestamp_steps(data.timestamps, other.timestamps):
+        return False
+    updatable_fields = UPDATABLE_FIELDS[type(data)]
+    if isinstance(data, ControlGridNetworkData) and [line.bounds for line in data.lines] != [
+        line.bounds for line in other.lines
+    ]:
+        return False
+    return all(
+        getattr(data, f.name) == getattr(other, f.name)
+        for f in fields(data)
+        if f.name not in updatable_fields and f.name != "timestamps"
+    )
+
+
+class MPCModelBuilder:
+    def __init__(self, horizon: Horizon):
+        self._horizon = horizon
+        self._components: Dict[str, Tuple[ControlData, IControlComponent]] = {}
+        self._statistics = MPCModelBuildStatistics()
+
+    @property
+    def horizon(self) -> Horizon:
+        return self._horizon
+
+    @property
+    def statistics(self) -> MPCModelBuildStatistics:
+        return self._statistics
+
+    def advance(self, horizon: Horizon):
+        self._horizon = horizon
+
+    def _forecast(self, name: str, forecasts: Dict[str, TimeseriesModel]) -> TimeseriesModel:
+        try:
+            return forecasts[name]
+        except KeyError:
+            raise MissingForecastError(f"unit {name} needs a power forecast to build its control model")
+
+    def _measurement(self, data: ControlComponentData, measurement: str):
+        try:
+            return data.measurements[measurement]
+        except (KeyError, TypeError):
+            raise MissingMeasurementError(f"unit {data.name} needs a {measurement} measurement")
+
+    def control_data(self, data: ControlComponentData, forecasts: Dict[str, TimeseriesModel]) -> ControlData:
+        timestamps = self._horizon.timestamps
+        if data.component_type == ComponentType.Storage:
+            return ControlStoragePowerPlantData(
+                data.name,
+                timestamps,
+                data.power_bound,
+                data.energy_bound,
+                current_energy=self._measurement(data, "energy"),
+            )
+        if data.component_type == ComponentType.Thermal:
+            return ControlThermalGeneratorData(
+                data.name,
+                timestamps,
+                data.power_bound,
+                current_switch_state=self._measurement(data, "switch_state"),
+            )
+        if data.component_type in (ComponentType.Renewable, ComponentType.PV, ComponentType.WIND):
+            return ControlRenewableUnitData(
+                data.name, timestamps, self._forecast(data.name, forecasts), data.power_bound
+            )
+        if data.component_type == ComponentType.Load:
+            power_bound = UNBOUNDED_POWER if data.power_bound is None else data.power_bound
+            return ControlLoadDemandData(data.name, timestamps, self._forecast(data.name, forecasts), power_bound)
+        raise UnknownControlComponentError(f"unit {data.name} of type {data.component_type} has no control model")
+
+    def grid_control_data(
+        self, data: GridControlComponentData, buses: Optional[List[BUS_ID]] = None
+    ) -> ControlGridNetworkData:
+        if buses is None:
+            buses = list(dict.fromkeys(bus for line in data.grid_lines for bus in (line.from_bus, line.to_bus)))
+        return ControlGridNetworkData(data.name, self._horizon.timestamps, list(data.grid_lines), list(buses))
+
+    def _component(self, data: ControlData) -> IControlComponent:
+        cached = self._components.get(data.name)
+        if cached is not None and same_structure(cached[0], data):
+            component = cached[1]
+            component.update(data)
+            self._statistics.updated += 1
+        else:
+            component = CONTROL_COMPONENT_CLASSES[type(data)](data)
+            self._statistics.built += 1
+        self._components[data.name] = (data, component)
+        return component
+
+    def build(
+        self,
+        component_data: List[ControlComponentData],
+        forecasts: Dict[str, TimeseriesModel],
+        grid_data: Optional[GridControlComponentData] = None,
+        buses: Optional[List[BUS_ID]] = None,
+    ) -> List[IControlComponent]:
+        control_data = [self.control_data(data, forecasts) for data in component_data]
+        if grid_data is not None:
+            control_data.append(self.grid_control_data(grid_data, buses))
+
+        components = [self._component(data) for data in control_data]
+
+        names = {data.name for data in control_data}
+        for name in [name for name in self._components if name not in names]:
+            del self._components[name]
+            self._statistics.removed += 1
+        return components
+
+    def build_from_microgrid(self, microgrid_model, forecasts: Dict[str, TimeseriesModel]) -> List[IControlComponent]:
+        grid_model = microgrid_model.grid_model
+        grid_data = None if grid_model is None else grid_model.control_component_data
+        buses = None if grid_model is None else grid_model.buses
+        return self.build(microgrid_model.control_component_data(), forecasts, grid_data, buses)
+
+    def clear(self):
+        self._components = {}
+
+
+class MissingForecastError(Exception):
+    pass
+
+
+class MissingMeasurementError(Exception):
+    pass
+
+
+class UnknownControlComponentError(Exception):
+    pass
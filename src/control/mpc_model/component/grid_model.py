@@ -1,5 +1,6 @@
 from typing import List
 
+from common.model.component import BUS_ID, GridLine
 from common.model.grid_network_util import GridNetworkUtils
 from common.timeseries.domain import Bounds, ConstantTimeseriesData, BoundTimeseries
 from control.mpc_model.control_data_model import ControlGridNetworkData
@@ -26,6 +27,14 @@ class ControlGridNetwork(IControlComponent):
     def line_power(self) -> List[TimeIndexVariable]:
         return self._line_power
 
+    @property
+    def lines(self) -> List[GridLine]:
+        return self._data.lines
+
+    @property
+    def buses(self) -> List[BUS_ID]:
+        return self._data.buses
+
     @property
     def bus_power(self):
         return self._bus_power
@@ -97,6 +106,13 @@ class ControlGridNetwork(IControlComponent):
             )
             self._pf_constraint.append(pf_constraint_line)
 
+    def update(self, data: ControlGridNetworkData):
+        self._data = data
+        for power in self._line_power + self._bus_power:
+            power.rekey(self.timestamps)
+        for constraint in self._pf_constraint:
+            constraint.rekey(self.timestamps)
+
     def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
         for line in self._line_power:
             line.optimisation_value = optimisation_engine.add_timeindex_variable(
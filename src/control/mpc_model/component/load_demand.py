@@ -25,6 +25,10 @@ class LoadDemand(IControlComponent):
     def _generate_variables(self):
         self._power = TimeIndexParameter(f"{self.name}_power", parameter_value=self._data.power_forecast)
 
+    def update(self, data: ControlLoadDemandData):
+        self._data = data
+        self._power.update_parameter_value(data.power_forecast, rekey=True)
+
     def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
         self._power.optimisation_value = optimisation_engine.add_timeindex_parameter(
             self._power.name, self.power.parameter_value
@@ -0,0 +1,107 @@
+from typing import List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from common.model.component import BUS_ID
+from common.model.grid_network_util import GridNetworkUtils
+from control.mpc_model.component.grid_model import ControlGridNetwork
+from control.mpc_model.domain import IControlComponent
+from control.optimisation_engine.domain import IOptimisationVariable
+from control.optimisation_engine.interface import IOptimisationEngine
+
+
+def unit_bus_matrix(bus_ids: List[BUS_ID], unit_bus_ids: List[BUS_ID]) -> sparse.csr_matrix:
+    bus_index = {bus: i for i, bus in enumerate(bus_ids)}
+    try:
+        columns = [bus_index[bus] for bus in unit_bus_ids]
+    except KeyError as e:
+        raise UnknownBusError(f"bus {e} of a unit is not part of the grid network")
+    rows = np.arange(len(unit_bus_ids))
+    return sparse.csr_matrix((np.ones(len(unit_bus_ids)), (rows, columns)), shape=(len(unit_bus_ids), len(bus_ids)))
+
+
+class NodalPowerBalance(IControlComponent):
+    def __init__(
+        self,
+        name: str,
+        grid: ControlGridNetwork,
+        generators: List[IControlComponent],
+        loads: List[IControlComponent],
+        unit_bus_mat,
+        bus_ids: Optional[List[BUS_ID]] = None,
+    ):
+        self._name = name
+        self._grid = grid
+        self._generators = generators
+        self._loads = loads
+        self._constraint: Optional[IOptimisationVariable] = None
+
+        grid_buses = list(grid.buses)
+        unit_bus_mat = sparse.csr_matrix(unit_bus_mat)
+        if bus_ids is not None:
+            bus_index = {bus: i for i, bus in enumerate(bus_ids)}
+            try:
+                unit_bus_mat = unit_bus_mat[:, [bus_index[bus] for bus in grid_buses]]
+            except KeyError as e:
+                raise UnknownBusError(f"bus {e} of the grid network is not part of the unit bus matrix")
+        if unit_bus_mat.shape != (len(generators) + len(loads), len(grid_buses)):
+            raise ValueError(
+                f"unit bus matrix of shape {unit_bus_mat.shape} does not match {len(generators)} generators, "
+                f"{len(loads)} loads and {len(grid_buses)} buses"
+            )
+
+        number_buses = len(grid_buses)
+        bus_identity = sparse.identity(number_buses, format="csr")
+        line_incidence = GridNetworkUtils.calculate_incidence_matrix(grid_buses, grid.lines).T
+        self._generator_bus_matrix = sparse.vstack(
+            [unit_bus_mat[: len(generators)].T, sparse.csr_matrix((number_buses, len(generators)))], format="csr"
+        )
+        self._load_bus_matrix = sparse.vstack(
+            [-unit_bus_mat[len(generators):].T, sparse.csr_matrix((number_buses, len(loads)))], format="csr"
+        )
+        self._bus_matrix = sparse.vstack([-bus_identity, bus_identity], format="csr")
+        self._line_matrix = sparse.vstack(
+            [sparse.csr_matrix((number_buses, len(grid.lines))), -line_incidence], format="csr"
+        )
+
+    @classmethod
+    def from_bus_ids(
+        cls,
+        name: str,
+        grid: ControlGridNetwork,
+        generators: List[IControlComponent],
+        loads: List[IControlComponent],
+        generator_bus_ids: List[BUS_ID],
+        load_bus_ids: List[BUS_ID],
+    ) -> "NodalPowerBalance":
+        return cls(name, grid, generators, loads, unit_bus_matrix(list(grid.buses), generator_bus_ids + load_bus_ids))
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def timestamps(self):
+        return self._grid.timestamps
+
+    @property
+    def constraint(self) -> IOptimisationVariable:
+        if self._constraint is None:
+            raise NotImplementedError(f"constraint {self._name} is not created")
+        return self._constraint
+
+    def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
+        terms = [(self._bus_matrix, [bus.optimisation_value for bus in self._grid.bus_power])]
+        if len(self._grid.line_power) > 0:
+            terms.append((self._line_matrix, [line.optimisation_value for line in self._grid.line_power]))
+        if len(self._generators) > 0:
+            terms.append((self._generator_bus_matrix, [g.power.optimisation_value for g in self._generators]))
+        if len(self._loads) > 0:
+            terms.append((self._load_bus_matrix, [load.power.optimisation_value for load in self._loads]))
+
+        self._constraint = optimisation_engine.add_linear_matrix_constraint(f"{self.name}_nodal_balance", terms)
+
+
+class UnknownBusError(Exception):
+    pass
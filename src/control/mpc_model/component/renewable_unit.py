@@ -1,8 +1,8 @@
-from common.timeseries.domain import BoundTimeseries, ConstantTimeseriesData
+from common.timeseries.domain import BoundTimeseries, ConstantTimeseriesData, TimeseriesData
 from control.mpc_model.control_data_model import ControlRenewableUnitData
 from control.mpc_model.domain import IControlComponent
 from control.optimisation_engine.interface import IOptimisationEngine
-from control.optimisation_engine.variable import TimeIndexVariable, TimeIndexConstraint
+from control.optimisation_engine.variable import TimeIndexVariable, TimeIndexConstraint, TimeIndexParameter
 
 
 class RenewablePowerUnit(IControlComponent):
@@ -38,17 +38,28 @@ class RenewablePowerUnit(IControlComponent):
             bounds=power_bounds,
             initial_value=ConstantTimeseriesData(self.timestamps, 0),
         )
+        self._available_power = TimeIndexParameter(f"{self.name}_available_power", self._available_power_value())
+
+    def _available_power_value(self) -> TimeseriesData:
+        return TimeseriesData(self.timestamps, [self.power_forecast.get_value(t) for t in self.timestamps])
 
     def _generate_constraint(self):
-        constraint = [
-            self._power.get_value_index(i) <= self.power_forecast.get_value(t) for i, t in enumerate(self.timestamps)
-        ]
+        constraint = [self._power.get_value_index(i) <= self._available_power[i] for i, _ in enumerate(self.timestamps)]
         self._power_constraint = TimeIndexConstraint(f"{self.name}_available_power_limit", self.timestamps, constraint)
 
+    def update(self, data: ControlRenewableUnitData):
+        self._data = data
+        self._power.rekey(self.timestamps)
+        self._available_power.update_parameter_value(self._available_power_value(), rekey=True)
+        self._generate_constraint()
+
     def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
         self._power.optimisation_value = optimisation_engine.add_timeindex_variable(
             self._power.name, self._power.bounds, self._power.initial_value
         )
+        self._available_power.optimisation_value = optimisation_engine.add_timeindex_parameter(
+            self._available_power.name, self._available_power.parameter_value
+        )
 
         self._power_constraint.optimisation_value = optimisation_engine.add_index_constraint(
             self._power_constraint.name,
@@ -12,6 +12,7 @@ from control.optimisation_engine.interface import IOptimisationEngine
 from control.optimisation_engine.variable import (
     TimeIndexVariable,
     TimeIndexConstraint,
+    TimeIndexParameter,
     Constraint,
 )
 
@@ -80,10 +81,25 @@ class ControlStoragePowerPlant(IControlComponent):
             self.timestamps.slice(0, len(self.timestamps) - 1),
             constraint,
         )
+        self._generate_initial_energy_constraint()
+
+    def _current_energy_value(self) -> ConstantTimeseriesData:
+        return ConstantTimeseriesData(self.timestamps.slice(0, 1), self._data.current_energy)
+
+    def _generate_initial_energy_constraint(self):
+        self._current_energy = TimeIndexParameter(f"{self.name}_current_energy", self._current_energy_value())
         self._initial_energy_constraint = Constraint(
-            f"{self.name}_initial_energy", self._energy[0] == self._data.current_energy
+            f"{self.name}_initial_energy", self._energy[0] == self._current_energy[0]
         )
 
+    def update(self, data: ControlStoragePowerPlantData):
+        self._data = data
+        self._power.rekey(self.timestamps)
+        self._energy.rekey(self.timestamps)
+        self._dynamics_constraint.rekey(self.timestamps.slice(0, len(self.timestamps) - 1))
+        self._current_energy.update_parameter_value(self._current_energy_value(), rekey=True)
+        self._generate_initial_energy_constraint()
+
     def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
         self._power.optimisation_value = optimisation_engine.add_timeindex_variable(
             self._power.name, self._power.bounds, self._power.initial_value
@@ -98,6 +114,9 @@ class ControlStoragePowerPlant(IControlComponent):
             [v.constraint_expression for v in self._dynamics_constraint.value],
         )
 
+        self._current_energy.optimisation_value = optimisation_engine.add_timeindex_parameter(
+            self._current_energy.name, self._current_energy.parameter_value
+        )
         self._initial_energy_constraint.value = optimisation_engine.add_constraint(
             f"{self.name}_initial_energy",
             self._initial_energy_constraint.constraint_expression,
@@ -1,9 +1,30 @@
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
 from common.model.component import ComponentType
-from common.timeseries.domain import BoundTimeseries, ConstantTimeseriesData
+from common.timeseries.domain import BoundTimeseries, ConstantTimeseriesData, TimeseriesData
 from control.mpc_model.control_data_model import ControlThermalGeneratorData
 from control.mpc_model.domain import IControlComponent
+from control.optimisation_engine.domain import IOptimisationVariable
 from control.optimisation_engine.interface import IOptimisationEngine
-from control.optimisation_engine.variable import TimeIndexVariable, TimeIndexConstraint
+from control.optimisation_engine.variable import TimeIndexParameter, TimeIndexVariable
+
+
+def transition_matrix(number_timestamps: int) -> sparse.csr_matrix:
+    return sparse.diags(
+        [np.ones(number_timestamps), -np.ones(number_timestamps - 1)], [0, 1], shape=(number_timestamps,) * 2
+    ).tocsr()
+
+
+def next_step_matrix(number_timestamps: int) -> sparse.csr_matrix:
+    return sparse.diags([np.ones(number_timestamps - 1)], [-1], shape=(number_timestamps,) * 2).tocsr()
+
+
+def time_window_matrix(timestamps: np.ndarray, duration: float) -> sparse.csr_matrix:
+    elapsed = timestamps[np.newaxis, :] - timestamps[:, np.newaxis]
+    return sparse.csr_matrix(((elapsed >= 0) & (elapsed < duration)).astype(float))
 
 
 class ControlThermalGenerator(IControlComponent):
@@ -30,98 +51,176 @@ class ControlThermalGenerator(IControlComponent):
     def switch_state(self) -> TimeIndexVariable:
         return self._switch_state
 
+    @property
+    def startup(self) -> Optional[TimeIndexVariable]:
+        return self._startup
+
+    @property
+    def shutdown(self) -> Optional[TimeIndexVariable]:
+        return self._shutdown
+
     @property
     def component_type(self):
         return self._component_type
 
-    def _generate_variables(self):
-        self._power_lb = TimeIndexVariable(
-            f"{self.name}_power_lb",
-            bounds=BoundTimeseries.constant_bound_timeseries(self.timestamps, 0, self._data.power_bounds.min),
-            initial_value=ConstantTimeseriesData(self.timestamps, 0),
-        )
-        self._power_ub = TimeIndexVariable(
-            f"{self.name}_power_ub",
-            bounds=BoundTimeseries.constant_bound_timeseries(self.timestamps, 0, self._data.power_bounds.max),
+    def _binary_variable(self, name: str) -> TimeIndexVariable:
+        return TimeIndexVariable(
+            f"{self.name}_{name}",
+            bounds=BoundTimeseries.constant_bound_timeseries(self.timestamps, 0, 1),
             initial_value=ConstantTimeseriesData(self.timestamps, 0),
         )
 
+    def _generate_variables(self):
         self._power = TimeIndexVariable(
             f"{self.name}_power",
             bounds=BoundTimeseries.constant_bound_timeseries(self.timestamps, 0, self._data.power_bounds.max),
             initial_value=ConstantTimeseriesData(self.timestamps, 0),
         )
-
-        self._switch_state = TimeIndexVariable(
-            f"{self.name}_switch_state",
-            bounds=BoundTimeseries.constant_bound_timeseries(self.timestamps, 0, 1),
-            initial_value=ConstantTimeseriesData(self.timestamps, 0),
-        )
+        self._switch_state = self._binary_variable("switch_state")
+        self._startup: Optional[TimeIndexVariable] = None
+        self._shutdown: Optional[TimeIndexVariable] = None
+        if self._data.has_commitment_transitions:
+            self._startup = self._binary_variable("startup")
+            self._shutdown = self._binary_variable("shutdown")
 
     def _generate_constraint(self):
-        self._lb_constraint = TimeIndexConstraint(
-            f"{self.name}_lb_constraint",
-            self.timestamps,
-            constraint_expression=[
-                self._power_lb.get_value_timestamp(t) ==
-                self._switch_state.get_value_timestamp(t) * self._data.power_bounds.min
-                for t in self.timestamps
-            ],
-        )
-        self._ub_constraint = TimeIndexConstraint(
-            f"{self.name}_ub_constraint",
-            self.timestamps,
-            constraint_expression=[
-                self._power_ub.get_value_timestamp(t) ==
-                self._switch_state.get_value_timestamp(t) * self._data.power_bounds.max
-                for t in self.timestamps
-            ],
-        )
-        self._power_lb_constraint = TimeIndexConstraint(
-            f"{self.name}_ub_constraint",
-            self.timestamps,
-            constraint_expression=[
-                self._power.get_value_timestamp(t) >= self._power_lb.get_value_timestamp(t) for t in self.timestamps
-            ],
-        )
-        self._power_ub_constraint = TimeIndexConstraint(
-            f"{self.name}_ub_constraint",
-            self.timestamps,
-            constraint_expression=[
-                self._power.get_value_timestamp(t) <= self._power_ub.get_value_timestamp(t) for t in self.timestamps
-            ],
+        timestamps = self.timestamps.to_array().astype(float)
+        number_timestamps = len(timestamps)
+        self._transition_matrix = transition_matrix(number_timestamps)
+        self._next_step_matrix = next_step_matrix(number_timestamps)
+        self._min_up_matrix = time_window_matrix(timestamps, self._data.min_up_time)
+        self._min_down_matrix = time_window_matrix(timestamps, self._data.min_down_time)
+        self._elapsed_time = timestamps - timestamps[0]
+        self._constraints: dict = {}
+        self._has_initial_state = self._data.min_up_time > 0 or self._data.min_down_time > 0
+        self._initial_state_parameters = {
+            name: TimeIndexParameter(f"{self.name}_{name}", value)
+            for name, value in self._initial_state_values().items()
+        }
+
+    def _initial_state_mask(self) -> np.ndarray:
+        if self._data.current_state_duration is None:
+            return np.zeros(len(self._elapsed_time), dtype=bool)
+        min_time = self._data.min_up_time if self._data.current_switch_state else self._data.min_down_time
+        return self._elapsed_time < min_time - self._data.current_state_duration
+
+    def _initial_state_values(self) -> dict:
+        values = {}
+        switched_on = float(self._data.current_switch_state)
+        if self._has_initial_state:
+            mask = self._initial_state_mask().astype(float)
+            values["switch_state_min"] = switched_on * mask
+            values["switch_state_max"] = 1 - (1 - switched_on) * mask
+        if self._data.has_commitment_transitions:
+            initial_switch_state = np.zeros(len(self._elapsed_time))
+            initial_switch_state[0] = switched_on
+            values["initial_switch_state"] = initial_switch_state
+        return {name: TimeseriesData(self.timestamps, value) for name, value in values.items()}
+
+    @property
+    def constraints(self) -> dict:
+        return self._constraints
+
+    def update(self, data: ControlThermalGeneratorData):
+        self._data = data
+        for variable in (self._power, self._switch_state, self._startup, self._shutdown):
+            if variable is not None:
+                variable.rekey(self.timestamps)
+        for name, value in self._initial_state_values().items():
+            self._initial_state_parameters[name].update_parameter_value(value, rekey=True)
+
+    def _add_constraint(
+        self, optimisation_engine: IOptimisationEngine, name: str, terms, constant=0, equality: bool = False
+    ) -> IOptimisationVariable:
+        constraint = optimisation_engine.add_linear_matrix_constraint(
+            f"{self.name}_{name}", terms, constant=constant, equality=equality
         )
+        self._constraints[name] = constraint
+        return constraint
 
     def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
         self._power.optimisation_value = optimisation_engine.add_timeindex_variable(
             self._power.name, self._power.bounds, self._power.initial_value
         )
-        self._power_lb.optimisation_value = optimisation_engine.add_timeindex_variable(
-            self._power_lb.name, self._power_lb.bounds, self._power_lb.initial_value
-        )
-        self._power_ub.optimisation_value = optimisation_engine.add_timeindex_variable(
-            self._power_ub.name, self._power_ub.bounds, self._power_ub.initial_value
-        )
-
         self._switch_state.optimisation_value = optimisation_engine.add_timeindex_binary_variable(
             self._switch_state.name, self._switch_state.initial_value
         )
 
-        # constraints
-        self._lb_constraint.optimisation_value = optimisation_engine.add_index_constraint(
-            self._lb_constraint.name,
-            [v.constraint_expression for v in self._lb_constraint.value],
-        )
-        self._ub_constraint.optimisation_value = optimisation_engine.add_index_constraint(
-            self._ub_constraint.name,
-            [v.constraint_expression for v in self._ub_constraint.value],
-        )
-
-        self._power_lb_constraint.optimisation_value = optimisation_engine.add_index_constraint(
-            self._lb_constraint.name,
-            [v.constraint_expression for v in self._power_lb_constraint.value],
-        )
-        self._power_ub_constraint.optimisation_value = optimisation_engine.add_index_constraint(
-            self._ub_constraint.name,
-            [v.constraint_expression for v in self._power_ub_constraint.value],
-        )
+        self._constraints = {}
+        parameters = {}
+        for name, parameter in self._initial_state_parameters.items():
+            parameter.optimisation_value = optimisation_engine.add_timeindex_parameter(
+                parameter.name, parameter.parameter_value
+            )
+            parameters[name] = [parameter.optimisation_value]
+        power = [self._power.optimisation_value]
+        switch_state = [self._switch_state.optimisation_value]
+        power_min, power_max = self._data.power_bounds.min, self._data.power_bounds.max
+        one = np.ones((1, 1))
+
+        self._add_constraint(optimisation_engine, "power_min", [(-one, power), (power_min * one, switch_state)])
+        self._add_constraint(optimisation_engine, "power_max", [(one, power), (-power_max * one, switch_state)])
+
+        if self._has_initial_state:
+            self._add_constraint(
+                optimisation_engine,
+                "initial_state",
+                [
+                    (np.array([[1.0], [-1.0]]), switch_state),
+                    (np.array([[-1.0], [0.0]]), parameters["switch_state_max"]),
+                    (np.array([[0.0], [1.0]]), parameters["switch_state_min"]),
+                ],
+            )
+
+        if self._startup is None:
+            return
+
+        self._startup.optimisation_value = optimisation_engine.add_timeindex_binary_variable(
+            self._startup.name, self._startup.initial_value
+        )
+        self._shutdown.optimisation_value = optimisation_engine.add_timeindex_binary_variable(
+            self._shutdown.name, self._shutdown.initial_value
+        )
+        startup = [self._startup.optimisation_value]
+        shutdown = [self._shutdown.optimisation_value]
+
+        self._add_constraint(
+            optimisation_engine,
+            "transition",
+            [
+                (one, switch_state, self._transition_matrix),
+                (-one, startup),
+                (one, shutdown),
+                (-one, parameters["initial_switch_state"]),
+            ],
+            equality=True,
+        )
+
+        if self._data.min_up_time > 0:
+            self._add_constraint(
+                optimisation_engine, "min_up_time", [(one, startup, self._min_up_matrix), (-one, switch_state)]
+            )
+        if self._data.min_down_time > 0:
+            self._add_constraint(
+                optimisation_engine, "min_down_time", [(one, shutdown, self._min_down_matrix), (one, switch_state)], -1
+            )
+        if self._data.startup_power is not None:
+            self._add_constraint(
+                optimisation_engine,
+                "startup_power",
+                [
+                    (one, power),
+                    (-power_max * one, switch_state),
+                    ((power_max - self._data.startup_power) * one, startup),
+                ],
+            )
+        if self._data.shutdown_power is not None:
+            self._add_constraint(
+                optimisation_engine,
+                "shutdown_power",
+                [
+                    (one, power),
+                    (-power_max * one, switch_state),
+                    ((power_max - self._data.shutdown_power) * one, shutdown, self._next_step_matrix),
+                ],
+            )
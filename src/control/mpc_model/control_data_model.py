@@ -1,5 +1,7 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional
+
+import numpy as np
 
 from common.model.component import GridLine, BUS_ID
 from common.model.grid_network_util import GridNetworkUtils
@@ -50,6 +52,20 @@ class ControlThermalGeneratorData:
     timestamps: Timestamps
     power_bounds: Bounds  # TODO convert bounds to bounded timeseries
     current_switch_state: bool
+    min_up_time: float = 0
+    min_down_time: float = 0
+    startup_power: Optional[float] = None
+    shutdown_power: Optional[float] = None
+    current_state_duration: Optional[float] = None
+
+    @property
+    def has_commitment_transitions(self) -> bool:
+        return (
+            self.min_up_time > 0 or
+            self.min_down_time > 0 or
+            self.startup_power is not None or
+            self.shutdown_power is not None
+        )
 
 
 @dataclass
@@ -57,3 +73,37 @@ class MeasurementStoragePowerPlantData:
     name: str
     timestamp: Timestamp
     energy: float
+
+
+@dataclass
+class ForecastScenarios:
+    timestamps: Timestamps
+    weights: np.ndarray
+    forecasts: Dict[str, np.ndarray]
+
+    def __post_init__(self):
+        self.weights = np.asarray(self.weights, dtype=float)
+        if self.weights.ndim != 1 or len(self.weights) == 0 or np.any(self.weights < 0) or self.weights.sum() <= 0:
+            raise ValueError("scenario weights should be a non empty vector of non negative values")
+        self.weights = self.weights / self.weights.sum()
+
+        shape = (len(self.weights), len(self.timestamps))
+        self.forecasts = {name: np.asarray(values, dtype=float) for name, values in self.forecasts.items()}
+        for name, values in self.forecasts.items():
+            if values.shape != shape:
+                raise ValueError(f"forecast scenarios of {name} should be of shape {shape} and not {values.shape}")
+
+    @classmethod
+    def from_scenarios(
+        cls, timestamps: Timestamps, scenarios: List[Dict[str, TimeseriesModel]], weights: List[float]
+    ) -> "ForecastScenarios":
+        names = list(scenarios[0]) if len(scenarios) > 0 else []
+        try:
+            forecasts = {name: np.stack([scenario[name].to_array() for scenario in scenarios]) for name in names}
+        except KeyError as e:
+            raise ValueError(f"forecast {e} is missing in some of the scenarios")
+        return cls(timestamps, weights, forecasts)
+
+    @property
+    def number_scenarios(self) -> int:
+        return len(self.weights)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from common.timeseries.domain import Timestamp, Timestamps
+from common.timeseries.domain import Timestamp, UniformTimestamps
 from control.optimisation_engine.interface import IOptimisationEngine
 
 
@@ -15,7 +15,7 @@ class Horizon:
         try:
             assert self.since >= 0 and self.until >= 0 and self.sampling_time >= 0
             assert self.until - self.since >= 0
-            self.timestamps = Timestamps([t for t in range(self.since, self.until, self.sampling_time)])
+            self.timestamps = UniformTimestamps.from_range(self.since, self.until, self.sampling_time)
         except AssertionError:
             raise AssertionError("since and until is positive and until greater than since")
 
@@ -38,5 +38,8 @@ class IControlComponent:
     def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
         raise NotImplementedError
 
+    def update(self, data):
+        raise NotImplementedError
+
     def get_results(self):
         raise NotImplementedError
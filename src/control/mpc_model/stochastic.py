@@ -0,0 +1,546 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+from common.model.component import BUS_ID
+from common.model.grid_network_util import GridNetworkUtils
+from common.timeseries.domain import Timestamps
+from control.mpc_model.component.power_balance import unit_bus_matrix
+from control.mpc_model.component.thermal_unit import next_step_matrix, time_window_matrix, transition_matrix
+from control.mpc_model.control_data_model import (
+    ControlGridNetworkData,
+    ControlLoadDemandData,
+    ControlRenewableUnitData,
+    ControlStoragePowerPlantData,
+    ControlThermalGeneratorData,
+    ForecastScenarios,
+)
+from control.optimisation_engine.domain import IOptimisationIndexVariable, IOptimisationVariable
+from control.optimisation_engine.interface import IOptimisationEngine
+
+SEC_TO_HOUR_FACTOR = 1 / 3600
+
+
+def repeat_scenarios(unit_values: np.ndarray, number_scenarios: int, number_timestamps: int) -> np.ndarray:
+    unit_values = np.asarray(unit_values, dtype=float).reshape(-1, 1)
+    return np.repeat(np.broadcast_to(unit_values, (len(unit_values), number_timestamps)), number_scenarios, axis=0)
+
+
+def non_anticipativity_matrix(number_units: int, number_scenarios: int) -> sparse.csr_matrix:
+    scenario_difference = sparse.hstack(
+        [-np.ones((number_scenarios - 1, 1)), sparse.identity(number_scenarios - 1)], format="csr"
+    )
+    return sparse.kron(sparse.identity(number_units), scenario_difference, format="csr")
+
+
+def first_step_matrix(number_timestamps: int) -> sparse.csr_matrix:
+    return sparse.csr_matrix(([1.0], ([0], [0])), shape=(number_timestamps, 1))
+
+
+class ScenarioBlock:
+    power_sign = 1
+
+    def __init__(self, name: str, units: List[str], timestamps: Timestamps, number_scenarios: int):
+        self._name = name
+        self._units = units
+        self._timestamps = timestamps
+        self._number_scenarios = number_scenarios
+        self._power: Optional[IOptimisationIndexVariable] = None
+        self._constraints: Dict[str, IOptimisationVariable] = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def units(self) -> List[str]:
+        return self._units
+
+    @property
+    def shape(self):
+        return len(self._units) * self._number_scenarios, len(self._timestamps)
+
+    @property
+    def power(self) -> IOptimisationIndexVariable:
+        if self._power is None:
+            raise NotImplementedError(f"variable {self._name}_power is not created")
+        return self._power
+
+    @property
+    def constraints(self) -> Dict[str, IOptimisationVariable]:
+        return self._constraints
+
+    @property
+    def decision_variables(self) -> Dict[str, IOptimisationIndexVariable]:
+        return {"power": self.power}
+
+    def _identity(self) -> sparse.csr_matrix:
+        return sparse.identity(self.shape[0], format="csr")
+
+    def _diagonal(self, unit_values: List[float]) -> sparse.csr_matrix:
+        return sparse.diags(np.repeat(np.asarray(unit_values, dtype=float), self._number_scenarios), format="csr")
+
+    def _add_constraint(
+        self, optimisation_engine: IOptimisationEngine, name: str, terms, constant=0, equality: bool = False
+    ) -> IOptimisationVariable:
+        constraint = optimisation_engine.add_linear_matrix_constraint(
+            f"{self._name}_{name}", terms, constant=constant, equality=equality
+        )
+        self._constraints[name] = constraint
+        return constraint
+
+    def _add_power_variable(self, optimisation_engine: IOptimisationEngine, lower: np.ndarray, upper: np.ndarray):
+        self._power = optimisation_engine.add_matrix_variable(
+            f"{self._name}_power", lower, upper, np.zeros(self.shape)
+        )
+
+    def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
+        raise NotImplementedError
+
+    def scenario_power(self) -> np.ndarray:
+        number_timestamps = len(self._timestamps)
+        return np.asarray(self.power.evaluate()).reshape(len(self._units), self._number_scenarios, number_timestamps)
+
+
+class StorageScenarioBlock(ScenarioBlock):
+    def __init__(self, name: str, data: List[ControlStoragePowerPlantData], timestamps: Timestamps, number_scenarios):
+        super().__init__(name, [d.name for d in data], timestamps, number_scenarios)
+        self._data = data
+        self._energy: Optional[IOptimisationIndexVariable] = None
+
+        number_timestamps = len(timestamps)
+        durations = np.diff(timestamps.to_array().astype(float))
+        self._energy_difference = sparse.diags(
+            [-np.ones(number_timestamps - 1), np.ones(number_timestamps - 1)], [0, -1],
+            shape=(number_timestamps, number_timestamps - 1), format="csr",
+        )
+        self._power_to_energy = sparse.diags(
+            durations * SEC_TO_HOUR_FACTOR, 0, shape=(number_timestamps, number_timestamps - 1), format="csr"
+        )
+
+    @property
+    def energy(self) -> IOptimisationIndexVariable:
+        if self._energy is None:
+            raise NotImplementedError(f"variable {self._name}_energy is not created")
+        return self._energy
+
+    def _repeat(self, values: List[float]) -> np.ndarray:
+        return repeat_scenarios(values, self._number_scenarios, len(self._timestamps))
+
+    def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
+        self._constraints = {}
+        self._add_power_variable(
+            optimisation_engine,
+            self._repeat([d.power_bounds.min for d in self._data]),
+            self._repeat([d.power_bounds.max for d in self._data]),
+        )
+        self._energy = optimisation_engine.add_matrix_variable(
+            f"{self._name}_energy",
+            self._repeat([d.energy_bounds.min for d in self._data]),
+            self._repeat([d.energy_bounds.max for d in self._data]),
+            np.zeros(self.shape),
+        )
+
+        identity = self._identity()
+        if len(self._timestamps) > 1:
+            self._add_constraint(
+                optimisation_engine,
+                "dynamics",
+                [(identity, [self._energy], self._energy_difference), (identity, [self._power], self._power_to_energy)],
+                equality=True,
+            )
+        current_energy = np.repeat([d.current_energy for d in self._data], self._number_scenarios).reshape(-1, 1)
+        self._add_constraint(
+            optimisation_engine,
+            "initial_energy",
+            [(identity, [self._energy], first_step_matrix(len(self._timestamps)))],
+            -current_energy,
+            equality=True,
+        )
+
+
+class ThermalScenarioBlock(ScenarioBlock):
+    def __init__(self, name: str, data: List[ControlThermalGeneratorData], timestamps: Timestamps, number_scenarios):
+        super().__init__(name, [d.name for d in data], timestamps, number_scenarios)
+        self._data = data
+        self._switch_state: Optional[IOptimisationIndexVariable] = None
+        self._startup: Optional[IOptimisationIndexVariable] = None
+        self._shutdown: Optional[IOptimisationIndexVariable] = None
+        self._has_commitment_transitions = any(d.has_commitment_transitions for d in data)
+
+        timestamp_values = timestamps.to_array().astype(float)
+        self._elapsed_time = timestamp_values - timestamp_values[0]
+        self._transition_matrix = transition_matrix(len(timestamps))
+        self._next_step_matrix = next_step_matrix(len(timestamps))
+        self._min_up_matrices = [time_window_matrix(timestamp_values, d.min_up_time) for d in data]
+        self._min_down_matrices = [time_window_matrix(timestamp_values, d.min_down_time) for d in data]
+
+    @property
+    def switch_state(self) -> IOptimisationIndexVariable:
+        if self._switch_state is None:
+            raise NotImplementedError(f"variable {self._name}_switch_state is not created")
+        return self._switch_state
+
+    @property
+    def startup(self) -> Optional[IOptimisationIndexVariable]:
+        return self._startup
+
+    @property
+    def shutdown(self) -> Optional[IOptimisationIndexVariable]:
+        return self._shutdown
+
+    @property
+    def decision_variables(self) -> Dict[str, IOptimisationIndexVariable]:
+        variables = {"power": self.power, "switch_state": self.switch_state}
+        if self._has_commitment_transitions:
+            variables.update({"startup": self._startup, "shutdown": self._shutdown})
+        return variables
+
+    def _unit_selection(self, unit_index: int, value: float = 1) -> sparse.csr_matrix:
+        unit_values = np.zeros(len(self._units))
+        unit_values[unit_index] = value
+        return self._diagonal(unit_values)
+
+    def _repeat_timeseries(self, unit_values: np.ndarray) -> np.ndarray:
+        return np.repeat(np.asarray(unit_values, dtype=float), self._number_scenarios, axis=0)
+
+    def _initial_state_masks(self) -> np.ndarray:
+        masks = np.zeros((len(self._data), len(self._elapsed_time)), dtype=bool)
+        for i, d in enumerate(self._data):
+            if d.current_state_duration is not None:
+                min_time = d.min_up_time if d.current_switch_state else d.min_down_time
+                masks[i] = self._elapsed_time < min_time - d.current_state_duration
+        return masks
+
+    def _extend_initial_state(self, optimisation_engine: IOptimisationEngine):
+        masks = self._initial_state_masks()
+        if not masks.any():
+            return
+        terms = [
+            (self._unit_selection(i, -1 if d.current_switch_state else 1), [self._switch_state],
+             sparse.diags(mask.astype(float)).tocsr())
+            for i, (d, mask) in enumerate(zip(self._data, masks))
+            if mask.any()
+        ]
+        switched_on = np.array([d.current_switch_state for d in self._data], dtype=float)[:, np.newaxis]
+        self._add_constraint(optimisation_engine, "initial_state", terms, self._repeat_timeseries(switched_on * masks))
+
+    def _extend_commitment_transitions(self, optimisation_engine: IOptimisationEngine, power_max: List[float]):
+        self._startup = optimisation_engine.add_matrix_binary_variable(f"{self._name}_startup", np.zeros(self.shape))
+        self._shutdown = optimisation_engine.add_matrix_binary_variable(f"{self._name}_shutdown", np.zeros(self.shape))
+
+        identity = self._identity()
+        switched_on = [float(d.current_switch_state) for d in self._data]
+        initial_transition = np.zeros(self.shape)
+        initial_transition[:, 0] = -np.repeat(switched_on, self._number_scenarios)
+        self._add_constraint(
+            optimisation_engine,
+            "transition",
+            [(identity, [self._switch_state], self._transition_matrix), (-identity, [self._startup]),
+             (identity, [self._shutdown])],
+            initial_transition,
+            equality=True,
+        )
+
+        min_up_units = [i for i, d in enumerate(self._data) if d.min_up_time > 0]
+        if len(min_up_units) > 0:
+            self._add_constraint(
+                optimisation_engine,
+                "min_up_time",
+                [(self._unit_selection(i), [self._startup], self._min_up_matrices[i]) for i in min_up_units] +
+                [(-self._diagonal([d.min_up_time > 0 for d in self._data]), [self._switch_state])],
+            )
+        min_down_units = [i for i, d in enumerate(self._data) if d.min_down_time > 0]
+        if len(min_down_units) > 0:
+            min_down_selection = self._diagonal([d.min_down_time > 0 for d in self._data])
+            self._add_constraint(
+                optimisation_engine,
+                "min_down_time",
+                [(self._unit_selection(i), [self._shutdown], self._min_down_matrices[i]) for i in min_down_units] +
+                [(min_down_selection, [self._switch_state])],
+                -min_down_selection.diagonal()[:, np.newaxis],
+            )
+        if any(d.startup_power is not None for d in self._data):
+            startup_power = [p if d.startup_power is None else d.startup_power for d, p in zip(self._data, power_max)]
+            self._add_constraint(
+                optimisation_engine,
+                "startup_power",
+                [(identity, [self._power]), (-self._diagonal(power_max), [self._switch_state]),
+                 (self._diagonal(np.subtract(power_max, startup_power)), [self._startup])],
+            )
+        if any(d.shutdown_power is not None for d in self._data):
+            shutdown_power = [
+                p if d.shutdown_power is None else d.shutdown_power for d, p in zip(self._data, power_max)
+            ]
+            self._add_constraint(
+                optimisation_engine,
+                "shutdown_power",
+                [(identity, [self._power]), (-self._diagonal(power_max), [self._switch_state]),
+                 (self._diagonal(np.subtract(power_max, shutdown_power)), [self._shutdown], self._next_step_matrix)],
+            )
+
+    def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
+        self._constraints = {}
+        power_max = [d.power_bounds.max for d in self._data]
+        self._add_power_variable(
+            optimisation_engine,
+            np.zeros(self.shape),
+            repeat_scenarios(power_max, self._number_scenarios, len(self._timestamps)),
+        )
+        self._switch_state = optimisation_engine.add_matrix_binary_variable(
+            f"{self._name}_switch_state", np.zeros(self.shape)
+        )
+
+        identity = self._identity()
+        power_min = self._diagonal([d.power_bounds.min for d in self._data])
+        self._add_constraint(
+            optimisation_engine, "power_min", [(-identity, [self._power]), (power_min, [self._switch_state])]
+        )
+        self._add_constraint(
+            optimisation_engine,
+            "power_max",
+            [(identity, [self._power]), (-self._diagonal(power_max), [self._switch_state])],
+        )
+        self._extend_initial_state(optimisation_engine)
+        if self._has_commitment_transitions:
+            self._extend_commitment_transitions(optimisation_engine, power_max)
+
+
+class ForecastScenarioBlock(ScenarioBlock):
+    def __init__(self, name: str, units: List[str], scenarios: ForecastScenarios):
+        super().__init__(name, units, scenarios.timestamps, scenarios.number_scenarios)
+        self._forecast_values = self._stack_forecasts(scenarios)
+        self._forecast: Optional[IOptimisationIndexVariable] = None
+
+    def _stack_forecasts(self, scenarios: ForecastScenarios) -> np.ndarray:
+        try:
+            forecasts = [scenarios.forecasts[unit] for unit in self._units]
+        except KeyError as e:
+            raise ValueError(f"unit {e} has no forecast scenarios")
+        if len(forecasts) == 0:
+            return np.zeros(self.shape)
+        return np.concatenate(forecasts, axis=0)
+
+    @property
+    def forecast(self) -> IOptimisationIndexVariable:
+        if self._forecast is None:
+            raise NotImplementedError(f"parameter {self._name}_forecast is not created")
+        return self._forecast
+
+    def _add_forecast_parameter(self, optimisation_engine: IOptimisationEngine):
+        self._forecast = optimisation_engine.add_matrix_parameter(f"{self._name}_forecast", self._forecast_values)
+
+
+class RenewableScenarioBlock(ForecastScenarioBlock):
+    def __init__(self, name: str, data: List[ControlRenewableUnitData], scenarios: ForecastScenarios):
+        super().__init__(name, [d.name for d in data], scenarios)
+        self._data = data
+
+    def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
+        self._constraints = {}
+        number_timestamps = len(self._timestamps)
+        self._add_power_variable(
+            optimisation_engine,
+            repeat_scenarios([d.power_bounds.min for d in self._data], self._number_scenarios, number_timestamps),
+            repeat_scenarios([d.power_bounds.max for d in self._data], self._number_scenarios, number_timestamps),
+        )
+        self._add_forecast_parameter(optimisation_engine)
+
+        identity = self._identity()
+        self._add_constraint(
+            optimisation_engine, "available_power_limit", [(identity, [self._power]), (-identity, [self._forecast])]
+        )
+
+
+class LoadScenarioBlock(ForecastScenarioBlock):
+    power_sign = -1
+
+    def __init__(self, name: str, data: List[ControlLoadDemandData], scenarios: ForecastScenarios):
+        super().__init__(name, [d.name for d in data], scenarios)
+
+    @property
+    def power(self) -> IOptimisationIndexVariable:
+        return self.forecast
+
+    @property
+    def decision_variables(self) -> Dict[str, IOptimisationIndexVariable]:
+        return {}
+
+    def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
+        self._constraints = {}
+        self._add_forecast_parameter(optimisation_engine)
+
+
+class GridScenarioBlock(ScenarioBlock):
+    def __init__(self, name: str, data: ControlGridNetworkData, number_scenarios: int):
+        super().__init__(name, list(data.buses), data.timestamps, number_scenarios)
+        self._data = data
+        self._line_power: Optional[IOptimisationIndexVariable] = None
+
+        incidence = GridNetworkUtils.calculate_incidence_matrix(data.buses, data.lines)
+        phase_angle = np.array(GridNetworkUtils.calculate_dc_power_flow_matrix(data.buses, data.lines), dtype=float)
+        phase_angle[0] = 0
+        admittance = np.array([line.admittance for line in data.lines], dtype=float)
+        scenario_identity = sparse.identity(number_scenarios)
+        self._power_flow_matrix = sparse.kron(sparse.csr_matrix(admittance[:, None] * (incidence @ phase_angle)),
+                                              scenario_identity, format="csr")
+        self._line_incidence = sparse.kron(incidence.T, scenario_identity, format="csr")
+
+    @property
+    def bus_power(self) -> IOptimisationIndexVariable:
+        return self.power
+
+    @property
+    def line_power(self) -> IOptimisationIndexVariable:
+        if self._line_power is None:
+            raise NotImplementedError(f"variable {self._name}_line_power is not created")
+        return self._line_power
+
+    @property
+    def decision_variables(self) -> Dict[str, IOptimisationIndexVariable]:
+        return {}
+
+    def _line_bounds(self, bound: str) -> np.ndarray:
+        infinity = np.inf if bound == "max" else -np.inf
+        values = [infinity if line.bounds is None else getattr(line.bounds, bound) for line in self._data.lines]
+        return repeat_scenarios(values, self._number_scenarios, len(self._timestamps))
+
+    def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
+        self._constraints = {}
+        self._add_power_variable(optimisation_engine, np.full(self.shape, -np.inf), np.full(self.shape, np.inf))
+        self._line_power = optimisation_engine.add_matrix_variable(
+            f"{self._name}_line_power", self._line_bounds("min"), self._line_bounds("max"),
+            np.zeros((len(self._data.lines) * self._number_scenarios, len(self._timestamps))),
+        )
+        if len(self._data.lines) == 0:
+            return
+
+        line_identity = sparse.identity(self._line_incidence.shape[1], format="csr")
+        self._add_constraint(
+            optimisation_engine,
+            "line_flow",
+            [(self._identity(), [self._power]), (-self._line_incidence, [self._line_power])],
+            equality=True,
+        )
+        self._add_constraint(
+            optimisation_engine,
+            "power_flow",
+            [(line_identity, [self._line_power]), (-self._power_flow_matrix, [self._power])],
+            equality=True,
+        )
+
+
+class StochasticMPCModel:
+    def __init__(
+        self,
+        name: str,
+        scenarios: ForecastScenarios,
+        storage: Optional[List[ControlStoragePowerPlantData]] = None,
+        thermal: Optional[List[ControlThermalGeneratorData]] = None,
+        renewable: Optional[List[ControlRenewableUnitData]] = None,
+        loads: Optional[List[ControlLoadDemandData]] = None,
+        grid: Optional[ControlGridNetworkData] = None,
+        bus_ids: Optional[Dict[str, BUS_ID]] = None,
+    ):
+        self._name = name
+        self._scenarios = scenarios
+        number_scenarios = scenarios.number_scenarios
+        blocks = [
+            StorageScenarioBlock(f"{name}_storage", storage or [], scenarios.timestamps, number_scenarios),
+            ThermalScenarioBlock(f"{name}_thermal", thermal or [], scenarios.timestamps, number_scenarios),
+            RenewableScenarioBlock(f"{name}_renewable", renewable or [], scenarios),
+            LoadScenarioBlock(f"{name}_load", loads or [], scenarios),
+        ]
+        self._blocks: List[ScenarioBlock] = [block for block in blocks if len(block.units) > 0]
+        self._grid = None if grid is None else GridScenarioBlock(f"{name}_grid", grid, number_scenarios)
+        self._bus_ids = bus_ids or {}
+        self._balance: Optional[IOptimisationVariable] = None
+        self._non_anticipativity: Dict[str, IOptimisationVariable] = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def scenarios(self) -> ForecastScenarios:
+        return self._scenarios
+
+    @property
+    def blocks(self) -> List[ScenarioBlock]:
+        return self._blocks
+
+    @property
+    def grid(self) -> Optional[GridScenarioBlock]:
+        return self._grid
+
+    @property
+    def non_anticipativity_constraints(self) -> Dict[str, IOptimisationVariable]:
+        return self._non_anticipativity
+
+    def _block_bus_matrix(self, block: ScenarioBlock) -> sparse.csr_matrix:
+        number_scenarios = self._scenarios.number_scenarios
+        if self._grid is None:
+            unit_bus = sparse.csr_matrix(np.ones((1, len(block.units))))
+        else:
+            try:
+                unit_bus_ids = [self._bus_ids[unit] for unit in block.units]
+            except KeyError as e:
+                raise ValueError(f"unit {e} has no bus in the grid network")
+            unit_bus = unit_bus_matrix(self._grid.units, unit_bus_ids).T
+        return block.power_sign * sparse.kron(unit_bus, sparse.identity(number_scenarios), format="csr")
+
+    def _extend_power_balance(self, optimisation_engine: IOptimisationEngine):
+        terms = [(self._block_bus_matrix(block), [block.power]) for block in self._blocks]
+        if self._grid is not None:
+            terms.append((-sparse.identity(self._grid.shape[0], format="csr"), [self._grid.bus_power]))
+        if len(terms) > 0:
+            self._balance = optimisation_engine.add_linear_matrix_constraint(
+                f"{self._name}_power_balance", terms, equality=True
+            )
+
+    def _extend_non_anticipativity(self, optimisation_engine: IOptimisationEngine):
+        self._non_anticipativity = {}
+        number_scenarios = self._scenarios.number_scenarios
+        if number_scenarios < 2:
+            return
+        first_step = first_step_matrix(len(self._scenarios.timestamps))
+        for block in self._blocks:
+            scenario_difference = non_anticipativity_matrix(len(block.units), number_scenarios)
+            for variable_name, variable in block.decision_variables.items():
+                name = f"{block.name}_{variable_name}_non_anticipativity"
+                self._non_anticipativity[name] = optimisation_engine.add_linear_matrix_constraint(
+                    name, [(scenario_difference, [variable], first_step)], equality=True
+                )
+
+    def extend_optimisation_model(self, optimisation_engine: IOptimisationEngine):
+        for block in self._blocks:
+            block.extend_optimisation_model(optimisation_engine)
+        if self._grid is not None:
+            self._grid.extend_optimisation_model(optimisation_engine)
+
+        self._extend_power_balance(optimisation_engine)
+        self._extend_non_anticipativity(optimisation_engine)
+
+    def add_expected_power_cost(self, optimisation_engine: IOptimisationEngine, costs: Dict[str, float]):
+        for block in self._blocks:
+            unit_costs = np.array([costs.get(unit, 0) for unit in block.units], dtype=float)
+            if not np.any(unit_costs):
+                continue
+            expected_cost = np.kron(unit_costs, self._scenarios.weights).reshape(1, -1)
+            optimisation_engine.update_objective(block.power, lambda value, c=expected_cost: (c @ value).sum())
+
+    def scenario_power(self) -> Dict[str, np.ndarray]:
+        return {
+            unit: power
+            for block in self._blocks
+            for unit, power in zip(block.units, block.scenario_power())
+        }
+
+    def first_stage_setpoints(self) -> Dict[str, float]:
+        return {
+            unit: float(power[0, 0])
+            for block in self._blocks
+            if len(block.decision_variables) > 0
+            for unit, power in zip(block.units, block.scenario_power())
+        }
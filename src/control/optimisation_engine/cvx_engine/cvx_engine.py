@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Callable, TypeVar, Optional
+from typing import Any, List, Callable, Tuple, TypeVar, Optional
 
 from common.timeseries.domain import Bounds, TimeseriesModel, BoundTimeseries
 from control.optimisation_engine.cvx_engine.variable import (
@@ -11,6 +11,9 @@ from control.optimisation_engine.cvx_engine.variable import (
     CvxIndexVariable,
     CvxIndexConstraint,
     CvxIndexParameter,
+    CvxMatrixConstraint,
+    CvxMatrixParameter,
+    CvxMatrixVariable,
 )
 from control.optimisation_engine.domain import (
     IOptimisationVariable,
@@ -20,6 +23,7 @@ from control.optimisation_engine.domain import (
 )
 from control.optimisation_engine.interface import IOptimisationEngine
 import cvxpy as cp
+import numpy as np
 
 
 @dataclass
@@ -47,6 +51,9 @@ CvxTypeVar = TypeVar(
     CvxIndexParameter,
     CvxIndexVariable,
     CvxIndexConstraint,
+    CvxMatrixConstraint,
+    CvxMatrixParameter,
+    CvxMatrixVariable,
 )
 
 
@@ -106,7 +113,14 @@ class CvxEngine(IOptimisationEngine):
     def solve(self) -> None:
         if self._model is not None:
             self.generate_optimisation_model()
+        self._solve_model()
 
+    def resolve(self) -> None:
+        if self._model is None:
+            self.generate_optimisation_model()
+        self._solve_model()
+
+    def _solve_model(self) -> None:
         if self._has_binary_variable:
             self._model.solve(**self._mixed_integer_solver_parameters)
         else:
@@ -160,7 +174,7 @@ class CvxEngine(IOptimisationEngine):
         self, name: str, bound: BoundTimeseries, initial_value: TimeseriesModel
     ) -> CvxIndexVariable:
         index = [i for i, _ in enumerate(bound.timestamps)]
-        bounds_list = [bound.get_value_as_bound(t) for t in bound.timestamps]
+        bounds_list = [Bounds(min_, max_) for min_, max_ in zip(bound.min_array.tolist(), bound.max_array.tolist())]
         cvx_index_variable = CvxIndexVariable(name=name, index=index, bounds=bounds_list, value=initial_value.values)
         self._variable = self._add_optimisation_value(cvx_index_variable, self._variable)
         return cvx_index_variable
@@ -182,3 +196,37 @@ class CvxEngine(IOptimisationEngine):
         cvx_constraint = CvxIndexConstraint(name, constraint)
         self._constraint = self._add_optimisation_value(cvx_constraint, self._constraint)
         return cvx_constraint
+
+    def add_matrix_parameter(self, name: str, value: np.ndarray) -> CvxMatrixParameter:
+        cvx_parameter = CvxMatrixParameter(name, np.asarray(value, dtype=float))
+        self._parameter = self._add_optimisation_value(cvx_parameter, self._parameter)
+        return cvx_parameter
+
+    def add_matrix_variable(
+        self, name: str, lower: np.ndarray, upper: np.ndarray, initial_value: np.ndarray
+    ) -> CvxMatrixVariable:
+        cvx_variable = CvxMatrixVariable(
+            name, np.asarray(initial_value, dtype=float), np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+        )
+        self._variable = self._add_optimisation_value(cvx_variable, self._variable)
+        return cvx_variable
+
+    def add_matrix_binary_variable(self, name: str, initial_value: np.ndarray) -> CvxMatrixVariable:
+        self._has_binary_variable = True
+        initial_value = np.asarray(initial_value, dtype=float)
+        cvx_variable = CvxMatrixVariable(
+            name, initial_value, np.zeros_like(initial_value), np.ones_like(initial_value), VariableType.Binary
+        )
+        self._variable = self._add_optimisation_value(cvx_variable, self._variable)
+        return cvx_variable
+
+    def add_linear_matrix_constraint(
+        self,
+        name: str,
+        terms: List[Tuple[Any, ...]],
+        constant: Any = 0,
+        equality: bool = True,
+    ) -> CvxMatrixConstraint:
+        cvx_constraint = CvxMatrixConstraint(name, terms, constant, equality)
+        self._constraint = self._add_optimisation_value(cvx_constraint, self._constraint)
+        return cvx_constraint
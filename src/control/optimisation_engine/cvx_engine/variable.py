@@ -1,4 +1,4 @@
-from typing import List, Callable, Any
+from typing import List, Callable, Any, Tuple
 
 import cvxpy as cp
 import numpy as np
@@ -62,7 +62,7 @@ class CvxVariable(IOptimisationVariable):
 
 class CvxParameter(IOptimisationVariable):
     def __init__(self, name: str, value: float):
-        self._value = cp.Parameter((1,), name=name, value=value)
+        self._value = cp.Parameter((1,), name=name, value=np.reshape(value, (1,)))
         self._init_value = value
         self.name = name
 
@@ -93,6 +93,99 @@ class CvxConstraint(IOptimisationVariable):
         return status
 
 
+def matrix_bound_constraints(variable: cp.Variable, lower: np.ndarray, upper: np.ndarray) -> List[Any]:
+    constraints = []
+    for bound, finite, is_lower in [(lower, np.isfinite(lower), True), (upper, np.isfinite(upper), False)]:
+        if finite.all():
+            constraints.append(bound <= variable if is_lower else variable <= bound)
+        elif finite.any():
+            rows, columns = np.nonzero(finite)
+            entries = variable[rows, columns]
+            constraints.append(bound[finite] <= entries if is_lower else entries <= bound[finite])
+    return constraints
+
+
+class CvxMatrixParameter(IOptimisationIndexVariable):
+    def __init__(self, name: str, value: np.ndarray):
+        self._value = cp.Parameter(value.shape, name=name, value=value)
+        self.name = name
+
+    @property
+    def value(self):
+        return self._value
+
+    def evaluate(self):
+        return self._value.value
+
+    def update_value(self, value: Any):
+        self._value.value = np.asarray(value, dtype=float).reshape(self._value.shape)
+
+    def _at_index(self, index: int):
+        return self._value[index]
+
+
+class CvxMatrixVariable(IOptimisationIndexVariable):
+    def __init__(
+        self,
+        name: str,
+        value: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        variable_type: VariableType = VariableType.Continuous,
+    ):
+        self._value = cp.Variable(value.shape, name=name, value=value, boolean=variable_type == VariableType.Binary)
+        self._bound_constraints = [] if variable_type == VariableType.Binary else matrix_bound_constraints(
+            self._value, lower, upper
+        )
+        self.variable_type = variable_type
+        self.name = name
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def bound_constraints(self):
+        return self._bound_constraints
+
+    def evaluate(self):
+        return self._value.value
+
+    def _at_index(self, index: int):
+        return self._value[index]
+
+
+def linear_matrix_term(
+    matrix: Any, variables: List[IOptimisationIndexVariable], time_matrix: Any = None
+) -> cp.Expression:
+    expression = matrix @ cp.vstack([v.value for v in variables])
+    if time_matrix is not None:
+        expression = expression @ time_matrix
+    return expression
+
+
+def linear_matrix_expression(terms: List[Tuple[Any, ...]], constant: Any = 0) -> cp.Expression:
+    return sum(linear_matrix_term(*term) for term in terms) + constant
+
+
+class CvxMatrixConstraint(IOptimisationVariable):
+    def __init__(self, name: str, terms: List[Tuple[Any, ...]], constant: Any = 0, equality: bool = True):
+        self._expression = linear_matrix_expression(terms, constant)
+        self._value = self._expression == 0 if equality else self._expression <= 0
+        self.name = name
+
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def residual(self) -> np.ndarray:
+        return self._expression.value
+
+    def evaluate(self):
+        return self._value.value()
+
+
 class UndefinedObjective(Exception):
     pass
 
@@ -151,10 +244,13 @@ class CvxIndexParameter(IOptimisationIndexVariable):
     def evaluate(self):
         return self._value.value
 
+    def update_value(self, value: Any):
+        self._value.value = np.asarray(value, dtype=float).reshape(self._value.shape)
+
     def _at_index(self, index: int):
         try:
             id = self._index.index(index)
-            parameter = CvxParameter(f"{self.name}_{id}", self.value[id])
+            parameter = CvxParameter(f"{self.name}_{id}", self.value[id].value)
             parameter.value = self.value[id]
             return parameter
         except IndexError as e:
@@ -292,8 +388,10 @@ def generate_cvx_bound_constraint(variable: CvxVariable.value, bounds: Bounds):
 
 
 def generate_cvx_index_bound_constraint(variable, bounds):
-    constraint_ = [bounds.min.get_value(t) <= variable[i].value for i, t in enumerate(bounds.timestamps)]
-    constraint_.extend([variable[i].value <= bounds.max.get_value(t) for i, t in enumerate(bounds.timestamps)])
+    min_values = bounds.min_array.tolist()
+    max_values = bounds.max_array.tolist()
+    constraint_ = [min_ <= variable[i].value for i, min_ in enumerate(min_values)]
+    constraint_.extend([variable[i].value <= max_ for i, max_ in enumerate(max_values)])
     return constraint_
 
 
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import Union, Any, List
 
-from common.timeseries.domain import Timestamps, Timestamp
+from common.timeseries.domain import Timestamps, Timestamp, UnknownTimestampError as TimestampsIndexError
 
 
 class VariableType(Enum):
@@ -45,6 +45,9 @@ class IOptimisationIndexVariable:
     def evaluate(self):
         raise NotImplementedError
 
+    def update_value(self, value: Any):
+        raise NotImplementedError
+
 
 class OptimisationExpression:
     def __init__(self, value: Any):
@@ -281,8 +284,8 @@ class ITimeIndexBaseModel:
 
     def _get_value_timestamp(self, timestamp: Timestamp):
         try:
-            return self.value[self.timestamps.values.index(timestamp)]
-        except (IndexError, ValueError):
+            return self.value[self.timestamps.get_timestamp_index(timestamp)]
+        except (IndexError, ValueError, TimestampsIndexError):
             raise UnknownTimestampError(f"timestamp {timestamp} is not part of the timestamps defined")
 
     def _get_value_index(self, index: int):
@@ -1,4 +1,6 @@
-from typing import List, Callable, Union
+from typing import Any, List, Callable, Tuple, Union
+
+import numpy as np
 
 from common.timeseries.domain import (
     Bounds,
@@ -27,6 +29,9 @@ class IOptimisationEngine:
     def solve(self):
         raise NotImplementedError
 
+    def resolve(self):
+        self.solve()
+
     def add_parameter(self, name: str, value: float) -> IOptimisationVariable:
         raise NotImplementedError
 
@@ -62,3 +67,23 @@ class IOptimisationEngine:
 
     def add_index_constraint(self, name: str, constraint: List[ConstraintType]) -> IOptimisationIndexVariable:
         raise NotImplementedError
+
+    def add_matrix_parameter(self, name: str, value: np.ndarray) -> IOptimisationIndexVariable:
+        raise NotImplementedError
+
+    def add_matrix_variable(
+        self, name: str, lower: np.ndarray, upper: np.ndarray, initial_value: np.ndarray
+    ) -> IOptimisationIndexVariable:
+        raise NotImplementedError
+
+    def add_matrix_binary_variable(self, name: str, initial_value: np.ndarray) -> IOptimisationIndexVariable:
+        raise NotImplementedError
+
+    def add_linear_matrix_constraint(
+        self,
+        name: str,
+        terms: List[Tuple[Any, ...]],
+        constant: Any = 0,
+        equality: bool = True,
+    ) -> IOptimisationVariable:
+        raise NotImplementedError
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from typing import List, Union, Optional
 
 from control.optimisation_engine.domain import (
@@ -29,6 +30,14 @@ class Parameter(IBaseVariable):
     def name(self) -> str:
         return self._name
 
+    @property
+    def parameter_value(self) -> Union[float, int]:
+        return self._value
+
+    @parameter_value.setter
+    def parameter_value(self, value: Union[float, int]):
+        self._value = value
+
     @property
     def value(self) -> IOptimisationVariable:
         if self._opt_parameter is None:
@@ -132,12 +141,17 @@ class Objective(IBaseVariable):
         return self.value.evaluate()
 
 
+def check_rekey_timestamps(name: str, timestamps: Timestamps, number_timestamps: int):
+    if len(timestamps) != number_timestamps:
+        raise UnknownTimestampError(f"{name} cannot change the number of timestamps")
+
+
 class TimeIndexParameter(ITimeIndexBaseModel):
     def __init__(self, name: str, parameter_value: TimeseriesModel):
         self._name = name
         self._value = parameter_value
         self._parameter: List[Parameter] = [
-            Parameter(f"{name}_{t}", self._value.get_value(t)) for t in self._value.timestamps
+            Parameter(f"{name}_{t}", value) for t, value in zip(self._value.timestamps, self._value.to_array().tolist())
         ]
         self._opt_parameter: Optional[IOptimisationIndexVariable] = None
 
@@ -153,6 +167,20 @@ class TimeIndexParameter(ITimeIndexBaseModel):
     def parameter_value(self):
         return self._value
 
+    def update_parameter_value(self, parameter_value: TimeseriesModel, rekey: bool = False):
+        check_rekey_timestamps(f"parameter {self._name}", parameter_value.timestamps, len(self._parameter))
+        timestamps = list(parameter_value.timestamps.values)
+        if not rekey and timestamps != list(self.timestamps.values):
+            raise UnknownTimestampError(f"parameter {self._name} cannot change its timestamps without rekeying")
+
+        self._value = parameter_value
+        values = parameter_value.to_array()
+        for parameter, timestamp, value in zip(self._parameter, timestamps, values.tolist()):
+            parameter.parameter_value = value
+            parameter._name = f"{self._name}_{timestamp}"
+        if self._opt_parameter is not None:
+            self._opt_parameter.update_value(values)
+
     @property
     def value(self) -> List[Parameter]:
         return self._parameter
@@ -187,7 +215,13 @@ class TimeIndexVariable(ITimeIndexBaseModel):
         self._initial_value = initial_value
         self._timestamps = initial_value.timestamps
         self._variable = [
-            Variable(f"{name}_{t}", bounds.get_value(t), initial_value.get_value(t)) for t in self._timestamps
+            Variable(f"{name}_{t}", (min_, max_), value)
+            for t, min_, max_, value in zip(
+                self._timestamps,
+                bounds.min_array.tolist(),
+                bounds.max_array.tolist(),
+                initial_value.to_array().tolist(),
+            )
         ]
         self._opt_variable: Optional[IOptimisationIndexVariable] = None
 
@@ -211,6 +245,16 @@ class TimeIndexVariable(ITimeIndexBaseModel):
     def value(self) -> List[Variable]:
         return self._variable
 
+    def rekey(self, timestamps: Timestamps):
+        check_rekey_timestamps(f"variable {self._name}", timestamps, len(self._variable))
+        self._timestamps = timestamps
+        self._bounds = BoundTimeseries(
+            min=replace(self._bounds.min, timestamps=timestamps), max=replace(self._bounds.max, timestamps=timestamps)
+        )
+        self._initial_value = replace(self._initial_value, timestamps=timestamps)
+        for variable, timestamp in zip(self._variable, timestamps.values):
+            variable._name = f"{self._name}_{timestamp}"
+
     @property
     def optimisation_value(self) -> IOptimisationIndexVariable:
         if self._opt_variable is None:
@@ -261,6 +305,12 @@ class TimeIndexConstraint:
     def value(self) -> List[Constraint]:
         return self._constraint
 
+    def rekey(self, timestamps: Timestamps):
+        check_rekey_timestamps(f"constraint {self._name}", timestamps, len(self._constraint))
+        self._timestamps = timestamps
+        for constraint, timestamp in zip(self._constraint, timestamps.values):
+            constraint._name = f"{self._name}_{timestamp}"
+
     @property
     def constraint_expression(self) -> List[ConstraintType]:
         return self._constraint_expression
@@ -9,7 +9,7 @@ from microgrid.config.interface import (
     ClassImportModuler,
 )
 from microgrid.shared.data_loader import IUnitConfigData, IComponentDataLoaderData
-from microgrid.shared.timeseries import SimulationTimeSeries, Timestamp
+from microgrid.shared.timeseries import ISimulationTimeSeries, Timestamp
 
 """
 @dataclass
@@ -27,7 +27,7 @@ class ILoadDemandConfigData(IUnitConfigData):
 
 @dataclass
 class LoadDemandDataLoaderData(IComponentDataLoaderData):
-    demand_time_series: SimulationTimeSeries
+    demand_time_series: ISimulationTimeSeries
 
 
 @dataclass
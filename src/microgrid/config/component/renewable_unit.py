@@ -10,13 +10,13 @@ from microgrid.config.interface import (
     ClassImportModuler,
 )
 from microgrid.shared.data_loader import IComponentDataLoaderData, IGeneratorConfigData
-from microgrid.shared.timeseries import SimulationTimeSeries
+from microgrid.shared.timeseries import ISimulationTimeSeries
 
 
 @dataclass
 class RenewableComponentDataLoaderData(IComponentDataLoaderData):
     sample_point_to_power: SamplePointsToPowerTable
-    simulation_time_series: SimulationTimeSeries
+    simulation_time_series: ISimulationTimeSeries
 
 
 @dataclass
@@ -0,0 +1,179 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+from microgrid.config.interface import IUnitConfig, IGridNetworkConfig, Reference
+from microgrid.config.microgrid import MicrogridModelConfig, MicrogridModelConfigBuilder
+from microgrid.config.registry import IComponentRegistry
+from microgrid.data_loader.domain import DuplicateUnitNameError, SamplePointsToPowerTable
+from microgrid.data_loader.microgrid_model import MicrogridModelDataLoader
+from microgrid.shared.memory_mapped_timeseries import MemoryMappedTimeSeries
+from microgrid.shared.timeseries import ISimulationTimeSeries, SimulationTimeSeries
+
+NAME_KEY = "name"
+COMPONENTS_KEY = "components"
+REFERENCE_KEY = "reference"
+MAX_REPORTED_ERRORS = 20
+
+FLEET_COMPONENT = Tuple[Reference, dict]
+COMPONENT_CONFIG = Union[IUnitConfig, IGridNetworkConfig]
+
+
+class FleetDefinitionError(ValueError):
+    pass
+
+
+def read_fleet_definition(path: str) -> dict:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, "r") as f:
+            return json.load(f)
+    if extension == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise FleetDefinitionError("tomllib or tomli is needed to read toml fleet definitions")
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    raise FleetDefinitionError(f"fleet definition {path} should be a json or toml file")
+
+
+def fleet_components(fleet: dict) -> List[FLEET_COMPONENT]:
+    components = []
+    for index, component in enumerate(fleet.get(COMPONENTS_KEY, [])):
+        data = dict(component)
+        try:
+            reference = data.pop(REFERENCE_KEY)
+        except KeyError:
+            raise FleetDefinitionError(f"component {index} of the fleet has no {REFERENCE_KEY}")
+        components.append((reference, data))
+    return components
+
+
+def time_series_from_data(data: Union[ISimulationTimeSeries, dict]) -> ISimulationTimeSeries:
+    if isinstance(data, ISimulationTimeSeries):
+        return data
+    if "directory" in data:
+        return MemoryMappedTimeSeries(**data)
+    return SimulationTimeSeries(timestamps=data["timestamps"], values=data["values"])
+
+
+def power_table_from_data(data: Union[SamplePointsToPowerTable, dict]) -> SamplePointsToPowerTable:
+    if isinstance(data, SamplePointsToPowerTable):
+        return data
+    return SamplePointsToPowerTable(**data)
+
+
+def fleet_dacite_config():
+    from dacite import Config
+
+    return Config(
+        type_hooks={
+            ISimulationTimeSeries: time_series_from_data,
+            SamplePointsToPowerTable: power_table_from_data,
+        }
+    )
+
+
+def create_component_configs(
+    registry: IComponentRegistry, components: List[Tuple[int, Reference, dict]]
+) -> List[Tuple[int, Optional[COMPONENT_CONFIG], Optional[str]]]:
+    dacite_config = fleet_dacite_config()
+    results = []
+    for index, reference, data in components:
+        try:
+            config = registry.get_component_config(reference).create_config_class(data, config=dacite_config)
+            results.append((index, config, None))
+        except Exception as err:
+            results.append((index, None, f"component {index} ({reference}, {data.get(NAME_KEY)}): {err}"))
+    return results
+
+
+_worker_registry: Optional[IComponentRegistry] = None
+
+
+def _initialise_worker(registry: IComponentRegistry):
+    global _worker_registry
+    _worker_registry = registry
+
+
+def _create_worker_component_configs(
+    components: List[Tuple[int, Reference, dict]]
+) -> List[Tuple[int, Optional[COMPONENT_CONFIG], Optional[str]]]:
+    return create_component_configs(_worker_registry, components)
+
+
+class FleetModelBuilder:
+    def __init__(self, component_registry: IComponentRegistry, max_workers: int = 1, chunk_size: int = 256):
+        self.registry = component_registry
+        self._config_builder = MicrogridModelConfigBuilder(component_registry)
+        self._max_workers = max_workers
+        self._chunk_size = max(chunk_size, 1)
+
+    def check_unique_names(self, components: List[FLEET_COMPONENT]):
+        grid_references = set(self.registry.get_grid_config_references())
+        names = set()
+        duplicate_names = set()
+        for reference, data in components:
+            if reference in grid_references:
+                continue
+            name = data.get(NAME_KEY)
+            if name in names:
+                duplicate_names.add(name)
+            names.add(name)
+        if len(duplicate_names) > 0:
+            raise DuplicateUnitNameError(f"{sorted(duplicate_names)} of the units must be unique")
+
+    def create_component_configs(self, components: List[FLEET_COMPONENT]) -> List[COMPONENT_CONFIG]:
+        indexed_components = [(index, reference, data) for index, (reference, data) in enumerate(components)]
+        chunks = [
+            indexed_components[i: i + self._chunk_size] for i in range(0, len(indexed_components), self._chunk_size)
+        ]
+
+        if self._max_workers <= 1 or len(chunks) <= 1:
+            results = [result for chunk in chunks for result in create_component_configs(self.registry, chunk)]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self._max_workers, initializer=_initialise_worker, initargs=(self.registry,)
+            ) as executor:
+                results = [result for chunk_results in executor.map(_create_worker_component_configs, chunks)
+                           for result in chunk_results]
+
+        errors = [error for _, _, error in results if error is not None]
+        if len(errors) > 0:
+            reported_errors = "\n".join(errors[:MAX_REPORTED_ERRORS])
+            raise FleetDefinitionError(f"{len(errors)} invalid component configs in the fleet:\n{reported_errors}")
+        return [config for _, config, _ in sorted(results, key=lambda result: result[0])]
+
+    def create_microgrid_config(self, fleet: dict) -> MicrogridModelConfig:
+        try:
+            name = fleet[NAME_KEY]
+        except KeyError:
+            raise FleetDefinitionError(f"fleet definition should have a {NAME_KEY}")
+
+        components = fleet_components(fleet)
+        self.check_unique_names(components)
+        configs = self.create_component_configs(components)
+
+        microgrid_config = MicrogridModelConfig(name, [], [], [], [], [])
+        for (reference, _), config in zip(components, configs):
+            self._config_builder.add_unit_config(microgrid_config, reference, config)
+
+        if len(microgrid_config.grid_network_config) == 0:
+            raise FleetDefinitionError(f"fleet definition {name} should contain a grid network")
+        return microgrid_config
+
+    def create_data_loader(self, fleet: dict) -> MicrogridModelDataLoader:
+        microgrid_config = self.create_microgrid_config(fleet)
+        return self._config_builder.generate_microgrid_model_data_loader(microgrid_config)
+
+    def load_data_loader(self, path: str) -> MicrogridModelDataLoader:
+        return self.create_data_loader(read_fleet_definition(path))
+
+
+def load_fleet(path: str, component_registry: IComponentRegistry, max_workers: int = 1) -> MicrogridModelDataLoader:
+    return FleetModelBuilder(component_registry, max_workers=max_workers).load_data_loader(path)
@@ -1,8 +1,8 @@
+import copy
+import importlib
 from dataclasses import dataclass
-from typing import Any
-
-import pydantic
-from dacite import from_dict
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
 
 from common.model.component import ComponentType
 from microgrid.data_loader.interface import IGeneratorDataLoader
@@ -76,20 +76,21 @@ class IGeneratorComponentConfig(IUnitConfig):
 Reference = str
 
 
+@lru_cache(maxsize=None)
+def import_class(module: str, value: str) -> Any:
+    try:
+        return getattr(importlib.import_module(module), value)
+    except ImportError as e:
+        raise WrongComponentConfigImporter(f"config error {e}")
+
+
 class ClassImportModuler:
     def __init__(self, module: str, value: str):
         self.module = module
         self.value = value
 
     def create_class(self) -> Any:
-        try:
-            import importlib
-
-            module = importlib.import_module(self.module)
-            class_ = getattr(module, self.value)
-            return class_
-        except ImportError as e:
-            raise WrongComponentConfigImporter(f"config error {e}")
+        return import_class(self.module, self.value)
 
     def __eq__(self, other):
         try:
@@ -97,6 +98,9 @@ class ClassImportModuler:
         except Exception:
             return False
 
+    def __hash__(self):
+        return hash((self.module, self.value))
+
     def create_class_instance(self, *args, **kwargs):
         pass
 
@@ -104,26 +108,141 @@ class ClassImportModuler:
         return self.create_class()
 
 
+@dataclass
+class ConfigValidationError:
+    index: int
+    message: str
+
+
+def _error_location(location: tuple) -> str:
+    return ".".join(str(item) for item in location)
+
+
+class CompiledConfigData:
+    def __init__(self, config_data_type: type):
+        import pydantic
+
+        self.config_data_type = config_data_type
+        self._pydantic_v1 = pydantic.VERSION.startswith("1.")
+        self._schema: Optional[dict] = None
+        if self._pydantic_v1:
+            class Config:
+                arbitrary_types_allowed = True
+
+            self._pydantic_class = pydantic.dataclasses.dataclass(config_data_type, config=Config)
+        else:
+            config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+            self._pydantic_class = pydantic.dataclasses.dataclass(config_data_type, config=config)
+            self._validator = pydantic.TypeAdapter(self._pydantic_class)
+            self._batch_validator = pydantic.TypeAdapter(List[self._pydantic_class])
+
+    def schema(self) -> dict:
+        if self._schema is None:
+            if self._pydantic_v1:
+                self._schema = self._pydantic_class.__pydantic_model__.schema()
+            else:
+                self._schema = self._validator.json_schema(schema_generator=_config_json_schema_generator())
+        return copy.deepcopy(self._schema)
+
+    def validate(self, dict_: dict) -> Any:
+        if self._pydantic_v1:
+            return self._pydantic_class(**dict_)
+        return self._validator.validate_python(dict_)
+
+    def validate_many(self, dicts: List[dict]) -> Tuple[List[Optional[Any]], List[ConfigValidationError]]:
+        import pydantic
+
+        if self._pydantic_v1:
+            return self._validate_each(dicts)
+        try:
+            return self._batch_validator.validate_python(dicts), []
+        except pydantic.ValidationError:
+            return self._validate_each(dicts)
+
+    def _validate_each(self, dicts: List[dict]) -> Tuple[List[Optional[Any]], List[ConfigValidationError]]:
+        import pydantic
+
+        config_data, errors = [], []
+        for index, dict_ in enumerate(dicts):
+            try:
+                config_data.append(self.validate(dict_))
+            except (pydantic.ValidationError, TypeError) as e:
+                config_data.append(None)
+                errors.append(ConfigValidationError(index, _validation_error_message(e)))
+        return config_data, errors
+
+
+def _validation_error_message(error: Exception) -> str:
+    import pydantic
+
+    if not isinstance(error, pydantic.ValidationError):
+        return str(error)
+    return "; ".join(f"{_error_location(e['loc'])}: {e['msg']}" for e in error.errors())
+
+
+@lru_cache(maxsize=None)
+def _config_json_schema_generator():
+    from pydantic.json_schema import GenerateJsonSchema
+
+    class ConfigJsonSchemaGenerator(GenerateJsonSchema):
+        def is_instance_schema(self, schema):
+            return {"title": schema["cls"].__name__}
+
+    return ConfigJsonSchemaGenerator
+
+
+@lru_cache(maxsize=None)
+def compile_config_data(config_data_type: type) -> CompiledConfigData:
+    return CompiledConfigData(config_data_type)
+
+
 @dataclass
 class ComponentConfigRegistryData:
     reference: Reference
     config_class_module: ClassImportModuler
     config_data_module: ClassImportModuler
 
-    def create_config_class(self, dict_: dict) -> Any:
+    def create_config_class(self, dict_: dict, config: Any = None) -> Any:
+        from dacite import from_dict
+
         try:
             config_data_type = self.config_data_module.create_class()
             config_class_type = self.config_class_module.create_class()
-            data = from_dict(config_data_type, dict_)
+            data = from_dict(config_data_type, dict_, config=config)
             return config_class_type(data)
         except WrongComponentConfigImporter as e:
             raise WrongComponentConfigData(f"Wrong config data at reference {self.reference} as {e}")
 
+    def compiled_config_data(self) -> CompiledConfigData:
+        try:
+            return compile_config_data(self.config_data_module.create_class())
+        except WrongComponentConfigImporter as e:
+            raise WrongComponentConfigData(f"Wrong config data at reference {self.reference} as {e}")
+
     def get_config_schema(self) -> dict:
-        config_data_type = self.config_data_module.create_class()
-        pydantic_cls = pydantic.dataclasses.dataclass(config_data_type)
-        schema = pydantic_cls.__pydantic_model__.schema()
-        return schema
+        return self.compiled_config_data().schema()
+
+    def validate_config_data(self, dict_: dict) -> Any:
+        import pydantic
+
+        try:
+            return self.compiled_config_data().validate(dict_)
+        except (pydantic.ValidationError, TypeError) as e:
+            raise WrongComponentConfigData(
+                f"Wrong config data at reference {self.reference} as {_validation_error_message(e)}"
+            )
+
+    def validate_configs(self, dicts: List[dict]) -> List[ConfigValidationError]:
+        _, errors = self.compiled_config_data().validate_many(dicts)
+        return errors
+
+    def create_config_classes(self, dicts: List[dict]) -> List[Any]:
+        config_data, errors = self.compiled_config_data().validate_many(dicts)
+        if len(errors) > 0:
+            reported_errors = "\n".join(f"config {e.index}: {e.message}" for e in errors)
+            raise WrongComponentConfigData(f"Wrong config data at reference {self.reference}:\n{reported_errors}")
+        config_class_type = self.config_class_module.create_class()
+        return [config_class_type(data) for data in config_data]
 
 
 class UnknownComponentConfigType(Exception):
@@ -1,8 +1,9 @@
 import logging
 from dataclasses import dataclass
-from typing import List
+from typing import List, Union
 
 from microgrid.config.interface import (
+    IUnitConfig,
     IGridNetworkConfig,
     Reference,
     UnknownComponentConfigType,
@@ -42,7 +43,14 @@ class MicrogridModelConfigBuilder:
     ) -> MicrogridModelConfig:
         config_registry_data = self.registry.get_component_config(reference)
         config = config_registry_data.create_config_class(data)
+        return self.add_unit_config(microgrid_config, reference, config)
 
+    def add_unit_config(
+        self,
+        microgrid_config: MicrogridModelConfig,
+        reference: Reference,
+        config: Union[IUnitConfig, IGridNetworkConfig],
+    ) -> MicrogridModelConfig:
         if reference in self.registry.get_thermal_config_references():
             microgrid_config.thermal_generator_config.append(config)
         elif reference in self.registry.get_storage_config_references():
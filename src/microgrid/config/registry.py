@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Dict, List, Tuple, Union
 
 from microgrid.config.component.grid_forming_unit import (
     default_thermal_config_registry,
@@ -15,6 +15,7 @@ from microgrid.config.interface import (
     ComponentConfigRegistryData,
     Reference,
     ClassImportModuler,
+    ConfigValidationError,
     IUnitConfig,
     IGridNetworkConfig,
 )
@@ -28,15 +29,9 @@ class IComponentRegistry:
     def validate_component_registry_data(
         component_registry: List[ComponentConfigRegistryData],
     ):
-        reference_ = [c.reference for c in component_registry]
-        config_class_module_ = [c.config_class_module for c in component_registry]
-        for i, c in enumerate(config_class_module_):
-            if c in config_class_module_[i + 1:]:
-                return False
-        if len(reference_) == len(list(set(reference_))):
-            return True
-        else:
-            return False
+        reference_ = {c.reference for c in component_registry}
+        config_class_module_ = {c.config_class_module for c in component_registry}
+        return len(reference_) == len(component_registry) and len(config_class_module_) == len(component_registry)
 
     def get_component_config_reference(self, config: Union[IUnitConfig, IGridNetworkConfig]) -> Reference:
         raise NotImplementedError
@@ -59,6 +54,22 @@ class IComponentRegistry:
     def get_grid_config_references(self) -> List[Reference]:
         raise NotImplementedError
 
+    def validate_component_configs(self, components: List[Tuple[Reference, dict]]) -> List[ConfigValidationError]:
+        indexes_by_reference: Dict[Reference, List[int]] = {}
+        errors = []
+        for index, (reference, _) in enumerate(components):
+            indexes_by_reference.setdefault(reference, []).append(index)
+
+        for reference, indexes in indexes_by_reference.items():
+            try:
+                registry_data = self.get_component_config(reference)
+            except UnknownComponentConfigType as e:
+                errors.extend(ConfigValidationError(index, str(e)) for index in indexes)
+                continue
+            reference_errors = registry_data.validate_configs([components[index][1] for index in indexes])
+            errors.extend(ConfigValidationError(indexes[e.index], e.message) for e in reference_errors)
+        return sorted(errors, key=lambda e: e.index)
+
 
 class DefaultComponentRegistry(IComponentRegistry):
     component_registry = [
@@ -74,41 +85,56 @@ class DefaultComponentRegistry(IComponentRegistry):
         if not self.validate_component_registry_data(self.component_registry):
             raise ValueError("Config registry should has unique reference and config class modules")
 
+        self._config_by_reference: Dict[Reference, ComponentConfigRegistryData] = {
+            c.reference: c for c in self.component_registry
+        }
+        self._reference_by_config_class: Dict[ClassImportModuler, Reference] = {
+            c.config_class_module: c.reference for c in self.component_registry
+        }
+        self._thermal_references = self._references_of(default_thermal_config_registry)
+        self._storage_references = self._references_of(default_storage_config_registry)
+        self._renewable_references = self._references_of(default_renewable_config_registry)
+        self._load_references = self._references_of(default_load_config_registry)
+        self._grid_references = self._references_of(
+            default_grid_network_registry, default_single_grid_network_registry
+        )
+
+    def _references_of(self, *registry_data: ComponentConfigRegistryData) -> List[Reference]:
+        return [c.reference for c in self.component_registry if any(c is data for data in registry_data)]
+
     def get_component_config_references(self):
-        return [c.reference for c in self.component_registry]
+        return list(self._config_by_reference)
 
     def get_component_config(self, reference: str) -> ComponentConfigRegistryData:
         try:
-            return [c for c in self.component_registry if c.reference == reference][0]
-        except IndexError:
+            return self._config_by_reference[reference]
+        except KeyError:
             raise UnknownComponentConfigType(f"{reference} is not part of the config registry")
 
     def get_component_config_reference(self, config: Union[IUnitConfig, IGridNetworkConfig]) -> Reference:
         class_importer = ClassImportModuler(config.__module__, config.__class__.__name__)
 
         try:
-            return [c.reference for c in self.component_registry if c.config_class_module == class_importer][0]
-        except IndexError:
-            raise UnknownComponentConfigType(f"config class {config.__name__} is not part of the config registry")
+            return self._reference_by_config_class[class_importer]
+        except KeyError:
+            raise UnknownComponentConfigType(
+                f"config class {config.__class__.__name__} is not part of the config registry"
+            )
 
     def get_thermal_config_references(self) -> List[Reference]:
-        return [c.reference for c in self.component_registry if c is default_thermal_config_registry]
+        return list(self._thermal_references)
 
     def get_storage_config_references(self) -> List[Reference]:
-        return [c.reference for c in self.component_registry if c is default_storage_config_registry]
+        return list(self._storage_references)
 
     def get_renewable_config_references(self) -> List[Reference]:
-        return [c.reference for c in self.component_registry if c is default_renewable_config_registry]
+        return list(self._renewable_references)
 
     def get_load_config_references(self) -> List[Reference]:
-        return [c.reference for c in self.component_registry if c is default_load_config_registry]
+        return list(self._load_references)
 
     def get_grid_config_references(self) -> List[Reference]:
-        return [
-            c.reference
-            for c in self.component_registry
-            if c is default_grid_network_registry or c is default_single_grid_network_registry
-        ]
+        return list(self._grid_references)
 
 
 def default_component_registry() -> DefaultComponentRegistry:
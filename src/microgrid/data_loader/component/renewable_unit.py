@@ -3,7 +3,7 @@ from microgrid.data_loader.interface import IRenewableUnitDataLoader
 from microgrid.data_loader.domain import SamplePointsToPowerTable, UnitDataLoaderError
 import logging
 
-from microgrid.shared.timeseries import SimulationTimeSeries
+from microgrid.shared.timeseries import ISimulationTimeSeries
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +13,7 @@ class RenewableUnitDataLoader(IRenewableUnitDataLoader):
         self,
         initial_timestamp: Timestamp,
         sample_point_to_power: SamplePointsToPowerTable,
-        simulation_time_series: SimulationTimeSeries,
+        simulation_time_series: ISimulationTimeSeries,
     ):
 
         power_bounds = Bounds(min=sample_point_to_power.minimum(), max=sample_point_to_power.maximum())
@@ -21,15 +21,16 @@ class RenewableUnitDataLoader(IRenewableUnitDataLoader):
         super().__init__(initial_timestamp=initial_timestamp, power_bounds=power_bounds)
 
         self._simulation_time_series = simulation_time_series
+        self._simulation_cursor = simulation_time_series.cursor()
         self._sample_point_to_power = sample_point_to_power
-        self._min_simulation_timestamp = min(simulation_time_series.timestamps)
-        self._max_simulation_timestamp = max(simulation_time_series.timestamps)
+        self._min_simulation_timestamp = simulation_time_series.start_timestamp
+        self._max_simulation_timestamp = simulation_time_series.end_timestamp
         if initial_timestamp > self._max_simulation_timestamp:
             raise UnitDataLoaderError("renewable unit simulation timestamps are " "past compared to the initial time")
 
     def get_data(self, timestamp: int):
         if self._min_simulation_timestamp <= timestamp <= self._max_simulation_timestamp:
-            sample_data = self._simulation_time_series.resample(timestamp=timestamp)
+            sample_data = self._simulation_cursor.resample(timestamp=timestamp)
             return self._sample_point_to_power.available_power_at_sample_point(sample_data)
         else:
             logger.warning("cannot get data at the timestamp")
@@ -1,18 +1,167 @@
-from typing import List
+import bisect
+import logging
+import math
+from fractions import Fraction
+from functools import lru_cache, reduce
+from typing import List, Optional, Tuple, Union
 
-from scipy.interpolate import interp1d
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAX_LOOKUP_TABLE_SIZE = 2 ** 20
+MAX_KNOT_DENOMINATOR = 10 ** 6
+DEFAULT_RELATIVE_MAX_ERROR = 1e-9
+
+
+class PowerCurveLookupTable:
+    def __init__(self, points: np.ndarray, power_values: np.ndarray, resolution: float):
+        self._points = points
+        self._power_values = power_values
+        self._maximum_point = float(points[-1])
+        self._resolution = resolution
+        size = int(np.ceil(self._maximum_point / resolution)) + 1
+        self._table_points = np.arange(max(size, 2)) * resolution
+        self._table = np.interp(self._table_points, points, power_values)
+        self._slopes = np.diff(self._table) / resolution
+        self._table_list = self._table.tolist()
+        self._slopes_list = self._slopes.tolist()
+        self._max_error = self._calculate_max_error()
+
+    @property
+    def resolution(self) -> float:
+        return self._resolution
+
+    @property
+    def size(self) -> int:
+        return len(self._table)
+
+    @property
+    def max_error(self) -> float:
+        return self._max_error
+
+    def _calculate_max_error(self) -> float:
+        # the difference of two piecewise linear curves is extreme at the break points of either curve
+        break_points = np.union1d(self._points, self._table_points[self._table_points <= self._maximum_point])
+        exact_power = np.interp(break_points, self._points, self._power_values)
+        return float(np.max(np.abs(self.evaluate_many(break_points) - exact_power)))
+
+    def evaluate(self, point: float) -> float:
+        if not 0 <= point <= self._maximum_point:
+            raise ValueError("point is not part of the table and cannot be extrapolated")
+        index = min(int(point // self._resolution), len(self._slopes_list) - 1)
+        return self._table_list[index] + self._slopes_list[index] * (point - index * self._resolution)
+
+    def evaluate_many(self, points: np.ndarray) -> np.ndarray:
+        points = np.asarray(points, dtype=float)
+        if np.any(points < 0) or np.any(points > self._maximum_point):
+            raise ValueError("points are not part of the table and cannot be extrapolated")
+        indices = np.minimum((points // self._resolution).astype(int), len(self._slopes) - 1)
+        return self._table[indices] + self._slopes[indices] * (points - indices * self._resolution)
+
+
+class PowerCurveInterpolation:
+    def __init__(self, points: np.ndarray, power_values: np.ndarray):
+        self._points = points
+        self._power_values = power_values
+        self._maximum_point = float(points[-1])
+        self._points_list = points.tolist()
+        self._power_values_list = power_values.tolist()
+
+    @property
+    def resolution(self) -> Optional[float]:
+        return None
+
+    @property
+    def size(self) -> int:
+        return len(self._points)
+
+    @property
+    def max_error(self) -> float:
+        return 0.0
+
+    def evaluate(self, point: float) -> float:
+        if not 0 <= point <= self._maximum_point:
+            raise ValueError("point is not part of the power curve and cannot be extrapolated")
+        index = min(bisect.bisect_right(self._points_list, point), len(self._points_list) - 1)
+        x_0, x_1 = self._points_list[index - 1], self._points_list[index]
+        y_0, y_1 = self._power_values_list[index - 1], self._power_values_list[index]
+        return y_0 + (y_1 - y_0) * (point - x_0) / (x_1 - x_0)
+
+    def evaluate_many(self, points: np.ndarray) -> np.ndarray:
+        points = np.asarray(points, dtype=float)
+        if np.any(points < 0) or np.any(points > self._maximum_point):
+            raise ValueError("points are not part of the power curve and cannot be extrapolated")
+        return np.interp(points, self._points, self._power_values)
+
+
+PowerCurve = Union[PowerCurveLookupTable, PowerCurveInterpolation]
+
+
+def knot_resolution(points: np.ndarray) -> float:
+    knots = [Fraction(float(p)).limit_denominator(MAX_KNOT_DENOMINATOR) for p in points]
+    denominator = reduce(lambda a, b: a * b // math.gcd(a, b), [k.denominator for k in knots], 1)
+    numerator = reduce(math.gcd, [int(k * denominator) for k in knots], 0)
+    resolution = numerator / denominator
+    if resolution <= 0 or float(points[-1]) / resolution >= MAX_LOOKUP_TABLE_SIZE:
+        return float(np.min(np.diff(points)))
+    return resolution
+
+
+@lru_cache(maxsize=128)
+def compile_power_curve(
+    points: Tuple[float, ...],
+    power_values: Tuple[float, ...],
+    resolution: Optional[float] = None,
+    max_error: Optional[float] = None,
+) -> PowerCurve:
+    points_array = np.asarray(points, dtype=float)
+    power_values_array = np.asarray(power_values, dtype=float)
+    exact = resolution is None and max_error is None
+    if resolution is None:
+        resolution = knot_resolution(points_array)
+    if resolution <= 0:
+        raise ValueError("resolution of the power curve lookup table should be positive")
+    if exact:
+        max_error = DEFAULT_RELATIVE_MAX_ERROR * max(1.0, float(np.max(np.abs(power_values_array))))
+
+    lookup_table = PowerCurveLookupTable(points_array, power_values_array, resolution)
+    while max_error is not None and lookup_table.max_error > max_error:
+        if 2 * lookup_table.size > MAX_LOOKUP_TABLE_SIZE:
+            if exact:
+                logger.info(
+                    f"power curve cannot be tabulated within {MAX_LOOKUP_TABLE_SIZE} points, "
+                    "interpolating between its knots instead"
+                )
+                return PowerCurveInterpolation(points_array, power_values_array)
+            raise ValueError(f"power curve cannot be tabulated within the error {max_error}")
+        lookup_table = PowerCurveLookupTable(points_array, power_values_array, lookup_table.resolution / 2)
+    return lookup_table
 
 
 class SamplePointsToPowerTable:
-    def __init__(self, points: List[float], power_values: List[float]):
+    def __init__(
+        self,
+        points: List[float],
+        power_values: List[float],
+        resolution: Optional[float] = None,
+        max_error: Optional[float] = None,
+    ):
         assert points[0] == 0
         assert power_values[0] == 0
         self._points = points
         self._power_values = power_values
-        try:
-            self.point_to_power_function = interp1d(x=self._points, y=self._power_values)
-        except Exception:
+        if len(points) != len(power_values):
             raise ValueError("Input data is not of the same length ")
+        if np.any(np.diff(points) <= 0):
+            raise ValueError("Sample points should be strictly increasing")
+        self._lookup_table = compile_power_curve(
+            tuple(float(p) for p in points), tuple(float(p) for p in power_values), resolution, max_error
+        )
+
+    @property
+    def lookup_table(self) -> PowerCurve:
+        return self._lookup_table
 
     def maximum(self):
         return max(self._power_values)
@@ -20,11 +169,13 @@ class SamplePointsToPowerTable:
     def minimum(self):
         return min(self._power_values)
 
-    def available_power_at_sample_point(self, point: float):
-        try:
-            return self.point_to_power_function(x=point)
-        except ValueError:
-            raise ValueError("point is not part of the table and cannot be extrapolated")
+    def available_power_at_sample_point(self, point: Union[float, np.ndarray]):
+        if np.ndim(point) > 0:
+            return self.available_power_at_sample_points(point)
+        return self._lookup_table.evaluate(point)
+
+    def available_power_at_sample_points(self, points: np.ndarray) -> np.ndarray:
+        return self._lookup_table.evaluate_many(points)
 
 
 class DuplicateUnitNameError(ValueError):
@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from common.model.component import BUS_ID
 from microgrid.config.interface import (
@@ -33,6 +33,7 @@ class MicrogridModelDataLoader:
         self._generator_bus_ids: List[BUS_ID] = []
         self._load_bus_ids: List[BUS_ID] = []
         self._unit_bus_mapper: List[UNIT_BUS_ID_MAP] = []
+        self._unit_bus_ids: Dict[str, BUS_ID] = {}
         self._thermal_generator_index: List[int] = []
         self._storage_power_plant_index: List[int] = []
         self._renewable_unit_index: List[int] = []
@@ -48,33 +49,33 @@ class MicrogridModelDataLoader:
             load_bus_ids=self._load_bus_ids,
         )
 
-    def add_demand_unit(self, unit_config: IUnitConfig, config_reference: Optional[Reference] = None):
-        bus_id = unit_config.bus_id
-        current_unit_name = [id for id, bus_id in self._unit_bus_mapper]
-        if unit_config.name not in current_unit_name:
-            load = unit_config.create_unit()
-            self._loads.append(load)
-            self._load_bus_ids.append(bus_id)
-            self._unit_bus_mapper.append((unit_config.name, bus_id))
-            self._microgrid_config_reference.load_config_reference.append(config_reference)
-        else:
+    def _check_unit_name(self, unit_config: IUnitConfig):
+        if unit_config.name in self._unit_bus_ids:
             raise DuplicateUnitNameError(f"{unit_config.name} of the unit must be unique")
 
+    def _register_unit_name(self, unit_config: IUnitConfig):
+        self._unit_bus_ids[unit_config.name] = unit_config.bus_id
+        self._unit_bus_mapper.append((unit_config.name, unit_config.bus_id))
+
+    def add_demand_unit(self, unit_config: IUnitConfig, config_reference: Optional[Reference] = None):
+        self._check_unit_name(unit_config)
+        load = unit_config.create_unit()
+        self._register_unit_name(unit_config)
+        self._loads.append(load)
+        self._load_bus_ids.append(unit_config.bus_id)
+        self._microgrid_config_reference.load_config_reference.append(config_reference)
+
     def _add_unit(
         self,
         unit_config: IGeneratorComponentConfig,
         config_reference: Optional[Reference] = None,
     ):
-        bus_id = unit_config.bus_id
-        current_unit_name = [id for id, bus_id in self._unit_bus_mapper]
-        if unit_config.name not in current_unit_name:
-            unit = unit_config.create_unit()
-            self._generators.append(unit)
-            self._generator_bus_ids.append(bus_id)
-            self._unit_bus_mapper.append((unit_config.name, bus_id))
-            self._microgrid_config_reference.generator_config_reference.append(config_reference)
-        else:
-            raise DuplicateUnitNameError(f"{unit_config.name} of the unit must be unique")
+        self._check_unit_name(unit_config)
+        unit = unit_config.create_unit()
+        self._register_unit_name(unit_config)
+        self._generators.append(unit)
+        self._generator_bus_ids.append(unit_config.bus_id)
+        self._microgrid_config_reference.generator_config_reference.append(config_reference)
 
     def add_thermal_power_plant(
         self,
@@ -147,13 +148,8 @@ class MicrogridModelDataLoader:
         return self._microgrid_config_reference.grid_config_reference
 
     def get_component_bus_id(self, generator_id: str):
-        generator_name = [g.name for g in self._generators]
-        load_name = [g.name for g in self._loads]
         try:
-            if generator_id in generator_name:
-                return self._generator_bus_ids[generator_name.index(generator_id)]
-            else:
-                return self._load_bus_ids[load_name.index(generator_id)]
-        except ValueError:
+            return self._unit_bus_ids[generator_id]
+        except KeyError:
             logger.warning(f"{generator_id} is in the microgrid model")
             return None
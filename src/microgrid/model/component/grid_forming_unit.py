@@ -1,5 +1,7 @@
 import logging
 
+import numpy as np
+
 from common.model.component import (
     ComponentType,
     ControlComponentData,
@@ -16,6 +18,13 @@ from microgrid.shared.simulation_data import ComponentSimulationData
 
 logger = logging.getLogger(__name__)
 
+STORAGE_SIMULATION_DATA_DTYPE = np.dtype(
+    [("current_energy", float), ("power_sharing", float), ("power_setpoint", float), ("current_power", float)]
+)
+THERMAL_SIMULATION_DATA_DTYPE = np.dtype(
+    [("power_setpoint", float), ("power_sharing", float), ("current_power", float), ("switch_state", bool)]
+)
+
 
 class GridFormingPowerUnit(IGeneratorComponent):
     def __init__(self, name: str, data_loader: IGeneratorDataLoader):
@@ -86,6 +95,16 @@ class StoragePowerPlant(GridFormingPowerUnit):
 
         return ComponentSimulationData(self._name, values=values)
 
+    @property
+    def simulation_data_dtype(self) -> np.dtype:
+        return STORAGE_SIMULATION_DATA_DTYPE
+
+    def write_simulation_record(self, record: np.void):
+        record["current_energy"] = self.current_energy
+        record["power_sharing"] = self.power_sharing
+        record["power_setpoint"] = self.power_setpoint
+        record["current_power"] = self.current_power
+
 
 class ThermalGenerator(GridFormingPowerUnit):
     def __init__(self, name: str, data_loader: ThermalGeneratorDataLoader):
@@ -147,3 +166,13 @@ class ThermalGenerator(GridFormingPowerUnit):
         }
 
         return ComponentSimulationData(name=self._name, values=values)
+
+    @property
+    def simulation_data_dtype(self) -> np.dtype:
+        return THERMAL_SIMULATION_DATA_DTYPE
+
+    def write_simulation_record(self, record: np.void):
+        record["power_setpoint"] = self.power_setpoint
+        record["power_sharing"] = self.power_sharing
+        record["current_power"] = self.current_power
+        record["switch_state"] = self.switch_state
@@ -1,5 +1,5 @@
 import logging
-from typing import List
+from typing import List, Optional
 
 from common.model.component import (
     ComponentType,
@@ -13,7 +13,8 @@ from microgrid.shared.simulation_data import ComponentSimulationData
 import numpy as np
 
 from microgrid.model.component_interface import IGridNetwork
-from common.model.grid_network_util import GridNetworkUtils
+from common.model.grid_network_util import GridNetworkUtils, DCPowerFlowSolver
+from common.model.grid_topology import GridTopologyIndex
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,14 @@ class GridNetwork(IGridNetwork):
         self._data_loader = data_loader
         self._bus_power = np.array([])
         self._component_type = ComponentType.Grid
+        self._buses = data_loader.buses()
+        self._bus_index = GridNetworkUtils.get_bus_index(self._buses)
+        self._admittance_matrix = None
+        self._dc_power_flow_matrix = None
+        self._power_flow_solver: Optional[DCPowerFlowSolver] = None
+        self._line_status = np.ones(len(self.grid_lines), dtype=bool)
+        self._topology = GridTopologyIndex(self.grid_lines, buses=self._buses)
+        self._simulation_data_dtype: Optional[np.dtype] = None
         if not data_loader.check_grid_network_connected():
             logger.warning("grid network is not connected and therefore cannot form")
             self._validate_flag = False
@@ -32,11 +41,13 @@ class GridNetwork(IGridNetwork):
             self._validate_flag = True
             num_grid_lines = len(self.grid_lines)
             num_buses = len(self.buses)
-            self._admittance_matrix = GridNetworkUtils.calculate_admittance_matrix(self.buses, self.grid_lines)
-            self._dc_power_flow_matrix = GridNetworkUtils.calculate_dc_power_flow_matrix(self.buses, self.grid_lines)
+            self._power_flow_solver = DCPowerFlowSolver(self.buses, self.grid_lines)
             self._current_power = np.zeros(num_grid_lines)
             self._data_loader = data_loader
             self._bus_power = np.zeros(num_buses)
+            self._simulation_data_dtype = np.dtype(
+                [("current_power", float, (num_grid_lines,)), ("bus_power", float, (num_buses,))]
+            )
 
     @property
     def data_loader(self):
@@ -44,28 +55,49 @@ class GridNetwork(IGridNetwork):
 
     @property
     def buses(self):
-        return self._data_loader.buses()
+        return self._buses
 
     @property
     def grid_lines(self) -> List[GridLine]:
         return self._data_loader.grid_lines
 
+    @property
+    def active_grid_lines(self) -> List[GridLine]:
+        return [line for line, status in zip(self.grid_lines, self._line_status) if status]
+
+    @property
+    def line_status(self) -> np.ndarray:
+        return self._line_status
+
     @property
     def control_component_data(self) -> GridControlComponentData:
         return GridControlComponentData(
             name=self.name,
             component_type=self.component_type,
-            grid_lines=self.grid_lines,
+            grid_lines=self.active_grid_lines,
         )
 
     @property
-    def admittance_matrix(self) -> np.mat:
+    def admittance_matrix(self) -> np.ndarray:
+        if self._admittance_matrix is None:
+            self._admittance_matrix = GridNetworkUtils.calculate_admittance_matrix(
+                self.buses, self.active_grid_lines
+            )
         return self._admittance_matrix
 
     @property
-    def dc_power_flow_matrix(self) -> np.mat:
+    def dc_power_flow_matrix(self) -> np.ndarray:
+        if self._dc_power_flow_matrix is None:
+            if self._power_flow_solver is not None and len(self.grid_lines) > 0:
+                self._dc_power_flow_matrix = self._power_flow_solver.dc_power_flow_matrix()
+            else:
+                self._dc_power_flow_matrix = np.array([])
         return self._dc_power_flow_matrix
 
+    @property
+    def power_flow_solver(self) -> DCPowerFlowSolver:
+        return self._power_flow_solver
+
     def validate_grid_model(self) -> bool:
         return self._validate_flag
 
@@ -75,7 +107,7 @@ class GridNetwork(IGridNetwork):
 
     def set_bus_power(self, bus_id: BUS_ID, power: float):
         try:
-            self._bus_power[self.buses.index(bus_id)] = power
+            self._bus_power[self._bus_index[bus_id]] = power
         except Exception:
             raise UnknownComponentError("Bus id not in the grid model")
 
@@ -92,19 +124,63 @@ class GridNetwork(IGridNetwork):
     def get_bus_grid_line(self, bus_id: BUS_ID) -> List[GridLine]:
         return [line for line in self.grid_lines if line.is_connected_to_bus(bus_id)]
 
-    def calculate_line_power(self):
-        power = self._bus_power
-        if len(self.grid_lines) > 0:
-            line_power = np.zeros(len(self.grid_lines))
+    def _get_line_index(self, grid_line: GridLine) -> int:
+        try:
+            return self.grid_lines.index(grid_line)
+        except ValueError:
+            raise UnknownComponentError(f"line {grid_line.from_bus}-{grid_line.to_bus} not in the grid model")
 
-            phase_angle = self._dc_power_flow_matrix @ power.T
-            phase_angle[0] = 0
+    @property
+    def topology(self) -> GridTopologyIndex:
+        return self._topology
+
+    def _set_line_index_status(self, line_index: int, status: bool):
+        if self._line_status[line_index] == status:
+            return
+
+        grid_line = self.grid_lines[line_index]
+        self._line_status[line_index] = status
+        self._admittance_matrix = None
+        self._dc_power_flow_matrix = None
+        if status:
+            self._topology.add_line(grid_line)
+        else:
+            self._topology.remove_line(grid_line)
 
-            for count, line in enumerate(self.grid_lines):
-                to_bus_index = self.buses.index(line.to_bus)
-                from_bus_index = self.buses.index(line.from_bus)
-                line_power[count] = line.admittance * (phase_angle[from_bus_index] - phase_angle[to_bus_index])
-            return line_power
+        if not self._topology.is_connected():
+            logger.warning(f"grid network {self.name} is islanded after switching the line")
+            self._power_flow_solver = None
+            self._validate_flag = False
+        elif self._power_flow_solver is None:
+            self._power_flow_solver = DCPowerFlowSolver(self.buses, self.grid_lines, line_status=self._line_status)
+            self._validate_flag = True
+        else:
+            self._power_flow_solver.set_line_status(line_index, status)
+            self._validate_flag = True
+
+    def remove_line(self, grid_line: GridLine):
+        self._set_line_index_status(self._get_line_index(grid_line), False)
+
+    def restore_line(self, grid_line: GridLine):
+        self._set_line_index_status(self._get_line_index(grid_line), True)
+
+    def set_line_status(self, line_status: np.ndarray):
+        for line_index in np.flatnonzero(self._line_status != np.asarray(line_status, dtype=bool)):
+            self._set_line_index_status(line_index, not self._line_status[line_index])
+
+    def fork(self) -> "GridNetwork":
+        grid_network = super().fork()
+        grid_network._bus_power = self._bus_power.copy()
+        grid_network._current_power = np.array(self._current_power)
+        grid_network._line_status = self._line_status.copy()
+        grid_network._topology = self._topology.copy()
+        if self._power_flow_solver is not None:
+            grid_network._power_flow_solver = self._power_flow_solver.copy()
+        return grid_network
+
+    def calculate_line_power(self):
+        if len(self.grid_lines) > 0:
+            return self._power_flow_solver.line_power(self._bus_power)
         else:
             return np.array([])
 
@@ -120,3 +196,11 @@ class GridNetwork(IGridNetwork):
     def current_simulation_data(self) -> ComponentSimulationData:
         values = {"current_power": self._current_power, "bus_power": self.buses_power}
         return ComponentSimulationData(name=self._name, values=values)
+
+    @property
+    def simulation_data_dtype(self) -> Optional[np.dtype]:
+        return self._simulation_data_dtype
+
+    def write_simulation_record(self, record: np.void):
+        record["current_power"] = self._current_power
+        record["bus_power"] = self._bus_power
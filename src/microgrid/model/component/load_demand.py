@@ -1,5 +1,7 @@
 import logging
 
+import numpy as np
+
 from common.model.component import ComponentType, ControlComponentData
 from microgrid.data_loader.interface import ILoadDemandDataLoader
 from microgrid.model.component_interface import IComponent
@@ -7,6 +9,8 @@ from microgrid.shared.simulation_data import ComponentSimulationData
 
 logger = logging.getLogger("__name__")
 
+LOAD_SIMULATION_DATA_DTYPE = np.dtype([("current_power", float)])
+
 
 class LoadDemand(IComponent):
     def __init__(self, name: str, data_loader: ILoadDemandDataLoader):
@@ -23,6 +27,13 @@ class LoadDemand(IComponent):
         values = {"current_power": self._current_power}
         return ComponentSimulationData(self._name, values=values)
 
+    @property
+    def simulation_data_dtype(self) -> np.dtype:
+        return LOAD_SIMULATION_DATA_DTYPE
+
+    def write_simulation_record(self, record: np.void):
+        record["current_power"] = self._current_power
+
     def step(self, timestamp: int):
         self._check_step_timestamp(timestamp)
         self._current_power = self._data_loader.get_data(timestamp)
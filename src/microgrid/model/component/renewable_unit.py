@@ -3,11 +3,17 @@ from microgrid.data_loader.interface import IRenewableUnitDataLoader
 from microgrid.model.generator_interface import IGeneratorComponent
 import logging
 
+import numpy as np
+
 from microgrid.shared.simulation_data import ComponentSimulationData
 from microgrid.shared.timeseries import Timestamp
 
 logger = logging.getLogger(__name__)
 
+RENEWABLE_SIMULATION_DATA_DTYPE = np.dtype(
+    [("current_power", float), ("available_power", float), ("power_setpoint", float)]
+)
+
 
 class RenewablePowerUnit(IGeneratorComponent):
     def __init__(self, name: str, data_loader: IRenewableUnitDataLoader):
@@ -41,3 +47,12 @@ class RenewablePowerUnit(IGeneratorComponent):
             "power_setpoint": self._power_setpoint,
         }
         return ComponentSimulationData(self._name, values=values)
+
+    @property
+    def simulation_data_dtype(self) -> np.dtype:
+        return RENEWABLE_SIMULATION_DATA_DTYPE
+
+    def write_simulation_record(self, record: np.void):
+        record["current_power"] = self._current_power
+        record["available_power"] = self._available_power
+        record["power_setpoint"] = self._power_setpoint
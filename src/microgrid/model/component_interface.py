@@ -1,3 +1,8 @@
+import copy
+from typing import Optional
+
+import numpy as np
+
 from common.model.component import (
     ComponentType,
     ControlComponentData,
@@ -7,7 +12,7 @@ from common.model.component import (
 from microgrid.model.exception import StepPreviousTimestamp
 from microgrid.shared.simulation_data import ComponentSimulationData
 from microgrid.shared.data_loader import IComponentDataLoader
-from microgrid.shared.storage import IComponentDataStorage
+from microgrid.shared.storage import IComponentDataStorage, IRecordDataStorage
 from microgrid.shared.timeseries import Timestamp
 
 
@@ -49,9 +54,21 @@ class IComponent:
     def current_timestamp(self):
         return self._current_timestamp
 
+    @property
+    def simulation_data_dtype(self) -> Optional[np.dtype]:
+        return None
+
+    def write_simulation_record(self, record: np.void):
+        for field, value in self.current_simulation_data().values.items():
+            record[field] = value
+
     def add_simulation_data(self, data_storage: IComponentDataStorage):
-        data = self.current_simulation_data()
-        data_storage.add_simulation_data(current_timestamp=self._current_timestamp, data=data)
+        dtype = self.simulation_data_dtype
+        if dtype is not None and isinstance(data_storage, IRecordDataStorage):
+            self.write_simulation_record(data_storage.next_record(self._name, self._current_timestamp, dtype))
+        else:
+            data = self.current_simulation_data()
+            data_storage.add_simulation_data(current_timestamp=self._current_timestamp, data=data)
 
     def _check_step_timestamp(self, timestamp: int):
         if timestamp <= self._current_timestamp:
@@ -61,6 +78,9 @@ class IComponent:
     def current_simulation_data(self) -> ComponentSimulationData:
         raise NotImplementedError
 
+    def fork(self) -> "IComponent":
+        return copy.copy(self)
+
     def get_simulation_data(self, timestamp: int, data_storage: IComponentDataStorage):
         data_storage.get_historical_data(self._name, since=timestamp)
 
@@ -79,3 +99,10 @@ class IGridNetwork(IComponent):
 
     def set_bus_power(self, bus_id: BUS_ID, power: float):
         raise NotImplementedError
+
+    @property
+    def line_status(self) -> np.ndarray:
+        raise NotImplementedError
+
+    def set_line_status(self, line_status: np.ndarray):
+        raise NotImplementedError
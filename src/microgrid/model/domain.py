@@ -62,3 +62,17 @@ class MicrogridModelData:
             _unit_bus_mat[count + num_generators, bus_id_index] = 1
 
         return _unit_bus_mat
+
+
+@dataclass(frozen=True)
+class MicrogridModelSnapshot:
+    timestamps: np.ndarray
+    current_power: np.ndarray
+    power_setpoint: np.ndarray
+    power_sharing: np.ndarray
+    storage_energy: np.ndarray
+    thermal_switch_state: np.ndarray
+    renewable_available_power: np.ndarray
+    bus_power: np.ndarray
+    line_power: np.ndarray
+    line_status: np.ndarray
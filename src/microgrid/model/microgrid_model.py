@@ -3,8 +3,8 @@ from functools import cached_property
 from typing import List
 import numpy as np
 
-from common.model.component import ControlComponentData
-from microgrid.model.domain import MicrogridModelData
+from common.model.component import ControlComponentData, ComponentType
+from microgrid.model.domain import MicrogridModelData, MicrogridModelSnapshot
 from microgrid.model.exception import (
     StepPreviousTimestamp,
     UnknownComponentError,
@@ -15,6 +15,8 @@ from microgrid.shared.storage import IComponentDataStorage
 
 logger = logging.getLogger(__name__)
 
+RENEWABLE_COMPONENT_TYPES = (ComponentType.Renewable, ComponentType.PV, ComponentType.WIND)
+
 
 class MicrogridModel:
     def __init__(self, microgrid_model_data: MicrogridModelData):
@@ -26,6 +28,15 @@ class MicrogridModel:
             self._unit_to_bus = microgrid_model_data.unit_bus_matrix()
             self._generator_ids = [g.name for g in self._model_data.generators]
             self._load_ids = [g.name for g in self._model_data.loads]
+            self._storage_units = [
+                g for g in self._model_data.generators if g.component_type == ComponentType.Storage
+            ]
+            self._thermal_units = [
+                g for g in self._model_data.generators if g.component_type == ComponentType.Thermal
+            ]
+            self._renewable_units = [
+                g for g in self._model_data.generators if g.component_type in RENEWABLE_COMPONENT_TYPES
+            ]
         else:
             raise MicrogirdModellingError(f"Microgrid data is not valid at " f"{microgrid_model_data.name}")
 
@@ -122,6 +133,71 @@ class MicrogridModel:
             logger.warning("sum of droop gain inverse is zero.")
             return 0
 
+    def snapshot(self) -> MicrogridModelSnapshot:
+        units = self.generators + self.loads
+        return MicrogridModelSnapshot(
+            timestamps=np.array([unit._current_timestamp for unit in units + [self.grid_model]]),
+            current_power=self.current_power,
+            power_setpoint=np.array([unit._power_setpoint for unit in self.generators], dtype=float),
+            power_sharing=np.array([unit._power_sharing for unit in self.generators], dtype=float),
+            storage_energy=np.array([unit._current_energy for unit in self._storage_units], dtype=float),
+            thermal_switch_state=np.array([unit._switch_state for unit in self._thermal_units], dtype=bool),
+            renewable_available_power=np.array(
+                [unit._available_power for unit in self._renewable_units], dtype=float
+            ),
+            bus_power=np.array(self.grid_model._bus_power, dtype=float),
+            line_power=np.array(self.grid_model._current_power, dtype=float),
+            line_status=np.array(self.grid_model.line_status, dtype=bool),
+        )
+
+    def restore(self, snapshot: MicrogridModelSnapshot):
+        units = self.generators + self.loads
+        if (
+            len(snapshot.timestamps) != len(units) + 1 or
+            len(snapshot.storage_energy) != len(self._storage_units) or
+            len(snapshot.thermal_switch_state) != len(self._thermal_units) or
+            len(snapshot.renewable_available_power) != len(self._renewable_units)
+        ):
+            raise MicrogirdModellingError(f"snapshot does not match the components of the microgrid {self.name}")
+
+        for unit, timestamp, power in zip(units, snapshot.timestamps.tolist(), snapshot.current_power.tolist()):
+            unit._current_timestamp = timestamp
+            unit._current_power = power
+
+        for unit, power_setpoint, power_sharing in zip(
+            self.generators, snapshot.power_setpoint.tolist(), snapshot.power_sharing.tolist()
+        ):
+            unit._power_setpoint = power_setpoint
+            unit._power_sharing = power_sharing
+
+        for unit, energy in zip(self._storage_units, snapshot.storage_energy.tolist()):
+            unit._current_energy = energy
+
+        for unit, switch_state in zip(self._thermal_units, snapshot.thermal_switch_state.tolist()):
+            unit._switch_state = switch_state
+
+        for unit, available_power in zip(self._renewable_units, snapshot.renewable_available_power.tolist()):
+            unit._available_power = available_power
+        self.__dict__.pop("sum_inverse_droop_gain", None)
+
+        self.grid_model._current_timestamp = snapshot.timestamps.tolist()[-1]
+        self.grid_model._bus_power = snapshot.bus_power.copy()
+        self.grid_model._current_power = snapshot.line_power.copy()
+        self.grid_model.set_line_status(snapshot.line_status)
+
+    def fork(self) -> "MicrogridModel":
+        model_data = MicrogridModelData(
+            name=self.name,
+            generators=[unit.fork() for unit in self.generators],
+            loads=[unit.fork() for unit in self.loads],
+            grid_model=self.grid_model.fork(),
+            generator_bus_ids=self._generator_bus_ids,
+            load_bus_ids=self._load_bus_ids,
+        )
+        model = MicrogridModel(model_data)
+        model.restore(self.snapshot())
+        return model
+
     def step(self, timestamp: int):
         try:
             for load in self.loads:
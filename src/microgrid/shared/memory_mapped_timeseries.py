@@ -0,0 +1,144 @@
+import os
+from typing import List, Optional, Union
+
+import numpy as np
+
+from common.timeseries.domain import Timestamp
+from microgrid.shared.timeseries import (
+    ISimulationTimeSeries,
+    SimulationTimeSeries,
+    SimulationTimeseriesError,
+)
+
+TIMESTAMPS_FILE = "timestamps.npy"
+VALUES_FILE = "values.npy"
+
+
+class MemoryMappedTimeSeries(ISimulationTimeSeries):
+    def __init__(self, directory: str, window_size: int = 4096):
+        self._directory = directory
+        self._window_size = max(window_size, 2)
+        self._open()
+
+    def _open(self):
+        try:
+            self._timestamps = np.load(os.path.join(self._directory, TIMESTAMPS_FILE), mmap_mode="r")
+            self._values = np.load(os.path.join(self._directory, VALUES_FILE), mmap_mode="r")
+            assert self._timestamps.ndim == 1 and self._values.ndim == 1, \
+                "timestamps and values should be one dimensional"
+            assert len(self._timestamps) == len(self._values), "timestamps and values should have the same length"
+            assert len(self._timestamps) >= 2, "at least two samples are needed to interpolate"
+        except (OSError, ValueError, AssertionError) as err:
+            raise SimulationTimeseriesError(f"{err}")
+        self._window: Optional[SimulationTimeSeries] = None
+        self._window_start = 0
+        self._window_stop = 0
+
+    def __getstate__(self):
+        return {"directory": self._directory, "window_size": self._window_size}
+
+    def __setstate__(self, state):
+        self._directory = state["directory"]
+        self._window_size = state["window_size"]
+        self._open()
+
+    def file_fingerprint(self) -> dict:
+        fingerprint = {}
+        for file_name in (TIMESTAMPS_FILE, VALUES_FILE):
+            file_stat = os.stat(os.path.join(self._directory, file_name))
+            fingerprint[file_name] = [file_stat.st_size, file_stat.st_mtime_ns]
+        return fingerprint
+
+    @classmethod
+    def create(
+        cls,
+        directory: str,
+        timestamps: Union[List[Timestamp], np.ndarray],
+        values: Union[List[float], np.ndarray],
+        window_size: int = 4096,
+    ) -> "MemoryMappedTimeSeries":
+        timestamps = np.asarray(timestamps)
+        if np.any(np.diff(timestamps) <= 0):
+            raise SimulationTimeseriesError("timestamps of a memory mapped timeseries should be strictly increasing")
+
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, TIMESTAMPS_FILE), timestamps)
+        np.save(os.path.join(directory, VALUES_FILE), np.asarray(values, dtype=float))
+        return cls(directory, window_size=window_size)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def start_timestamp(self) -> float:
+        return float(self._timestamps[0])
+
+    @property
+    def end_timestamp(self) -> float:
+        return float(self._timestamps[-1])
+
+    def __len__(self) -> int:
+        return len(self._timestamps)
+
+    def _segment_indices(self, timestamps: np.ndarray) -> np.ndarray:
+        indices = np.searchsorted(self._timestamps, timestamps, side="right") - 1
+        return np.clip(indices, 0, len(self._timestamps) - 2)
+
+    def load_window(self, timestamp: Timestamp) -> SimulationTimeSeries:
+        index = int(self._segment_indices(np.asarray(timestamp, dtype=float)))
+        start = max(min(index - self._window_size // 4, len(self) - self._window_size), 0)
+        stop = min(start + self._window_size, len(self))
+        self._window = SimulationTimeSeries(
+            np.array(self._timestamps[start:stop], dtype=float), np.array(self._values[start:stop], dtype=float)
+        )
+        self._window_start = start
+        self._window_stop = stop
+        return self._window
+
+    def _covers(self, timestamp: Timestamp) -> bool:
+        window = self._window
+        if window is None:
+            return False
+        return (
+            (window.start_timestamp <= timestamp or self._window_start == 0) and
+            (timestamp <= window.end_timestamp or self._window_stop == len(self))
+        )
+
+    def resample(self, timestamp: Union[Timestamp, np.ndarray]):
+        if np.ndim(timestamp) > 0:
+            return self.resample_many(timestamp)
+        if not self._covers(timestamp):
+            self.load_window(timestamp)
+        return self._window.resample(timestamp)
+
+    def resample_many(self, timestamps: Union[List[Timestamp], np.ndarray]) -> np.ndarray:
+        timestamps = np.asarray(timestamps, dtype=float)
+        indices = self._segment_indices(timestamps)
+        x_start = self._timestamps[indices].astype(float)
+        x_end = self._timestamps[indices + 1].astype(float)
+        y_start = self._values[indices]
+        y_end = self._values[indices + 1]
+        return y_start + (y_end - y_start) / (x_end - x_start) * (timestamps - x_start)
+
+    def cursor(self) -> "MemoryMappedTimeSeriesCursor":
+        return MemoryMappedTimeSeriesCursor(MemoryMappedTimeSeries(self._directory, window_size=self._window_size))
+
+
+class MemoryMappedTimeSeriesCursor:
+    def __init__(self, time_series: MemoryMappedTimeSeries):
+        self._time_series = time_series
+        self._window_cursor = None
+
+    def resample(self, timestamp: Timestamp) -> float:
+        if self._window_cursor is None or not self._time_series._covers(timestamp):
+            self._window_cursor = self._time_series.load_window(timestamp).cursor()
+        return self._window_cursor.resample(timestamp)
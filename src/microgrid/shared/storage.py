@@ -1,5 +1,7 @@
 from typing import List
 
+import numpy as np
+
 from microgrid.shared.simulation_data import ComponentSimulationData
 
 
@@ -9,3 +11,8 @@ class IComponentDataStorage:
 
     def get_historical_data(self, unit_id: str, since: int, until: int = None) -> List[ComponentSimulationData]:
         raise NotImplementedError
+
+
+class IRecordDataStorage(IComponentDataStorage):
+    def next_record(self, unit_id: str, current_timestamp: int, dtype: np.dtype) -> np.void:
+        raise NotImplementedError
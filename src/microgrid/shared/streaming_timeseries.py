@@ -0,0 +1,226 @@
+import csv
+import os
+import queue
+import threading
+from typing import Iterable, Iterator, Optional, Tuple, Union, List
+
+import numpy as np
+import pandas as pd
+
+from common.timeseries.domain import Timestamp
+from microgrid.shared.timeseries import (
+    ISimulationTimeSeries,
+    SimulationTimeSeries,
+    SimulationTimeseriesError,
+)
+
+TIMESERIES_CHUNK = Tuple[np.ndarray, np.ndarray]
+_END_OF_STREAM = object()
+
+
+def prefetch(chunks: Iterable, buffer_size: int = 1) -> Iterator:
+    buffer = queue.Queue(maxsize=max(buffer_size, 1))
+    stop = threading.Event()
+
+    def _put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce():
+        try:
+            for chunk in chunks:
+                if not _put(chunk):
+                    return
+            _put(_END_OF_STREAM)
+        except Exception as err:
+            _put(err)
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+class ITimeSeriesChunkReader:
+    def __iter__(self) -> Iterator[TIMESERIES_CHUNK]:
+        raise NotImplementedError
+
+    def first_timestamp(self) -> float:
+        raise NotImplementedError
+
+    def last_timestamp(self) -> float:
+        raise NotImplementedError
+
+
+class CsvChunkReader(ITimeSeriesChunkReader):
+    def __init__(self, path: str, timestamp_column: str, value_column: str, chunk_size: int = 100000):
+        self._path = path
+        self._timestamp_column = timestamp_column
+        self._value_column = value_column
+        self._chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[TIMESERIES_CHUNK]:
+        for frame in pd.read_csv(
+            self._path, usecols=[self._timestamp_column, self._value_column], chunksize=self._chunk_size
+        ):
+            yield (
+                frame[self._timestamp_column].to_numpy(dtype=float),
+                frame[self._value_column].to_numpy(dtype=float),
+            )
+
+    def first_timestamp(self) -> float:
+        frame = pd.read_csv(self._path, usecols=[self._timestamp_column], nrows=1)
+        return float(frame[self._timestamp_column].iloc[0])
+
+    def last_timestamp(self) -> float:
+        with open(self._path, "r", newline="") as f:
+            header = next(csv.reader([f.readline()]))
+        timestamp_index = header.index(self._timestamp_column)
+
+        with open(self._path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            tail = b""
+            while position > 0 and len(tail.strip().splitlines()) < 2:
+                step = min(4096, position)
+                position -= step
+                f.seek(position)
+                tail = f.read(step) + tail
+        last_line = tail.strip().splitlines()[-1].decode()
+        return float(next(csv.reader([last_line]))[timestamp_index])
+
+
+class ParquetChunkReader(ITimeSeriesChunkReader):
+    def __init__(self, path: str, timestamp_column: str, value_column: str, chunk_size: int = 100000):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SimulationTimeseriesError("pyarrow is needed to stream parquet files")
+        self._parquet_file = pq.ParquetFile(path)
+        self._timestamp_column = timestamp_column
+        self._value_column = value_column
+        self._chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[TIMESERIES_CHUNK]:
+        for batch in self._parquet_file.iter_batches(
+            batch_size=self._chunk_size, columns=[self._timestamp_column, self._value_column]
+        ):
+            yield (
+                batch.column(self._timestamp_column).to_numpy().astype(float),
+                batch.column(self._value_column).to_numpy().astype(float),
+            )
+
+    def _column_statistics(self, row_group: int):
+        metadata = self._parquet_file.metadata.row_group(row_group)
+        for column in range(metadata.num_columns):
+            if metadata.column(column).path_in_schema == self._timestamp_column:
+                return metadata.column(column).statistics
+        raise SimulationTimeseriesError(f"column {self._timestamp_column} is not in the parquet file")
+
+    def first_timestamp(self) -> float:
+        return float(self._column_statistics(0).min)
+
+    def last_timestamp(self) -> float:
+        return float(self._column_statistics(self._parquet_file.metadata.num_row_groups - 1).max)
+
+
+class StreamingTimeSeries(ISimulationTimeSeries):
+    def __init__(self, reader: ITimeSeriesChunkReader, prefetch_chunks: int = 1):
+        self._reader = reader
+        self._prefetch_chunks = prefetch_chunks
+        self._start_timestamp: Optional[float] = None
+        self._end_timestamp: Optional[float] = None
+        self._reset()
+
+    def _reset(self):
+        self._chunks: Optional[Iterator[TIMESERIES_CHUNK]] = None
+        self._window: Optional[SimulationTimeSeries] = None
+        self._window_end_value: Optional[float] = None
+        self._first_window = True
+        self._last_window = False
+
+    def _restart(self):
+        if self._chunks is not None:
+            self._chunks.close()
+        self._reset()
+
+    def _next_window(self) -> bool:
+        if self._chunks is None:
+            self._chunks = prefetch(self._reader, self._prefetch_chunks)
+
+        timestamps, values = [], []
+        if self._window is not None:
+            timestamps.append([self._window.end_timestamp])
+            values.append([self._window_end_value])
+        number_samples, has_new_samples = len(timestamps), False
+        while number_samples < 2:
+            try:
+                chunk_timestamps, chunk_values = next(self._chunks)
+            except StopIteration:
+                break
+            timestamps.append(chunk_timestamps)
+            values.append(chunk_values)
+            number_samples += len(chunk_timestamps)
+            has_new_samples = has_new_samples or len(chunk_timestamps) > 0
+
+        if not has_new_samples:
+            self._last_window = True
+            return False
+
+        if self._window is not None:
+            self._first_window = False
+        timestamps, values = np.concatenate(timestamps), np.concatenate(values)
+        self._window = SimulationTimeSeries(timestamps, values)
+        self._window_end_value = float(values[-1])
+        return True
+
+    @property
+    def start_timestamp(self) -> float:
+        if self._start_timestamp is None:
+            self._start_timestamp = self._reader.first_timestamp()
+        return self._start_timestamp
+
+    @property
+    def end_timestamp(self) -> float:
+        if self._end_timestamp is None:
+            self._end_timestamp = self._reader.last_timestamp()
+        return self._end_timestamp
+
+    def resample(self, timestamp: Union[Timestamp, np.ndarray]):
+        if np.ndim(timestamp) > 0:
+            return self.resample_many(timestamp)
+
+        if self._window is None and not self._next_window():
+            raise SimulationTimeseriesError("streamed timeseries does not contain any samples")
+
+        if timestamp < self._window.start_timestamp and not self._first_window:
+            self._restart()
+            self._next_window()
+
+        while timestamp > self._window.end_timestamp and not self._last_window:
+            self._next_window()
+
+        return self._window.resample(timestamp)
+
+    def resample_many(self, timestamps: Union[List[Timestamp], np.ndarray]) -> np.ndarray:
+        timestamps = np.asarray(timestamps, dtype=float)
+        order = np.argsort(timestamps, kind="stable")
+        values = np.empty(timestamps.shape)
+        values[order] = [self.resample(t) for t in timestamps[order]]
+        return values
+
+    def cursor(self) -> "StreamingTimeSeries":
+        return StreamingTimeSeries(self._reader, self._prefetch_chunks)
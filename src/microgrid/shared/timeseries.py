@@ -1,26 +1,117 @@
-from typing import List
+from bisect import bisect_right
+from typing import List, Union
 
-from scipy.interpolate import interp1d
+import numpy as np
 
 from common.timeseries.domain import Timestamp
 
 
-class SimulationTimeSeries:
+class ISimulationTimeSeries:
+    @property
+    def start_timestamp(self) -> float:
+        raise NotImplementedError
+
+    @property
+    def end_timestamp(self) -> float:
+        raise NotImplementedError
+
+    def resample(self, timestamp: Union[Timestamp, np.ndarray]):
+        raise NotImplementedError
+
+    def resample_many(self, timestamps: Union[List[Timestamp], np.ndarray]) -> np.ndarray:
+        raise NotImplementedError
+
+    def cursor(self):
+        raise NotImplementedError
+
+
+class SimulationTimeSeries(ISimulationTimeSeries):
     def __init__(self, timestamps: List[Timestamp], values: List[float]):
         try:
             self.timestamps = timestamps
             self.values = values
-            self._function = interp1d(
-                x=self.timestamps,
-                y=self.values,
-                kind="linear",
-                fill_value="extrapolate",
-            )
+            x = np.asarray(timestamps, dtype=float)
+            y = np.asarray(values, dtype=float)
+            assert x.ndim == 1 and y.ndim == 1, "timestamps and values should be one dimensional"
+            assert len(x) == len(y), "timestamps and values should have the same length"
+            assert len(x) >= 2, "at least two samples are needed to interpolate"
         except Exception as err:
             raise SimulationTimeseriesError(f"{err}")
 
-    def resample(self, timestamp: Timestamp):
-        return self._function(timestamp)
+        order = np.argsort(x, kind="stable")
+        self._x = x[order]
+        self._y = y[order]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._slopes = np.diff(self._y) / np.diff(self._x)
+        self._x_list = self._x.tolist()
+        self._y_list = self._y.tolist()
+        self._slopes_list = self._slopes.tolist()
+
+        steps = np.diff(self._x)
+        self._start = self._x_list[0]
+        self._step = steps[0] if steps[0] > 0 and np.allclose(steps, steps[0], rtol=0, atol=1e-9) else None
+
+    @property
+    def start_timestamp(self) -> float:
+        return self._x_list[0]
+
+    @property
+    def end_timestamp(self) -> float:
+        return self._x_list[-1]
+
+    @property
+    def is_uniform(self) -> bool:
+        return self._step is not None
+
+    def _segment_index(self, timestamp: float) -> int:
+        if self._step is not None:
+            index = int((timestamp - self._start) // self._step)
+        else:
+            index = bisect_right(self._x_list, timestamp) - 1
+        return min(max(index, 0), len(self._x_list) - 2)
+
+    def _segment_indices(self, timestamps: np.ndarray) -> np.ndarray:
+        if self._step is not None:
+            indices = np.floor((timestamps - self._start) / self._step).astype(int)
+        else:
+            indices = np.searchsorted(self._x, timestamps, side="right") - 1
+        return np.clip(indices, 0, len(self._x) - 2)
+
+    def _interpolate(self, index: int, timestamp: float) -> float:
+        return self._y_list[index] + self._slopes_list[index] * (timestamp - self._x_list[index])
+
+    def resample(self, timestamp: Union[Timestamp, np.ndarray]):
+        if np.ndim(timestamp) > 0:
+            return self.resample_many(timestamp)
+        return self._interpolate(self._segment_index(timestamp), timestamp)
+
+    def resample_many(self, timestamps: Union[List[Timestamp], np.ndarray]) -> np.ndarray:
+        timestamps = np.asarray(timestamps, dtype=float)
+        indices = self._segment_indices(timestamps)
+        return self._y[indices] + self._slopes[indices] * (timestamps - self._x[indices])
+
+    def cursor(self) -> "SimulationTimeSeriesCursor":
+        return SimulationTimeSeriesCursor(self)
+
+
+class SimulationTimeSeriesCursor:
+    def __init__(self, time_series: SimulationTimeSeries):
+        self._time_series = time_series
+        self._index = 0
+        self._last_timestamp = None
+
+    def resample(self, timestamp: Timestamp) -> float:
+        time_series = self._time_series
+        if self._last_timestamp is None or timestamp < self._last_timestamp:
+            self._index = time_series._segment_index(timestamp)
+        else:
+            x = time_series._x_list
+            last_index = len(x) - 2
+            while self._index < last_index and x[self._index + 1] <= timestamp:
+                self._index += 1
+
+        self._last_timestamp = timestamp
+        return time_series._interpolate(self._index, timestamp)
 
 
 class SimulationTimeseriesError(ValueError):
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
+from microgrid.data_loader.domain import UnknownComponentQueryError
 from microgrid.shared.simulation_data import ComponentSimulationData
 from microgrid.shared.storage import IComponentDataStorage
 from microgrid.shared.timeseries import Timestamp, SimulationTimeseriesError
@@ -30,11 +31,89 @@ class HistoricalData:
             self.data.append(data)
 
 
+def allocate_column(value: np.ndarray, capacity: int) -> np.ndarray:
+    return np.empty((capacity,) + value.shape, dtype=value.dtype)
+
+
+def fit_column(data: np.ndarray, value: np.ndarray) -> np.ndarray:
+    if data.dtype == object:
+        return data
+    if value.shape == data.shape[1:] and np.can_cast(value.dtype, data.dtype):
+        return data
+
+    dtype = np.result_type(value.dtype, data.dtype)
+    if value.shape == data.shape[1:] and dtype.kind in "biuf":
+        return data.astype(dtype)
+    object_data = np.empty(len(data), dtype=object)
+    object_data[:] = list(data)
+    return object_data
+
+
+class GrowableColumn:
+    def __init__(self, initial_capacity: int = 64):
+        self._initial_capacity = initial_capacity
+        self._data: Optional[np.ndarray] = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def values(self) -> np.ndarray:
+        if self._data is None:
+            return np.array([])
+        return self._data[: self._size]
+
+    def append(self, value):
+        array_value = np.asarray(value)
+        if self._data is None:
+            self._data = allocate_column(array_value, self._initial_capacity)
+        else:
+            self._data = fit_column(self._data, array_value)
+
+        if self._size == len(self._data):
+            self._data = np.concatenate([self._data, np.empty_like(self._data)])
+
+        if self._data.dtype == object:
+            self._data[self._size] = value
+        else:
+            self._data[self._size] = array_value
+        self._size += 1
+
+
+class UnitHistoricalColumns:
+    def __init__(self, unit_id: str):
+        self.unit_id = unit_id
+        self.timestamps = GrowableColumn()
+        self.fields: Dict[str, GrowableColumn] = {}
+
+    def add_data(self, timestamp: Timestamp, values: dict):
+        if len(self.timestamps) > 0 and timestamp <= self.timestamps.values[-1]:
+            raise SimulationTimeseriesError(
+                f"time stamps in the historical data of unit {self.unit_id} should be increasing"
+            )
+
+        for field in values.keys() - self.fields.keys():
+            self.fields[field] = GrowableColumn()
+            for _ in range(len(self.timestamps)):
+                self.fields[field].append(None)
+
+        for field, column in self.fields.items():
+            column.append(values.get(field))
+        self.timestamps.append(timestamp)
+
+    def index_range(self, since: Timestamp, until: Optional[Timestamp] = None) -> Tuple[int, int]:
+        timestamps = self.timestamps.values
+        start = int(np.searchsorted(timestamps, since, side="right"))
+        stop = len(timestamps) if until is None else int(np.searchsorted(timestamps, until, side="right"))
+        return start, max(start, stop)
+
+
 class MemoryDataStorage(IComponentDataStorage):
     def __init__(self, initial_timestamp: int):
         self._initial_timestamp = initial_timestamp
         self._current_timestamp = initial_timestamp
-        self.historical_data = HistoricalData([], [])
+        self._units: Dict[str, UnitHistoricalColumns] = {}
 
     @property
     def initial_timestamp(self):
@@ -44,10 +123,42 @@ class MemoryDataStorage(IComponentDataStorage):
     def current_timestamp(self):
         return self._current_timestamp
 
+    @property
+    def unit_ids(self) -> List[str]:
+        return list(self._units)
+
     def add_simulation_data(self, current_timestamp, data: ComponentSimulationData):
-        self._current_timestamp = current_timestamp
-        self.historical_data.timestamps.append(current_timestamp)
-        self.historical_data.data.append(data)
+        if data.name not in self._units:
+            self._units[data.name] = UnitHistoricalColumns(data.name)
+        self._units[data.name].add_data(current_timestamp, data.values)
+        self._current_timestamp = max(self._current_timestamp, current_timestamp)
+
+    def _get_unit_columns(self, unit_id: str) -> UnitHistoricalColumns:
+        try:
+            return self._units[unit_id]
+        except KeyError:
+            raise UnknownComponentQueryError(f"unit {unit_id} has no historical data in the storage")
+
+    def get_historical_arrays(
+        self, unit_id: str, since: Timestamp, until: Optional[Timestamp] = None
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        unit_columns = self._get_unit_columns(unit_id)
+        start, stop = unit_columns.index_range(since, until)
+        return (
+            unit_columns.timestamps.values[start:stop],
+            {field: column.values[start:stop] for field, column in unit_columns.fields.items()},
+        )
 
-    def get_historical_data(self, since: int, until: int = None, unit_id: str = None) -> List[ComponentSimulationData]:
-        pass
+    def get_historical_data(
+        self, unit_id: Optional[str], since: Timestamp, until: Optional[Timestamp] = None
+    ) -> List[ComponentSimulationData]:
+        unit_ids = self.unit_ids if unit_id is None else [unit_id]
+        historical_data = []
+        for unit_id in unit_ids:
+            timestamps, fields = self.get_historical_arrays(unit_id, since, until)
+            field_values = {field: list(values) for field, values in fields.items()}
+            historical_data.extend(
+                ComponentSimulationData(unit_id, values={field: values[i] for field, values in field_values.items()})
+                for i in range(len(timestamps))
+            )
+        return historical_data
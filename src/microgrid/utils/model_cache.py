@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from microgrid.model.domain import MicrogridModelData
+from microgrid.shared.memory_mapped_timeseries import MemoryMappedTimeSeries
+
+logger = logging.getLogger(__name__)
+
+MODEL_CACHE_VERSION = 1
+VERSION_FILE = "VERSION"
+MODEL_FILE = "model.pickle"
+ARRAYS_DIRECTORY = "arrays"
+
+
+def _canonical_value(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return {"__ndarray__": value.tolist(), "dtype": str(value.dtype)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    if isinstance(value, MemoryMappedTimeSeries):
+        return {
+            "__class__": f"{type(value).__module__}.{type(value).__qualname__}",
+            "state": value.__getstate__(),
+            "files": value.file_fingerprint(),
+        }
+    if hasattr(value, "__getstate__") or hasattr(value, "__dict__"):
+        state = value.__getstate__() if hasattr(value, "__getstate__") else vars(value)
+        return {"__class__": f"{type(value).__module__}.{type(value).__qualname__}", "state": state or {}}
+    raise TypeError(f"{type(value)} cannot be part of a cached model config")
+
+
+def model_config_hash(config: Any) -> str:
+    encoded = json.dumps(
+        {"version": MODEL_CACHE_VERSION, "config": config},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_canonical_value,
+    )
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class _ArrayPickler(pickle.Pickler):
+    def __init__(self, file, array_directory: str, min_mapped_bytes: int):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._array_directory = array_directory
+        self._min_mapped_bytes = min_mapped_bytes
+        self._array_files: Dict[int, str] = {}
+        self._arrays = []
+
+    def persistent_id(self, obj):
+        if type(obj) is not np.ndarray or obj.dtype.hasobject or obj.nbytes < self._min_mapped_bytes:
+            return None
+        if id(obj) not in self._array_files:
+            file_name = f"{len(self._array_files):06d}.npy"
+            np.save(os.path.join(self._array_directory, file_name), obj)
+            self._array_files[id(obj)] = file_name
+            self._arrays.append(obj)
+        return self._array_files[id(obj)]
+
+
+class _ArrayUnpickler(pickle.Unpickler):
+    def __init__(self, file, array_directory: str):
+        super().__init__(file)
+        self._array_directory = array_directory
+        self._arrays: Dict[str, np.ndarray] = {}
+
+    def persistent_load(self, pid):
+        if pid not in self._arrays:
+            self._arrays[pid] = np.load(os.path.join(self._array_directory, pid), mmap_mode="c")
+        return self._arrays[pid]
+
+
+class MicrogridModelCache:
+    def __init__(self, directory: str, min_mapped_bytes: int = 4096):
+        self._directory = directory
+        self._min_mapped_bytes = min_mapped_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def _entry_directory(self, key: str) -> str:
+        return os.path.join(self._directory, key)
+
+    def contains(self, key: str) -> bool:
+        try:
+            with open(os.path.join(self._entry_directory(key), VERSION_FILE), "r") as f:
+                return int(f.read()) == MODEL_CACHE_VERSION
+        except (OSError, ValueError):
+            return False
+
+    def load(self, key: str) -> Optional[MicrogridModelData]:
+        if not self.contains(key):
+            return None
+        entry_directory = self._entry_directory(key)
+        with open(os.path.join(entry_directory, MODEL_FILE), "rb") as f:
+            return _ArrayUnpickler(f, os.path.join(entry_directory, ARRAYS_DIRECTORY)).load()
+
+    def store(self, key: str, model_data: MicrogridModelData):
+        temporary_directory = tempfile.mkdtemp(prefix=".tmp-", dir=self._directory)
+        try:
+            array_directory = os.path.join(temporary_directory, ARRAYS_DIRECTORY)
+            os.makedirs(array_directory)
+            with open(os.path.join(temporary_directory, MODEL_FILE), "wb") as f:
+                _ArrayPickler(f, array_directory, self._min_mapped_bytes).dump(model_data)
+            with open(os.path.join(temporary_directory, VERSION_FILE), "w") as f:
+                f.write(str(MODEL_CACHE_VERSION))
+
+            entry_directory = self._entry_directory(key)
+            if os.path.isdir(entry_directory) and not self.contains(key):
+                shutil.rmtree(entry_directory)
+            os.rename(temporary_directory, entry_directory)
+        except OSError:
+            if not self.contains(key):
+                raise
+        finally:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+
+    def get_or_build(self, config: Any, build: Callable[[Any], MicrogridModelData]) -> MicrogridModelData:
+        try:
+            key = model_config_hash(config)
+        except (TypeError, ValueError) as err:
+            logger.warning(f"microgrid model config cannot be hashed and is built without the cache: {err}")
+            return build(config)
+        model_data = self.load(key)
+        if model_data is not None:
+            return model_data
+
+        model_data = build(config)
+        try:
+            self.store(key, model_data)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            logger.warning(f"microgrid model {model_data.name} cannot be cached: {err}")
+        return model_data
@@ -0,0 +1,236 @@
+import os
+import queue
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from microgrid.data_loader.domain import UnknownComponentQueryError
+from microgrid.shared.simulation_data import ComponentSimulationData
+from microgrid.shared.storage import IComponentDataStorage
+from microgrid.shared.timeseries import Timestamp, SimulationTimeseriesError
+
+UNIT_COLUMN = "unit"
+TIMESTAMP_COLUMN = "timestamp"
+PART_FILE_PREFIX = "part-"
+_STOP_WRITER = object()
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("pyarrow is needed to store the simulation data in parquet files")
+    return pyarrow
+
+
+def _column_value(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _record_value(value):
+    if isinstance(value, list):
+        return np.array(value)
+    return value
+
+
+class UnitRecordBatch:
+    def __init__(self, unit_id: str):
+        self.unit_id = unit_id
+        self.timestamps: List[Timestamp] = []
+        self.records: List[dict] = []
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def add_data(self, timestamp: Timestamp, values: dict):
+        if len(self.timestamps) > 0 and timestamp <= self.timestamps[-1]:
+            raise SimulationTimeseriesError(
+                f"time stamps in the historical data of unit {self.unit_id} should be increasing"
+            )
+        self.timestamps.append(timestamp)
+        self.records.append(values)
+
+    def to_table(self):
+        pa = _import_pyarrow()
+        fields = {}
+        for record in self.records:
+            fields.update(dict.fromkeys(record))
+
+        columns = {
+            TIMESTAMP_COLUMN: pa.array(self.timestamps, type=pa.float64()),
+        }
+        for field in fields:
+            columns[field] = pa.array([_column_value(record.get(field)) for record in self.records])
+        return pa.table(columns)
+
+
+class ParquetDataStorage(IComponentDataStorage):
+    def __init__(self, directory: str, initial_timestamp: int, batch_size: int = 1024, max_pending_batches: int = 8):
+        _import_pyarrow()
+        self._directory = directory
+        self._initial_timestamp = initial_timestamp
+        self._current_timestamp = initial_timestamp
+        self._batch_size = max(batch_size, 1)
+        self._batches: Dict[str, UnitRecordBatch] = {}
+        self._last_timestamps: Dict[str, Timestamp] = {}
+        self._part_numbers: Dict[str, int] = {}
+        self._writer_error: Optional[Exception] = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._pending_batches = queue.Queue(maxsize=max(max_pending_batches, 1))
+        self._writer = threading.Thread(target=self._write_batches, daemon=True)
+        self._writer.start()
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def initial_timestamp(self):
+        return self._initial_timestamp
+
+    @property
+    def current_timestamp(self):
+        return self._current_timestamp
+
+    def _unit_directory(self, unit_id: str) -> str:
+        return os.path.join(self._directory, f"{UNIT_COLUMN}={unit_id}")
+
+    def _part_files(self, unit_id: str) -> List[str]:
+        unit_directory = self._unit_directory(unit_id)
+        if not os.path.isdir(unit_directory):
+            return []
+        return sorted(
+            os.path.join(unit_directory, file_name) for file_name in os.listdir(unit_directory)
+            if file_name.startswith(PART_FILE_PREFIX) and file_name.endswith(".parquet")
+        )
+
+    @property
+    def unit_ids(self) -> List[str]:
+        unit_ids = dict.fromkeys(
+            directory[len(UNIT_COLUMN) + 1:] for directory in sorted(os.listdir(self._directory))
+            if directory.startswith(f"{UNIT_COLUMN}=")
+        )
+        unit_ids.update(dict.fromkeys(self._batches))
+        return list(unit_ids)
+
+    def _next_part_file(self, unit_id: str) -> str:
+        if unit_id not in self._part_numbers:
+            self._part_numbers[unit_id] = len(self._part_files(unit_id))
+        part_number = self._part_numbers[unit_id]
+        self._part_numbers[unit_id] += 1
+        return os.path.join(self._unit_directory(unit_id), f"{PART_FILE_PREFIX}{part_number:08d}.parquet")
+
+    def _write_batches(self):
+        pa = _import_pyarrow()
+        while True:
+            batch = self._pending_batches.get()
+            try:
+                if batch is _STOP_WRITER:
+                    return
+                if self._writer_error is None:
+                    os.makedirs(self._unit_directory(batch.unit_id), exist_ok=True)
+                    pa.parquet.write_table(batch.to_table(), self._next_part_file(batch.unit_id))
+            except Exception as err:
+                self._writer_error = err
+            finally:
+                self._pending_batches.task_done()
+
+    def _raise_writer_error(self):
+        if self._writer_error is not None:
+            raise IOError(f"writing the simulation data failed: {self._writer_error}")
+
+    def _last_stored_timestamp(self, unit_id: str) -> Optional[Timestamp]:
+        if unit_id not in self._last_timestamps:
+            table = self.get_historical_table(unit_id, since=-np.inf, columns=[TIMESTAMP_COLUMN])
+            self._last_timestamps[unit_id] = (
+                None if table.num_rows == 0 else max(table.column(TIMESTAMP_COLUMN).to_pylist())
+            )
+        return self._last_timestamps[unit_id]
+
+    def add_simulation_data(self, current_timestamp, data: ComponentSimulationData):
+        self._raise_writer_error()
+        if data.name not in self._batches:
+            last_timestamp = self._last_stored_timestamp(data.name)
+            if last_timestamp is not None and current_timestamp <= last_timestamp:
+                raise SimulationTimeseriesError(
+                    f"time stamps in the historical data of unit {data.name} should be increasing"
+                )
+            self._batches[data.name] = UnitRecordBatch(data.name)
+
+        batch = self._batches[data.name]
+        batch.add_data(current_timestamp, data.values)
+        self._last_timestamps[data.name] = current_timestamp
+        self._current_timestamp = max(self._current_timestamp, current_timestamp)
+        if len(batch) >= self._batch_size:
+            self._pending_batches.put(batch)
+            self._batches[data.name] = UnitRecordBatch(data.name)
+
+    def flush(self):
+        for unit_id, batch in self._batches.items():
+            if len(batch) > 0:
+                self._pending_batches.put(batch)
+                self._batches[unit_id] = UnitRecordBatch(unit_id)
+        self._pending_batches.join()
+        self._raise_writer_error()
+
+    def close(self):
+        if self._writer.is_alive():
+            self.flush()
+            self._pending_batches.put(_STOP_WRITER)
+            self._writer.join()
+
+    def __enter__(self) -> "ParquetDataStorage":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def get_historical_table(
+        self,
+        unit_id: str,
+        since: Timestamp,
+        until: Optional[Timestamp] = None,
+        columns: Optional[List[str]] = None,
+    ):
+        pa = _import_pyarrow()
+        files = self._part_files(unit_id)
+        if len(files) == 0:
+            return pa.table({TIMESTAMP_COLUMN: pa.array([], type=pa.float64())})
+
+        schema = pa.unify_schemas(
+            [pa.parquet.read_schema(file) for file in files], promote_options="permissive"
+        )
+        dataset = pa.dataset.dataset(files, schema=schema, format="parquet")
+        predicate = pa.dataset.field(TIMESTAMP_COLUMN) > since
+        if until is not None:
+            predicate = predicate & (pa.dataset.field(TIMESTAMP_COLUMN) <= until)
+        table = dataset.to_table(filter=predicate, columns=columns)
+        if columns is None or TIMESTAMP_COLUMN in columns:
+            table = table.sort_by(TIMESTAMP_COLUMN)
+        return table
+
+    def get_historical_data(
+        self, unit_id: Optional[str], since: Timestamp, until: Optional[Timestamp] = None
+    ) -> List[ComponentSimulationData]:
+        self.flush()
+        unit_ids = self.unit_ids if unit_id is None else [unit_id]
+        historical_data = []
+        for unit_id in unit_ids:
+            if len(self._part_files(unit_id)) == 0:
+                raise UnknownComponentQueryError(f"unit {unit_id} has no historical data in the storage")
+            table = self.get_historical_table(unit_id, since, until).drop([TIMESTAMP_COLUMN])
+            historical_data.extend(
+                ComponentSimulationData(
+                    unit_id, values={field: _record_value(value) for field, value in row.items() if value is not None}
+                )
+                for row in table.to_pylist()
+            )
+        return historical_data
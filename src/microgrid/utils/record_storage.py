@@ -0,0 +1,134 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from microgrid.data_loader.domain import UnknownComponentQueryError
+from microgrid.shared.simulation_data import ComponentSimulationData
+from microgrid.shared.storage import IRecordDataStorage
+from microgrid.shared.timeseries import Timestamp, SimulationTimeseriesError
+
+
+def simulation_data_dtype(values: dict) -> np.dtype:
+    fields = []
+    for field, value in values.items():
+        array_value = np.asarray(value)
+        if array_value.dtype.kind not in "biuf":
+            raise ValueError(f"field {field} with value {value} cannot be stored in a record")
+        dtype = bool if array_value.dtype.kind == "b" else float
+        fields.append((field, dtype, array_value.shape))
+    return np.dtype(fields)
+
+
+class UnitRecordBuffer:
+    def __init__(self, unit_id: str, dtype: np.dtype, initial_capacity: int = 1024):
+        self.unit_id = unit_id
+        self.dtype = dtype
+        self._timestamps = np.empty(max(initial_capacity, 1), dtype=float)
+        self._records = np.zeros(max(initial_capacity, 1), dtype=dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._records)
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[: self._size]
+
+    @property
+    def records(self) -> np.ndarray:
+        return self._records[: self._size]
+
+    def _grow(self):
+        self._timestamps = np.concatenate([self._timestamps, np.empty_like(self._timestamps)])
+        self._records = np.concatenate([self._records, np.zeros_like(self._records)])
+
+    def next_record(self, timestamp: Timestamp) -> np.void:
+        if self._size > 0 and timestamp <= self._timestamps[self._size - 1]:
+            raise SimulationTimeseriesError(
+                f"time stamps in the historical data of unit {self.unit_id} should be increasing"
+            )
+        if self._size == self.capacity:
+            self._grow()
+
+        self._timestamps[self._size] = timestamp
+        record = self._records[self._size]
+        self._size += 1
+        return record
+
+    def index_range(self, since: Timestamp, until: Optional[Timestamp] = None) -> Tuple[int, int]:
+        timestamps = self.timestamps
+        start = int(np.searchsorted(timestamps, since, side="right"))
+        stop = len(timestamps) if until is None else int(np.searchsorted(timestamps, until, side="right"))
+        return start, max(start, stop)
+
+
+class RecordDataStorage(IRecordDataStorage):
+    def __init__(self, initial_timestamp: int, initial_capacity: int = 1024):
+        self._initial_timestamp = initial_timestamp
+        self._current_timestamp = initial_timestamp
+        self._initial_capacity = initial_capacity
+        self._units: Dict[str, UnitRecordBuffer] = {}
+
+    @property
+    def initial_timestamp(self):
+        return self._initial_timestamp
+
+    @property
+    def current_timestamp(self):
+        return self._current_timestamp
+
+    @property
+    def unit_ids(self) -> List[str]:
+        return list(self._units)
+
+    def next_record(self, unit_id: str, current_timestamp: int, dtype: np.dtype) -> np.void:
+        unit_buffer = self._units.get(unit_id)
+        if unit_buffer is None:
+            unit_buffer = self._units[unit_id] = UnitRecordBuffer(unit_id, dtype, self._initial_capacity)
+        elif unit_buffer.dtype != dtype:
+            raise ValueError(f"record schema of unit {unit_id} changed from {unit_buffer.dtype} to {dtype}")
+
+        record = unit_buffer.next_record(current_timestamp)
+        self._current_timestamp = max(self._current_timestamp, current_timestamp)
+        return record
+
+    def add_simulation_data(self, current_timestamp, data: ComponentSimulationData):
+        unit_buffer = self._units.get(data.name)
+        dtype = simulation_data_dtype(data.values) if unit_buffer is None else unit_buffer.dtype
+        record = self.next_record(data.name, current_timestamp, dtype)
+        for field, value in data.values.items():
+            record[field] = value
+
+    def _get_unit_buffer(self, unit_id: str) -> UnitRecordBuffer:
+        try:
+            return self._units[unit_id]
+        except KeyError:
+            raise UnknownComponentQueryError(f"unit {unit_id} has no historical data in the storage")
+
+    def get_historical_records(
+        self, unit_id: str, since: Timestamp, until: Optional[Timestamp] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        unit_buffer = self._get_unit_buffer(unit_id)
+        start, stop = unit_buffer.index_range(since, until)
+        return unit_buffer.timestamps[start:stop], unit_buffer.records[start:stop]
+
+    def get_historical_data(
+        self, unit_id: Optional[str], since: Timestamp, until: Optional[Timestamp] = None
+    ) -> List[ComponentSimulationData]:
+        unit_ids = self.unit_ids if unit_id is None else [unit_id]
+        historical_data = []
+        for unit_id in unit_ids:
+            _, records = self.get_historical_records(unit_id, since, until)
+            fields = {
+                field: list(records[field].copy()) if records[field].ndim > 1 else records[field].tolist()
+                for field in records.dtype.names
+            }
+            historical_data.extend(
+                ComponentSimulationData(unit_id, values={field: values[i] for field, values in fields.items()})
+                for i in range(len(records))
+            )
+        return historical_data
@@ -0,0 +1,299 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from microgrid.data_loader.domain import UnknownComponentQueryError
+from microgrid.shared.simulation_data import ComponentSimulationData
+from microgrid.shared.storage import IComponentDataStorage
+from microgrid.shared.timeseries import Timestamp, SimulationTimeseriesError
+from microgrid.utils.memory_storage import allocate_column, fit_column
+
+
+@dataclass(frozen=True)
+class FieldRetention:
+    window: int
+    aggregation_interval: Optional[int] = None
+    aggregate_window: Optional[int] = None
+
+    def __post_init__(self):
+        if self.window < 0:
+            raise ValueError("the retention window should be non negative")
+        if self.aggregation_interval is not None and self.aggregation_interval <= 0:
+            raise ValueError("the aggregation interval should be positive")
+
+
+@dataclass(frozen=True)
+class AggregatedHistory:
+    timestamps: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    mean: np.ndarray
+    count: np.ndarray
+
+
+class RingBuffer:
+    def __init__(self, initial_capacity: int = 64):
+        self._initial_capacity = initial_capacity
+        self._timestamps: Optional[np.ndarray] = None
+        self._values: Optional[np.ndarray] = None
+        self._start = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return 0 if self._timestamps is None else len(self._timestamps)
+
+    def _ordered(self, data: Optional[np.ndarray]) -> np.ndarray:
+        if data is None:
+            return np.array([])
+        stop = self._start + self._size
+        if stop <= len(data):
+            return data[self._start: stop]
+        return np.concatenate([data[self._start:], data[: stop - len(data)]])
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._ordered(self._timestamps)
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._ordered(self._values)
+
+    def _last_index(self) -> int:
+        return (self._start + self._size - 1) % self.capacity
+
+    @property
+    def last_timestamp(self) -> Optional[Timestamp]:
+        if self._size == 0:
+            return None
+        return self._timestamps[self._last_index()]
+
+    @property
+    def last_value(self):
+        return self._values[self._last_index()]
+
+    def replace_last_value(self, value):
+        self._values[self._last_index()] = value
+
+    def _grow(self):
+        self._timestamps = np.concatenate([self.timestamps, np.empty(self.capacity, dtype=self._timestamps.dtype)])
+        self._values = np.concatenate([self.values, np.empty_like(self._values)])
+        self._start = 0
+
+    def append(self, timestamp: Timestamp, value):
+        array_value = np.asarray(value)
+        if self._timestamps is None:
+            self._timestamps = allocate_column(np.asarray(timestamp), self._initial_capacity)
+            self._values = allocate_column(array_value, self._initial_capacity)
+        else:
+            self._timestamps = fit_column(self._timestamps, np.asarray(timestamp))
+            self._values = fit_column(self._values, array_value)
+
+        if self._size == self.capacity:
+            self._grow()
+
+        index = (self._start + self._size) % self.capacity
+        self._timestamps[index] = timestamp
+        self._values[index] = value if self._values.dtype == object else array_value
+        self._size += 1
+
+    def _count_until(self, timestamp: Timestamp) -> int:
+        if self._size == 0:
+            return 0
+        stop = self._start + self._size
+        head = self._timestamps[self._start: min(stop, self.capacity)]
+        count = int(np.searchsorted(head, timestamp, side="right"))
+        if count == len(head) and stop > self.capacity:
+            count += int(np.searchsorted(self._timestamps[: stop - self.capacity], timestamp, side="right"))
+        return count
+
+    def evict_until(self, timestamp: Timestamp) -> Tuple[np.ndarray, np.ndarray]:
+        number_evicted = self._count_until(timestamp)
+        if number_evicted == 0:
+            return np.array([]), np.array([])
+
+        indices = (self._start + np.arange(number_evicted)) % self.capacity
+        evicted = self._timestamps[indices], self._values[indices]
+        if self._values.dtype == object:
+            self._values[indices] = None
+        self._start = (self._start + number_evicted) % self.capacity
+        self._size -= number_evicted
+        return evicted
+
+    def index_range(self, since: Timestamp, until: Optional[Timestamp] = None) -> Tuple[int, int]:
+        timestamps = self.timestamps
+        start = int(np.searchsorted(timestamps, since, side="right"))
+        stop = len(timestamps) if until is None else int(np.searchsorted(timestamps, until, side="right"))
+        return start, max(start, stop)
+
+
+class IntervalAggregator:
+    def __init__(self, interval: int, window: Optional[int] = None):
+        self._interval = interval
+        self._window = window
+        self._minimum = RingBuffer()
+        self._maximum = RingBuffer()
+        self._sum = RingBuffer()
+        self._count = RingBuffer()
+        self._bucket: Optional[Timestamp] = None
+
+    def _bucket_start(self, timestamp: Timestamp) -> Timestamp:
+        return timestamp - timestamp % self._interval
+
+    def add(self, timestamp: Timestamp, value):
+        value = np.asarray(value)
+        if value.dtype.kind not in "biuf":
+            return
+        value = value.astype(float)
+
+        bucket = self._bucket_start(timestamp)
+        if bucket != self._bucket:
+            self._bucket = bucket
+            self._minimum.append(bucket, value)
+            self._maximum.append(bucket, value)
+            self._sum.append(bucket, value)
+            self._count.append(bucket, 1)
+            if self._window is not None:
+                for buffer in (self._minimum, self._maximum, self._sum, self._count):
+                    buffer.evict_until(bucket - self._window)
+            return
+
+        self._minimum.replace_last_value(np.minimum(self._minimum.last_value, value))
+        self._maximum.replace_last_value(np.maximum(self._maximum.last_value, value))
+        self._sum.replace_last_value(self._sum.last_value + value)
+        self._count.replace_last_value(self._count.last_value + 1)
+
+    def history(self, since: Optional[Timestamp] = None, until: Optional[Timestamp] = None) -> AggregatedHistory:
+        start, stop = self._count.index_range(-np.inf if since is None else since, until)
+
+        count = self._count.values[start:stop]
+        total = self._sum.values[start:stop]
+        return AggregatedHistory(
+            timestamps=self._count.timestamps[start:stop],
+            minimum=self._minimum.values[start:stop],
+            maximum=self._maximum.values[start:stop],
+            mean=total / count.reshape((-1,) + (1,) * (total.ndim - 1)),
+            count=count,
+        )
+
+
+class UnitRingBuffers:
+    def __init__(self, unit_id: str, retention_for_field):
+        self.unit_id = unit_id
+        self.timestamps = RingBuffer()
+        self.fields: Dict[str, RingBuffer] = {}
+        self.aggregators: Dict[str, IntervalAggregator] = {}
+        self._retention_for_field = retention_for_field
+        self._window = 0
+        self._last_timestamp: Optional[Timestamp] = None
+
+    def _add_field(self, field: str):
+        retention = self._retention_for_field(field)
+        self.fields[field] = RingBuffer()
+        if retention.aggregation_interval is not None:
+            self.aggregators[field] = IntervalAggregator(retention.aggregation_interval, retention.aggregate_window)
+        self._window = max(self._window, retention.window)
+
+    def add_data(self, timestamp: Timestamp, values: dict):
+        if self._last_timestamp is not None and timestamp <= self._last_timestamp:
+            raise SimulationTimeseriesError(
+                f"time stamps in the historical data of unit {self.unit_id} should be increasing"
+            )
+        self._last_timestamp = timestamp
+
+        for field, value in values.items():
+            if field not in self.fields:
+                self._add_field(field)
+            self.fields[field].append(timestamp, value)
+        self.timestamps.append(timestamp, timestamp)
+        self._evict(timestamp)
+
+    def _evict(self, timestamp: Timestamp):
+        for field, buffer in self.fields.items():
+            evicted_timestamps, evicted_values = buffer.evict_until(timestamp - self._retention_for_field(field).window)
+            aggregator = self.aggregators.get(field)
+            if aggregator is not None:
+                for evicted_timestamp, evicted_value in zip(evicted_timestamps, evicted_values):
+                    aggregator.add(evicted_timestamp, evicted_value)
+        self.timestamps.evict_until(timestamp - self._window)
+
+
+class RingBufferDataStorage(IComponentDataStorage):
+    def __init__(
+        self,
+        initial_timestamp: int,
+        default_retention: FieldRetention,
+        field_retention: Optional[Dict[str, FieldRetention]] = None,
+    ):
+        self._initial_timestamp = initial_timestamp
+        self._current_timestamp = initial_timestamp
+        self._default_retention = default_retention
+        self._field_retention = dict(field_retention or {})
+        self._units: Dict[str, UnitRingBuffers] = {}
+
+    @property
+    def initial_timestamp(self):
+        return self._initial_timestamp
+
+    @property
+    def current_timestamp(self):
+        return self._current_timestamp
+
+    @property
+    def unit_ids(self) -> List[str]:
+        return list(self._units)
+
+    def retention(self, field: str) -> FieldRetention:
+        return self._field_retention.get(field, self._default_retention)
+
+    def add_simulation_data(self, current_timestamp, data: ComponentSimulationData):
+        if data.name not in self._units:
+            self._units[data.name] = UnitRingBuffers(data.name, self.retention)
+        self._units[data.name].add_data(current_timestamp, data.values)
+        self._current_timestamp = max(self._current_timestamp, current_timestamp)
+
+    def _get_unit_buffers(self, unit_id: str) -> UnitRingBuffers:
+        try:
+            return self._units[unit_id]
+        except KeyError:
+            raise UnknownComponentQueryError(f"unit {unit_id} has no historical data in the storage")
+
+    def get_historical_arrays(
+        self, unit_id: str, since: Timestamp, until: Optional[Timestamp] = None
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        unit_buffers = self._get_unit_buffers(unit_id)
+        historical_arrays = {}
+        for field, buffer in unit_buffers.fields.items():
+            start, stop = buffer.index_range(since, until)
+            historical_arrays[field] = buffer.timestamps[start:stop], buffer.values[start:stop]
+        return historical_arrays
+
+    def get_historical_data(
+        self, unit_id: Optional[str], since: Timestamp, until: Optional[Timestamp] = None
+    ) -> List[ComponentSimulationData]:
+        unit_ids = self.unit_ids if unit_id is None else [unit_id]
+        historical_data = []
+        for unit_id in unit_ids:
+            unit_buffers = self._get_unit_buffers(unit_id)
+            start, stop = unit_buffers.timestamps.index_range(since, until)
+            timestamps = unit_buffers.timestamps.values[start:stop]
+            records = [{} for _ in timestamps]
+            for field, (field_timestamps, values) in self.get_historical_arrays(unit_id, since, until).items():
+                indices = np.searchsorted(timestamps, field_timestamps)
+                for index, value in zip(indices, values):
+                    records[index][field] = value
+            historical_data.extend(ComponentSimulationData(unit_id, values=record) for record in records)
+        return historical_data
+
+    def get_aggregated_history(
+        self, unit_id: str, field: str, since: Optional[Timestamp] = None, until: Optional[Timestamp] = None
+    ) -> AggregatedHistory:
+        try:
+            aggregator = self._get_unit_buffers(unit_id).aggregators[field]
+        except KeyError:
+            raise UnknownComponentQueryError(f"field {field} of unit {unit_id} is not aggregated")
+        return aggregator.history(since, until)
@@ -0,0 +1,138 @@
+import json
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from microgrid.data_loader.domain import UnknownComponentQueryError
+from microgrid.shared.simulation_data import ComponentSimulationData
+from microgrid.shared.storage import IComponentDataStorage
+from microgrid.shared.timeseries import Timestamp, SimulationTimeseriesError
+
+SIMULATION_DATA_TABLE = "simulation_data"
+
+
+def _encode_value(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value)} cannot be stored in the sqlite storage")
+
+
+def _decode_value(value):
+    if isinstance(value, list):
+        return np.array(value)
+    return value
+
+
+class SQLiteDataStorage(IComponentDataStorage):
+    def __init__(self, path: str, initial_timestamp: int, batch_size: int = 1024):
+        self._path = path
+        self._initial_timestamp = initial_timestamp
+        self._current_timestamp = initial_timestamp
+        self._batch_size = max(batch_size, 1)
+        self._pending_rows: List[Tuple[str, Timestamp, str]] = []
+        self._last_timestamps: Dict[str, Timestamp] = {}
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {SIMULATION_DATA_TABLE} "
+                f"(unit TEXT NOT NULL, timestamp REAL NOT NULL, data_values TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS {SIMULATION_DATA_TABLE}_unit_timestamp "
+                f"ON {SIMULATION_DATA_TABLE} (unit, timestamp)"
+            )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def initial_timestamp(self):
+        return self._initial_timestamp
+
+    @property
+    def current_timestamp(self):
+        return self._current_timestamp
+
+    @property
+    def unit_ids(self) -> List[str]:
+        self.flush()
+        rows = self._connection.execute(f"SELECT DISTINCT unit FROM {SIMULATION_DATA_TABLE} ORDER BY unit")
+        return [unit for unit, in rows]
+
+    def _last_stored_timestamp(self, unit_id: str) -> Optional[Timestamp]:
+        if unit_id not in self._last_timestamps:
+            (last_timestamp,), = self._connection.execute(
+                f"SELECT MAX(timestamp) FROM {SIMULATION_DATA_TABLE} WHERE unit = ?", (unit_id,)
+            )
+            self._last_timestamps[unit_id] = last_timestamp
+        return self._last_timestamps[unit_id]
+
+    def add_simulation_data(self, current_timestamp, data: ComponentSimulationData):
+        last_timestamp = self._last_stored_timestamp(data.name)
+        if last_timestamp is not None and current_timestamp <= last_timestamp:
+            raise SimulationTimeseriesError(
+                f"time stamps in the historical data of unit {data.name} should be increasing"
+            )
+
+        self._pending_rows.append((data.name, current_timestamp, json.dumps(data.values, default=_encode_value)))
+        self._last_timestamps[data.name] = current_timestamp
+        self._current_timestamp = max(self._current_timestamp, current_timestamp)
+        if len(self._pending_rows) >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        if len(self._pending_rows) == 0:
+            return
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT INTO {SIMULATION_DATA_TABLE} (unit, timestamp, data_values) VALUES (?, ?, ?)",
+                self._pending_rows,
+            )
+        self._pending_rows = []
+
+    def close(self):
+        self.flush()
+        self._connection.close()
+
+    def __enter__(self) -> "SQLiteDataStorage":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _query_unit(self, unit_id: str, since: Timestamp, until: Optional[Timestamp]) -> List[Tuple[str]]:
+        if until is None:
+            return self._connection.execute(
+                f"SELECT data_values FROM {SIMULATION_DATA_TABLE} "
+                f"WHERE unit = ? AND timestamp > ? ORDER BY timestamp",
+                (unit_id, since),
+            ).fetchall()
+        return self._connection.execute(
+            f"SELECT data_values FROM {SIMULATION_DATA_TABLE} "
+            f"WHERE unit = ? AND timestamp > ? AND timestamp <= ? ORDER BY timestamp",
+            (unit_id, since, until),
+        ).fetchall()
+
+    def get_historical_data(
+        self, unit_id: Optional[str], since: Timestamp, until: Optional[Timestamp] = None
+    ) -> List[ComponentSimulationData]:
+        self.flush()
+        unit_ids = self.unit_ids if unit_id is None else [unit_id]
+        historical_data = []
+        for unit_id in unit_ids:
+            if self._last_stored_timestamp(unit_id) is None:
+                raise UnknownComponentQueryError(f"unit {unit_id} has no historical data in the storage")
+            historical_data.extend(
+                ComponentSimulationData(
+                    unit_id, values={field: _decode_value(value) for field, value in json.loads(values).items()}
+                )
+                for values, in self._query_unit(unit_id, since, until)
+            )
+        return historical_data
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from common.model.component import GridLine
+from common.model.contingency_analysis import (
+    ContingencyAnalysis,
+    IslandingContingencyError,
+    BASE_CASE,
+)
+from common.model.grid_network_util import DCPowerFlowSolver
+from common.timeseries.domain import Bounds
+
+
+def meshed_grid_lines():
+    bus_ids = [f'bus_{i}' for i in range(4)]
+    grid_lines = [
+        GridLine(bus_ids[0], bus_ids[1], 10, Bounds(-1, 1)),
+        GridLine(bus_ids[1], bus_ids[2], 15, Bounds(-1, 1)),
+        GridLine(bus_ids[2], bus_ids[0], 10, Bounds(-1, 1)),
+        GridLine(bus_ids[3], bus_ids[2], 20),
+        GridLine(bus_ids[3], bus_ids[1], 5, Bounds(-1, 1)),
+    ]
+    return bus_ids, grid_lines
+
+
+def operating_points():
+    return np.array([[1, -2, 0.5, 0.5], [0.2, -0.1, 0, -0.1], [-1, 1, 1, -1]]).T
+
+
+class TestContingencyAnalysis:
+    def test_post_contingency_line_power(self):
+        bus_ids, grid_lines = meshed_grid_lines()
+        analysis = ContingencyAnalysis(bus_ids, grid_lines)
+        bus_power = operating_points()
+
+        for outage_line in range(len(grid_lines)):
+            line_status = np.ones(len(grid_lines), dtype=bool)
+            line_status[outage_line] = False
+            expected_solver = DCPowerFlowSolver(bus_ids, grid_lines, line_status=line_status)
+
+            assert np.allclose(
+                analysis.post_contingency_line_power(bus_power, outage_line), expected_solver.line_power(bus_power)
+            )
+
+    def test_islanding_outage(self):
+        bus_ids, grid_lines = meshed_grid_lines()
+        grid_lines = grid_lines[:4]
+        analysis = ContingencyAnalysis(bus_ids, grid_lines)
+
+        with pytest.raises(IslandingContingencyError):
+            analysis.post_contingency_line_power(operating_points(), 3)
+
+        violation_table = analysis.screen(operating_points())
+        assert violation_table.islanding_outages.tolist() == [3]
+
+    def test_screen(self):
+        bus_ids, grid_lines = meshed_grid_lines()
+        analysis = ContingencyAnalysis(bus_ids, grid_lines, chunk_size=2)
+        bus_power = operating_points()
+
+        violation_table = analysis.screen(bus_power)
+
+        assert len(violation_table.islanding_outages) == 0
+        for outage_line in [BASE_CASE] + list(range(len(grid_lines))):
+            if outage_line == BASE_CASE:
+                line_power = analysis.base_line_power(bus_power)
+            else:
+                line_power = analysis.post_contingency_line_power(bus_power, outage_line)
+            expected = {
+                (line, point)
+                for line, point in zip(*np.nonzero(np.abs(line_power) > 1 + 1e-6))
+                if grid_lines[line].bounds is not None
+            }
+            outage_violations = violation_table.get_outage_violations(outage_line)
+
+            assert set(zip(outage_violations.line_index, outage_violations.operating_point_index)) == expected
+            assert np.allclose(
+                outage_violations.line_power,
+                line_power[outage_violations.line_index, outage_violations.operating_point_index],
+            )
+            assert np.all(np.abs(outage_violations.limit) == 1)
+
+        assert len(violation_table) > 0
+
+    def test_parallel_screen(self):
+        bus_ids, grid_lines = meshed_grid_lines()
+        bus_power = operating_points()
+
+        sequential_table = ContingencyAnalysis(bus_ids, grid_lines, chunk_size=2).screen(bus_power)
+        parallel_table = ContingencyAnalysis(bus_ids, grid_lines, max_workers=2, chunk_size=2).screen(bus_power)
+
+        assert np.array_equal(sequential_table.outage_line_index, parallel_table.outage_line_index)
+        assert np.array_equal(sequential_table.line_index, parallel_table.line_index)
+        assert np.allclose(sequential_table.line_power, parallel_table.line_power)
+
+    def test_screen_reuses_factor(self, monkeypatch):
+        bus_ids, grid_lines = meshed_grid_lines()
+        analysis = ContingencyAnalysis(bus_ids, grid_lines, chunk_size=2)
+        factorisations = []
+        factorise = DCPowerFlowSolver._factorise
+        monkeypatch.setattr(
+            DCPowerFlowSolver, '_factorise', lambda solver: factorisations.append(1) or factorise(solver)
+        )
+
+        analysis.screen(operating_points())
+
+        assert len(factorisations) == 0
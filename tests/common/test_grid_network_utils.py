@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from common.model.component import GridLine
+from common.model.grid_network_util import GridNetworkUtils, DCPowerFlowSolver, SingularGridNetworkError
+
+
+def mesh_grid_lines():
+    bus_ids = [f'bus_{i}' for i in range(4)]
+    grid_lines = [
+        GridLine(bus_ids[0], bus_ids[1], 10),
+        GridLine(bus_ids[1], bus_ids[2], 15),
+        GridLine(bus_ids[2], bus_ids[0], 10),
+        GridLine(bus_ids[3], bus_ids[2], 20),
+    ]
+    return bus_ids, grid_lines
+
+
+class TestGridNetworkUtils:
+    def test_admittance_matrix(self):
+        bus_ids, grid_lines = mesh_grid_lines()
+        admittance_matrix = GridNetworkUtils.calculate_admittance_matrix(bus_ids, grid_lines)
+
+        expected_admittance = np.array([[20, -10, -10, 0],
+                                        [-10, 25, -15, 0],
+                                        [-10, -15, 45, -20],
+                                        [0, 0, -20, 20]])
+
+        assert np.linalg.norm(admittance_matrix - expected_admittance) == 0
+
+    def test_dc_power_flow_matrix(self):
+        bus_ids, grid_lines = mesh_grid_lines()
+        dc_power_flow = GridNetworkUtils.calculate_dc_power_flow_matrix(bus_ids, grid_lines)
+
+        reduced_matrix = GridNetworkUtils.calculate_admittance_matrix(bus_ids, grid_lines)
+        reduced_matrix[0, :] = 0
+        reduced_matrix[:, 0] = 0
+        reduced_matrix[0, 0] = 1
+
+        assert np.allclose(dc_power_flow, np.linalg.inv(reduced_matrix))
+
+    def test_disconnected_dc_power_flow_matrix(self):
+        grid_lines = [GridLine('bus_0', 'bus_1', 10), GridLine('bus_2', 'bus_3', 10)]
+        bus_ids = ['bus_0', 'bus_1', 'bus_2', 'bus_3']
+
+        assert len(GridNetworkUtils.calculate_dc_power_flow_matrix(bus_ids, grid_lines)) == 0
+
+
+class TestDCPowerFlowSolver:
+    def test_phase_angle(self):
+        bus_ids, grid_lines = mesh_grid_lines()
+        solver = DCPowerFlowSolver(bus_ids, grid_lines)
+        dc_power_flow = GridNetworkUtils.calculate_dc_power_flow_matrix(bus_ids, grid_lines)
+        bus_power = np.array([1, -2, 0.5, 0.5])
+
+        expected_phase_angle = dc_power_flow @ bus_power
+        expected_phase_angle[0] = 0
+
+        assert np.allclose(solver.phase_angle(bus_power), expected_phase_angle)
+
+    def test_batched_line_power(self):
+        bus_ids, grid_lines = mesh_grid_lines()
+        solver = DCPowerFlowSolver(bus_ids, grid_lines)
+        bus_power = np.array([[1, -2, 0.5, 0.5], [0, 1, 0, -1], [-3, 1, 1, 1]]).T
+
+        line_power = solver.line_power(bus_power)
+
+        assert line_power.shape == (len(grid_lines), 3)
+        for i in range(bus_power.shape[1]):
+            assert np.allclose(line_power[:, i], solver.line_power(bus_power[:, i]))
+
+        # power injected at each bus is balanced by the flows on the connected lines
+        assert np.allclose(solver.incidence_matrix.T @ line_power, bus_power)
+
+    def test_single_bus(self):
+        solver = DCPowerFlowSolver(['slack'], [])
+
+        assert solver.phase_angle(np.array([0])) == 0
+        assert len(solver.line_power(np.array([0]))) == 0
+
+    def test_wrong_bus_power(self):
+        bus_ids, grid_lines = mesh_grid_lines()
+        solver = DCPowerFlowSolver(bus_ids, grid_lines)
+
+        with pytest.raises(ValueError):
+            solver.phase_angle(np.array([1, -1]))
+
+    def test_line_status_update(self):
+        bus_ids, grid_lines = mesh_grid_lines()
+        solver = DCPowerFlowSolver(bus_ids, grid_lines)
+        bus_power = np.array([1, -2, 0.5, 0.5])
+
+        solver.set_line_status(1, False)
+        expected_solver = DCPowerFlowSolver(bus_ids, grid_lines, line_status=[True, False, True, True])
+
+        assert solver.number_rank_updates == 1
+        assert np.allclose(solver.line_power(bus_power), expected_solver.line_power(bus_power))
+
+    def test_line_status_refactorise(self):
+        bus_ids, grid_lines = mesh_grid_lines()
+        grid_lines.append(GridLine(bus_ids[3], bus_ids[1], 5))
+        solver = DCPowerFlowSolver(bus_ids, grid_lines, max_rank_updates=1)
+        bus_power = np.array([1, -2, 0.5, 0.5])
+
+        solver.set_line_status(0, False)
+        solver.set_line_status(1, False)
+        expected_solver = DCPowerFlowSolver(bus_ids, grid_lines, line_status=[False, False, True, True, True])
+
+        assert solver.number_rank_updates == 0
+        assert np.allclose(solver.line_power(bus_power), expected_solver.line_power(bus_power))
+
+    def test_line_status_islanding(self):
+        bus_ids, grid_lines = mesh_grid_lines()
+        solver = DCPowerFlowSolver(bus_ids, grid_lines)
+
+        with pytest.raises(SingularGridNetworkError):
+            solver.set_line_status(3, False)
+
+        assert all(solver.line_status)
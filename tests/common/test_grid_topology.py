@@ -0,0 +1,82 @@
+import pytest
+
+from common.model.component import GridLine
+from common.model.grid_topology import DisjointSet, GridTopologyIndex
+
+
+class TestDisjointSet:
+    def test_union_find(self):
+        disjoint_set = DisjointSet()
+        for item in range(6):
+            disjoint_set.add(item)
+
+        assert disjoint_set.union(0, 1)
+        assert disjoint_set.union(2, 3)
+        assert disjoint_set.union(1, 3)
+        assert not disjoint_set.union(0, 2)
+
+        assert disjoint_set.number_sets == 3
+        assert disjoint_set.connected(0, 3)
+        assert not disjoint_set.connected(0, 4)
+        assert sorted(sorted(s) for s in disjoint_set.sets()) == [[0, 1, 2, 3], [4], [5]]
+
+
+class TestGridTopologyIndex:
+    def test_connected(self):
+        grid_lines = [GridLine('bus_0', 'bus_1', 20), GridLine('bus_1', 'bus_2', 20), GridLine('bus_2', 'bus_0', 10)]
+        topology = GridTopologyIndex(grid_lines)
+
+        assert topology.is_connected()
+        assert topology.is_connected('bus_0', 'bus_2')
+        assert topology.buses == ['bus_1', 'bus_0', 'bus_2']
+        assert topology.number_islands == 1
+
+    def test_islands(self):
+        grid_lines = [GridLine('bus_0', 'bus_1', 20), GridLine('bus_1', 'bus_2', 20), GridLine('bus_3', 'bus_4', 20)]
+        topology = GridTopologyIndex(grid_lines, buses=['bus_5'])
+
+        assert not topology.is_connected()
+        assert not topology.is_connected('bus_0', 'bus_4')
+        assert not topology.is_connected('bus_0', 'unknown')
+        assert sorted(sorted(island) for island in topology.islands()) == [
+            ['bus_0', 'bus_1', 'bus_2'], ['bus_3', 'bus_4'], ['bus_5']
+        ]
+
+    def test_empty(self):
+        assert not GridTopologyIndex([]).is_connected()
+        assert GridTopologyIndex([], buses=['slack']).is_connected()
+
+    def test_duplicate_lines(self):
+        grid_lines = [GridLine('bus_0', 'bus_1', 20), GridLine('bus_1', 'bus_0', 20), GridLine('bus_1', 'bus_0', 10)]
+        topology = GridTopologyIndex(grid_lines)
+
+        assert topology.duplicate_lines() == [GridLine('bus_1', 'bus_0', 20)]
+        assert topology.number_lines == 3
+
+    def test_incremental_update(self):
+        grid_lines = [GridLine('bus_0', 'bus_1', 20), GridLine('bus_1', 'bus_2', 20), GridLine('bus_2', 'bus_3', 20)]
+        topology = GridTopologyIndex(grid_lines)
+
+        topology.remove_line(grid_lines[1])
+        assert not topology.is_connected()
+        assert topology.number_islands == 2
+
+        topology.add_line(GridLine('bus_3', 'bus_0', 20))
+        assert topology.is_connected()
+
+        topology.add_line(grid_lines[1])
+        topology.remove_line(GridLine('bus_3', 'bus_0', 20))
+        assert topology.is_connected()
+
+        with pytest.raises(KeyError):
+            topology.remove_line(GridLine('bus_3', 'bus_0', 20))
+
+    def test_large_network(self):
+        num_buses = 10000
+        grid_lines = [GridLine(f'bus_{i}', f'bus_{i + 1}', 1) for i in range(num_buses - 1)]
+        grid_lines += [GridLine(f'bus_{i}', f'bus_{i + 2}', 1) for i in range(0, num_buses - 2, 7)]
+        topology = GridTopologyIndex(grid_lines)
+
+        assert topology.is_connected()
+        assert len(topology.duplicate_lines()) == 0
+        assert len(topology.buses) == num_buses
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+from microgrid.config.fleet import FleetDefinitionError, FleetModelBuilder, load_fleet
+from microgrid.config.registry import default_component_registry
+from microgrid.data_loader.domain import DuplicateUnitNameError
+
+
+def fleet_definition(number_loads: int = 4) -> dict:
+    time_series = {'timestamps': [0, 900, 1800], 'values': [1, 2, 3]}
+    components = [
+        {
+            'reference': 'LOAD_DEMAND', 'name': f'load_{i}', 'initial_timestamp': 0, 'bus_id': f'bus_{i % 2}',
+            'data_loader_data': {'demand_time_series': time_series}
+        }
+        for i in range(number_loads)
+    ]
+    components.extend([
+        {
+            'reference': 'RENEWABLE_UNIT', 'name': 'pv', 'initial_timestamp': 0, 'bus_id': 'bus_0',
+            'data_loader_data': {
+                'sample_point_to_power': {'points': [0, 1, 2], 'power_values': [0, 1, 2]},
+                'simulation_time_series': time_series,
+            }
+        },
+        {
+            'reference': 'THERMAL_GENERATOR', 'name': 'thermal', 'initial_timestamp': 0, 'bus_id': 'bus_1',
+            'data_loader_data': {'power_bounds': {'min': 0.2, 'max': 1}, 'droop_gain': 1}
+        },
+        {
+            'reference': 'GRID_NETWORK', 'name': 'grid', 'initial_timestamp': 0,
+            'data_loader_data': {
+                'grid_lines': [{'from_bus': 'bus_0', 'to_bus': 'bus_1', 'admittance': 20,
+                                'bounds': {'min': -1, 'max': 1}}]
+            }
+        },
+    ])
+    return {'name': 'site', 'components': components}
+
+
+class TestFleetModelBuilder:
+    def test_create_data_loader(self):
+        builder = FleetModelBuilder(default_component_registry())
+
+        data_loader = builder.create_data_loader(fleet_definition())
+
+        assert [load.name for load in data_loader.get_load_demands()] == [f'load_{i}' for i in range(4)]
+        assert [unit.name for unit in data_loader.get_renewable_units()] == ['pv']
+        assert [unit.name for unit in data_loader.get_thermal_generators()] == ['thermal']
+        assert data_loader.get_component_bus_id('load_3') == 'bus_1'
+        assert data_loader.microgrid_model_data().grid_model.buses == ['bus_1', 'bus_0']
+
+    def test_parallel_validation(self):
+        builder = FleetModelBuilder(default_component_registry(), max_workers=2, chunk_size=3)
+
+        microgrid_config = builder.create_microgrid_config(fleet_definition(number_loads=10))
+
+        assert [config.name for config in microgrid_config.load_config] == [f'load_{i}' for i in range(10)]
+
+    def test_load_json(self, tmp_path):
+        path = tmp_path / 'fleet.json'
+        path.write_text(json.dumps(fleet_definition()))
+
+        data_loader = load_fleet(str(path), default_component_registry())
+
+        assert len(data_loader.get_load_demands()) == 4
+
+    def test_load_toml(self, tmp_path):
+        pytest.importorskip('tomli')
+        path = tmp_path / 'fleet.toml'
+        path.write_text(
+            'name = "site"\n'
+            '[[components]]\n'
+            'reference = "THERMAL_GENERATOR"\n'
+            'name = "thermal"\n'
+            'initial_timestamp = 0\n'
+            'bus_id = "bus_0"\n'
+            'data_loader_data = {power_bounds = {min = 0.2, max = 1}, droop_gain = 1}\n'
+            '[[components]]\n'
+            'reference = "SINGLE_GRID_NETWORK"\n'
+            'name = "grid"\n'
+            'initial_timestamp = 0\n'
+            'data_loader_data = {}\n'
+        )
+
+        data_loader = load_fleet(str(path), default_component_registry())
+
+        assert [unit.name for unit in data_loader.get_thermal_generators()] == ['thermal']
+
+    def test_invalid_fleet(self, tmp_path):
+        builder = FleetModelBuilder(default_component_registry())
+        fleet = fleet_definition()
+
+        fleet['components'][1]['name'] = 'load_0'
+        with pytest.raises(DuplicateUnitNameError, match='load_0'):
+            builder.create_data_loader(fleet)
+
+        fleet = fleet_definition()
+        del fleet['components'][0]['bus_id']
+        fleet['components'][1]['data_loader_data'] = {}
+        with pytest.raises(FleetDefinitionError, match='2 invalid component configs'):
+            builder.create_data_loader(fleet)
+
+        with pytest.raises(FleetDefinitionError):
+            builder.create_data_loader({'name': 'site', 'components': fleet_definition()['components'][:-1]})
+
+        with pytest.raises(FleetDefinitionError):
+            load_fleet(str(tmp_path / 'fleet.yaml'), default_component_registry())
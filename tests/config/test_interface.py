@@ -0,0 +1,94 @@
+import pytest
+
+from microgrid.config.component.grid_forming_unit import ThermalGeneratorConfig, ThermalGeneratorConfigData
+from microgrid.config.interface import WrongComponentConfigData, compile_config_data
+from microgrid.config.registry import default_component_registry
+from microgrid.shared.timeseries import SimulationTimeSeries
+
+
+def thermal_config_dict(name: str = "thermal") -> dict:
+    return {
+        "name": name,
+        "initial_timestamp": 0,
+        "bus_id": "bus_1",
+        "data_loader_data": {"power_bounds": {"min": 0, "max": 10}, "droop_gain": 1},
+    }
+
+
+class TestComponentConfigRegistryData:
+    def test_config_schemas(self):
+        registry = default_component_registry()
+
+        for reference in registry.get_component_config_references():
+            schema = registry.get_component_config(reference).get_config_schema()
+            assert {"name", "initial_timestamp", "data_loader_data"} <= set(schema["properties"])
+
+    def test_config_schema_is_compiled_once(self):
+        registry_data = default_component_registry().get_component_config("THERMAL_GENERATOR")
+        compiled = compile_config_data(ThermalGeneratorConfigData)
+
+        schema = registry_data.get_config_schema()
+        schema["properties"].clear()
+
+        assert registry_data.compiled_config_data() is compiled
+        assert len(registry_data.get_config_schema()["properties"]) == 4
+
+    def test_validate_config_data(self):
+        registry_data = default_component_registry().get_component_config("THERMAL_GENERATOR")
+
+        config_data = registry_data.validate_config_data(thermal_config_dict())
+
+        assert isinstance(config_data, ThermalGeneratorConfigData)
+        assert config_data.data_loader_data.power_bounds.max == 10
+        with pytest.raises(WrongComponentConfigData, match="data_loader_data.droop_gain"):
+            registry_data.validate_config_data({**thermal_config_dict(), "data_loader_data": {
+                "power_bounds": {"min": 0, "max": 10}, "droop_gain": "high"}})
+
+    def test_validate_arbitrary_types(self):
+        registry_data = default_component_registry().get_component_config("LOAD_DEMAND")
+        load_config = {
+            "name": "load",
+            "initial_timestamp": 0,
+            "bus_id": "bus_1",
+            "data_loader_data": {"demand_time_series": SimulationTimeSeries(timestamps=[0, 1], values=[1, 2])},
+        }
+
+        assert registry_data.validate_configs([load_config]) == []
+        errors = registry_data.validate_configs([{**load_config, "data_loader_data": {"demand_time_series": [1]}}])
+        assert [e.index for e in errors] == [0]
+
+    def test_validate_configs(self):
+        registry_data = default_component_registry().get_component_config("THERMAL_GENERATOR")
+        configs = [thermal_config_dict(f"thermal_{i}") for i in range(5)]
+        configs[3] = {"name": "thermal_3"}
+
+        errors = registry_data.validate_configs(configs)
+
+        assert [e.index for e in errors] == [3]
+        assert "initial_timestamp: Field required" in errors[0].message
+
+    def test_create_config_classes(self):
+        registry_data = default_component_registry().get_component_config("THERMAL_GENERATOR")
+
+        configs = registry_data.create_config_classes([thermal_config_dict("a"), thermal_config_dict("b")])
+
+        assert [type(c) for c in configs] == [ThermalGeneratorConfig, ThermalGeneratorConfig]
+        assert [c.name for c in configs] == ["a", "b"]
+        with pytest.raises(WrongComponentConfigData, match="config 1"):
+            registry_data.create_config_classes([thermal_config_dict(), {}])
+
+
+class TestComponentRegistryValidation:
+    def test_validate_component_configs(self):
+        registry = default_component_registry()
+        components = [
+            ("THERMAL_GENERATOR", thermal_config_dict("a")),
+            ("UNKNOWN", {}),
+            ("STORAGE_POWERPLANT", {"name": "storage"}),
+            ("THERMAL_GENERATOR", {"name": "b"}),
+        ]
+
+        errors = registry.validate_component_configs(components)
+
+        assert [e.index for e in errors] == [1, 2, 3]
+        assert "UNKNOWN" in errors[0].message
@@ -0,0 +1,43 @@
+import pytest
+
+from microgrid.config.component.grid_forming_unit import ThermalGeneratorConfig
+from microgrid.config.interface import ClassImportModuler, UnknownComponentConfigType, import_class
+from microgrid.config.registry import default_component_registry
+from tests.utils.test_mocks import MockUnitConfig
+
+
+class TestClassImportModuler:
+    def test_create_class_is_cached(self):
+        import_class.cache_clear()
+        class_importer = ClassImportModuler(ThermalGeneratorConfig.__module__, ThermalGeneratorConfig.__name__)
+
+        assert class_importer.create_class() is ThermalGeneratorConfig
+        assert class_importer() is ThermalGeneratorConfig
+        assert import_class.cache_info().hits == 1
+
+    def test_hash(self):
+        class_importer = ClassImportModuler(ThermalGeneratorConfig.__module__, ThermalGeneratorConfig.__name__)
+        same_importer = ClassImportModuler(ThermalGeneratorConfig.__module__, ThermalGeneratorConfig.__name__)
+
+        assert {class_importer: 1}[same_importer] == 1
+
+
+class TestDefaultComponentRegistry:
+    def test_references(self):
+        registry = default_component_registry()
+
+        assert registry.get_component_config_references() == [
+            'THERMAL_GENERATOR', 'RENEWABLE_UNIT', 'STORAGE_POWERPLANT', 'LOAD_DEMAND',
+            'SINGLE_GRID_NETWORK', 'GRID_NETWORK'
+        ]
+        assert registry.get_thermal_config_references() == ['THERMAL_GENERATOR']
+        assert registry.get_grid_config_references() == ['SINGLE_GRID_NETWORK', 'GRID_NETWORK']
+        assert registry.get_component_config('LOAD_DEMAND').reference == 'LOAD_DEMAND'
+
+    def test_unknown_references(self):
+        registry = default_component_registry()
+
+        with pytest.raises(UnknownComponentConfigType):
+            registry.get_component_config('UNKNOWN')
+        with pytest.raises(UnknownComponentConfigType, match='MockUnitConfig'):
+            registry.get_component_config_reference(MockUnitConfig.__new__(MockUnitConfig))
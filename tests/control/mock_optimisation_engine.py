@@ -1,10 +1,12 @@
-from typing import List, Union, Callable, TypeVar, Optional, Any
+from typing import List, Union, Callable, TypeVar, Optional, Any, Tuple
 
 from common.timeseries.domain import Timestamps, Bounds, TimeseriesModel, BoundTimeseries
 from control.optimisation_engine.domain import IOptimisationIndexVariable, IOptimisationVariable, \
     IBaseVariable, OptimisationExpression, ConstraintType, ITimeIndexBaseModel
+from control.optimisation_engine.cvx_engine.variable import matrix_bound_constraints
 from control.optimisation_engine.interface import IOptimisationEngine
 import cvxpy as cp
+import numpy as np
 
 
 class MockOptimisationVariable(IOptimisationVariable):
@@ -37,6 +39,9 @@ class MockOptimisationIndexVariable(IOptimisationIndexVariable):
     def evaluate(self):
         return self._value.value
 
+    def update_value(self, value):
+        self._value.value = np.asarray(value, dtype=float).reshape(self._value.shape)
+
 
 class MockBaseVariable(IBaseVariable):
     def __init__(self, name: str,
@@ -151,8 +156,10 @@ class MockOptimisationEngine(IOptimisationEngine):
                 self._objective = objective.value
 
     def update_objective(self, variable: IOptimisationVariable, obj_callable: Callable):
-        if self._objective is not None:
-            if isinstance(variable.value, cp.Expression):
+        if isinstance(variable.value, cp.Expression):
+            if self._objective is None:
+                self._objective = obj_callable(variable.value)
+            else:
                 self._objective = self._objective + obj_callable(variable.value)
 
     def add_timeindex_parameter(self, name: str, value: TimeseriesModel):
@@ -192,3 +199,31 @@ class MockOptimisationEngine(IOptimisationEngine):
         self._constraints.extend(cvx_constraint)
         constraint = MockOptimisationIndexVariable(cvx_constraint)  # type: ignore
         return constraint
+
+    def add_matrix_parameter(self, name: str, value: np.ndarray):
+        var = MockOptimisationIndexVariable(cp.Parameter(np.shape(value), name=name, value=value))
+        self._variable.append(var)
+        return var
+
+    def add_matrix_variable(self, name: str, lower: np.ndarray, upper: np.ndarray, initial_value: np.ndarray):
+        cvx_var = cp.Variable(np.shape(initial_value), name=name, value=initial_value)
+        var = MockOptimisationIndexVariable(cvx_var)
+        self._variable.append(var)
+        self._constraints.extend(matrix_bound_constraints(cvx_var, np.asarray(lower), np.asarray(upper)))
+        return var
+
+    def add_matrix_binary_variable(self, name: str, initial_value: np.ndarray):
+        var = MockOptimisationIndexVariable(cp.Variable(np.shape(initial_value), name=name, boolean=True))
+        self._variable.append(var)
+        return var
+
+    def add_linear_matrix_constraint(
+        self, name: str, terms: List[Tuple[Any, ...]], constant: Any = 0, equality: bool = True
+    ):
+        expression = constant
+        for matrix, variables, *time_matrix in terms:
+            term = matrix @ cp.vstack([v.value for v in variables])
+            expression = expression + (term @ time_matrix[0] if len(time_matrix) > 0 else term)
+        cvx_constraint = expression == 0 if equality else expression <= 0
+        self._constraints.append(cvx_constraint)
+        return MockOptimisationVariable(cvx_constraint)  # type: ignore
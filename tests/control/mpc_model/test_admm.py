@@ -0,0 +1,136 @@
+import os
+
+import numpy as np
+import pytest
+
+from common.model.component import GridLine
+from common.timeseries.domain import Bounds, Timestamps, TimeseriesData
+from control.mpc_model.admm import ADMMSolver
+from control.mpc_model.control_data_model import (
+    ControlGridNetworkData,
+    ControlLoadDemandData,
+    ControlRenewableUnitData,
+    ControlStoragePowerPlantData,
+)
+from control.optimisation_engine.cvx_engine.cvx_engine import CvxEngine
+
+
+class RecordingEngineFactory:
+    def __init__(self, path):
+        self._path = path
+
+    def __call__(self):
+        with open(self._path, 'a') as f:
+            f.write(f"{os.getpid()}\n")
+        return CvxEngine()
+
+    def builds(self):
+        with open(self._path) as f:
+            return f.read().split()
+
+
+class TestADMMSolver:
+    def _set_up(self):
+        self.timestamps = Timestamps([360, 720, 1080])
+        self.storage = ControlStoragePowerPlantData('storage', self.timestamps, Bounds(-10, 10), Bounds(0, 50), 25)
+        self.renewable = ControlRenewableUnitData(
+            'renewable', self.timestamps, TimeseriesData(self.timestamps, [1, 4, 0]), Bounds(0, 10)
+        )
+        self.load = ControlLoadDemandData(
+            'load', self.timestamps, TimeseriesData(self.timestamps, [2, 3, 4]), Bounds(0, 10)
+        )
+        self.control_data = [self.storage, self.renewable, self.load]
+        self.power_costs = {'storage': 1}
+
+    def test_balance_consensus(self):
+        self._set_up()
+        solver = ADMMSolver(self.control_data, self.power_costs, tolerance=1e-4)
+
+        statistics = solver.solve()
+
+        assert statistics.converged
+        assert statistics.iterations == len(statistics.primal_residuals) == len(statistics.dual_residuals)
+        assert statistics.primal_residuals[-1] <= 1e-4
+        assert np.allclose(solver.power['storage'], [1, -1, 4], atol=1e-2)
+        assert np.allclose(solver.power['renewable'], [1, 4, 0], atol=1e-2)
+        assert np.array_equal(solver.power['load'], [2, 3, 4])
+
+    def test_grid_consensus(self):
+        self._set_up()
+        grid = ControlGridNetworkData(
+            'grid', self.timestamps, [GridLine('bus_0', 'bus_1', 1, Bounds(-2, 2))], ['bus_0', 'bus_1']
+        )
+        bus_ids = {'storage': 'bus_1', 'renewable': 'bus_0', 'load': 'bus_1'}
+        solver = ADMMSolver(self.control_data + [grid], self.power_costs, bus_ids, tolerance=1e-4)
+
+        statistics = solver.solve()
+
+        assert statistics.converged
+        assert solver.nets == ['bus_0', 'bus_1']
+        assert np.allclose(solver.power['renewable'], [1, 2, 0], atol=1e-2)
+        assert np.allclose(solver.power['storage'], [1, 1, 4], atol=1e-2)
+
+    def test_iteration_limit(self):
+        self._set_up()
+        solver = ADMMSolver(self.control_data, self.power_costs, tolerance=1e-12, max_iterations=3)
+
+        statistics = solver.solve()
+
+        assert not statistics.converged
+        assert statistics.iterations == 3
+
+    def test_process_pool(self):
+        self._set_up()
+        serial = ADMMSolver(self.control_data, self.power_costs, tolerance=1e-4)
+
+        serial.solve()
+        with ADMMSolver(self.control_data, self.power_costs, tolerance=1e-4, max_workers=2) as parallel:
+            statistics = parallel.solve()
+
+        assert statistics.converged
+        assert statistics.iterations == serial.statistics.iterations
+        for name, power in serial.power.items():
+            assert np.allclose(parallel.power[name], power, atol=1e-3)
+
+    def test_serial_subproblem_reuse(self, tmp_path):
+        self._set_up()
+        engine_factory = RecordingEngineFactory(tmp_path / 'builds')
+        solver = ADMMSolver(self.control_data, self.power_costs, tolerance=1e-4, engine_factory=engine_factory)
+
+        solver.solve()
+        statistics = solver.solve()
+
+        assert statistics.converged
+        assert len(engine_factory.builds()) == 2
+
+    def test_process_pool_worker_affinity(self, tmp_path):
+        self._set_up()
+        grid = ControlGridNetworkData(
+            'grid', self.timestamps, [GridLine('bus_0', 'bus_1', 1, Bounds(-2, 2))], ['bus_0', 'bus_1']
+        )
+        bus_ids = {'storage': 'bus_1', 'renewable': 'bus_0', 'load': 'bus_1'}
+        engine_factory = RecordingEngineFactory(tmp_path / 'builds')
+        with ADMMSolver(
+            self.control_data + [grid], self.power_costs, bus_ids, tolerance=1e-4, max_workers=2,
+            engine_factory=engine_factory,
+        ) as solver:
+            statistics = solver.solve()
+            builds = engine_factory.builds()
+            second_statistics = solver.solve()
+
+        assert statistics.converged and second_statistics.converged
+        assert statistics.iterations > 1
+        assert len(builds) == 3
+        assert sorted(builds.count(pid) for pid in set(builds)) == [1, 2]
+        assert engine_factory.builds() == builds
+        assert np.allclose(solver.power['renewable'], [1, 2, 0], atol=1e-2)
+        assert solver._executors is None
+
+    def test_missing_bus(self):
+        self._set_up()
+        grid = ControlGridNetworkData(
+            'grid', self.timestamps, [GridLine('bus_0', 'bus_1', 1, Bounds(-2, 2))], ['bus_0', 'bus_1']
+        )
+
+        with pytest.raises(ValueError):
+            ADMMSolver(self.control_data + [grid], bus_ids={'storage': 'bus_0'})
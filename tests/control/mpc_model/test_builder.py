@@ -0,0 +1,185 @@
+from types import SimpleNamespace
+
+import cvxpy as cp
+import numpy as np
+import pytest
+
+from common.model.component import ComponentType, ControlComponentData, GridControlComponentData, GridLine
+from common.timeseries.domain import Bounds, ConstantTimeseriesData, TimeseriesData
+from control.mpc_model.builder import MissingForecastError, MissingMeasurementError, MPCModelBuilder
+from control.mpc_model.component.grid_model import ControlGridNetwork
+from control.mpc_model.component.load_demand import LoadDemand
+from control.mpc_model.component.renewable_unit import RenewablePowerUnit
+from control.mpc_model.component.storage_unit import ControlStoragePowerPlant
+from control.mpc_model.component.thermal_unit import ControlThermalGenerator
+from control.mpc_model.domain import Horizon
+from control.optimisation_engine.domain import OptimisationExpression
+from tests.control.mock_optimisation_engine import MockOptimisationEngine
+
+
+class TestMPCModelBuilder:
+    def _set_up(self):
+        self.horizon = Horizon(0, 3600, 900)
+        self.builder = MPCModelBuilder(self.horizon)
+
+    def _component_data(self, energy: float = 2, switch_state: bool = False, storage_max: float = 10):
+        return [
+            ControlComponentData("storage", ComponentType.Storage, 0, Bounds(-storage_max, storage_max),
+                                 measurements={"energy": energy}, energy_bound=Bounds(0, 5)),
+            ControlComponentData("thermal", ComponentType.Thermal, 0, Bounds(1, 10),
+                                 measurements={"switch_state": switch_state}),
+            ControlComponentData("pv", ComponentType.Renewable, 0, Bounds(0, 8)),
+            ControlComponentData("load", ComponentType.Load, 0),
+        ]
+
+    def _forecasts(self, pv: float = 4, load: float = 6):
+        timestamps = self.horizon.timestamps
+        return {
+            "pv": ConstantTimeseriesData(timestamps, pv),
+            "load": TimeseriesData(timestamps, [load] * len(timestamps)),
+        }
+
+    def _grid_data(self, line_bounds: Bounds = Bounds(-5, 5)):
+        return GridControlComponentData(
+            "grid", ComponentType.Grid, [GridLine("bus_0", "bus_1", 1, line_bounds)]
+        )
+
+    def test_build(self):
+        self._set_up()
+
+        components = self.builder.build(self._component_data(), self._forecasts(), self._grid_data())
+
+        assert [type(c) for c in components] == [
+            ControlStoragePowerPlant, ControlThermalGenerator, RenewablePowerUnit, LoadDemand, ControlGridNetwork
+        ]
+        assert components[4]._data.buses == ["bus_0", "bus_1"]
+        assert self.builder.statistics.built == 5
+
+    def test_reuse_components_with_new_measurements_and_forecasts(self):
+        self._set_up()
+        components = self.builder.build(self._component_data(), self._forecasts(), self._grid_data())
+
+        updated_components = self.builder.build(
+            self._component_data(energy=3, switch_state=True), self._forecasts(pv=2, load=7), self._grid_data()
+        )
+
+        assert all(c is u for c, u in zip(components, updated_components))
+        assert self.builder.statistics.built == 5
+        assert self.builder.statistics.updated == 5
+        storage, thermal, pv, load, _ = updated_components
+        assert storage._initial_energy_constraint.constraint_expression.variable_2.parameter_value == 3
+        assert thermal._data.current_switch_state
+        assert all(c.constraint_expression.variable_2.parameter_value == 2 for c in pv._power_constraint.value)
+        assert [p.parameter_value for p in load.power.value] == [7] * 4
+
+    def test_rebuild_changed_components(self):
+        self._set_up()
+        components = self.builder.build(self._component_data(), self._forecasts(), self._grid_data())
+
+        updated_components = self.builder.build(
+            self._component_data(storage_max=20), self._forecasts(), self._grid_data(Bounds(-2, 2))
+        )
+
+        assert [c is u for c, u in zip(components, updated_components)] == [False, True, True, True, False]
+        assert updated_components[0].power.bounds.max.value == 20
+
+    def test_remove_components(self):
+        self._set_up()
+        self.builder.build(self._component_data(), self._forecasts())
+
+        components = self.builder.build(self._component_data()[:2], self._forecasts())
+
+        assert len(components) == 2
+        assert self.builder.statistics.removed == 2
+
+    def test_advance_horizon_reuses_components(self):
+        self._set_up()
+        components = self.builder.build(self._component_data(), self._forecasts(), self._grid_data())
+
+        for since in (900, 1800):
+            self.horizon = Horizon(since, since + 3600, 900)
+            self.builder.advance(self.horizon)
+            updated_components = self.builder.build(
+                self._component_data(energy=3), self._forecasts(load=since), self._grid_data()
+            )
+            assert all(c is u for c, u in zip(components, updated_components))
+
+        assert self.builder.statistics.built == 5
+        assert self.builder.statistics.updated == 10
+        storage, thermal, pv, load, grid = updated_components
+        assert list(storage.power.timestamps.values) == [1800, 2700, 3600, 4500]
+        assert [v.name for v in storage.energy.value] == [f"storage_energy_{t}" for t in (1800, 2700, 3600, 4500)]
+        assert list(storage._dynamics_constraint.timestamps.values) == [1800, 2700, 3600]
+        assert thermal.switch_state.value[0].name == "thermal_switch_state_1800"
+        assert grid.line_power[0].value[-1].name == "grid_line_power_bus_1bus_0_4500"
+        assert grid._pf_constraint[0].value[0].name == "grid_line_0_1800"
+        assert load.power.value[0].name == "load_power_1800"
+
+        mock_engine = MockOptimisationEngine()
+        for component in updated_components:
+            component.extend_optimisation_model(mock_engine)
+        assert load.power.evaluate() == [1800] * 4
+
+    def test_rebuild_components_with_new_sampling_time(self):
+        self._set_up()
+        components = self.builder.build(self._component_data(), self._forecasts())
+
+        self.horizon = Horizon(0, 7200, 1800)
+        self.builder.advance(self.horizon)
+        updated_components = self.builder.build(self._component_data(), self._forecasts())
+
+        assert not any(c is u for c, u in zip(components, updated_components))
+        assert self.builder.statistics.built == 8
+
+    def test_missing_data(self):
+        self._set_up()
+
+        with pytest.raises(MissingForecastError):
+            self.builder.build(self._component_data(), {})
+        with pytest.raises(MissingMeasurementError):
+            self.builder.build(
+                [ControlComponentData("thermal", ComponentType.Thermal, 0, Bounds(1, 10))], self._forecasts()
+            )
+
+    def test_updated_components_extend_optimisation_model(self):
+        self._set_up()
+        self.builder.build(self._component_data(), self._forecasts())
+        components = self.builder.build(self._component_data(), self._forecasts(load=8))
+
+        mock_engine = MockOptimisationEngine()
+        for component in components:
+            component.extend_optimisation_model(mock_engine)
+
+        assert components[3].power.evaluate() == [8] * 4
+
+    def test_updated_components_update_extended_engine(self):
+        self._set_up()
+        storage, _, pv, _ = self.builder.build(self._component_data(), self._forecasts())
+        mock_engine = MockOptimisationEngine()
+        for component in (storage, pv):
+            component.extend_optimisation_model(mock_engine)
+        objective = cp.sum(storage.power.optimisation_value.value - pv.power.optimisation_value.value)
+        mock_engine.add_objective('obj', OptimisationExpression(objective))
+        mock_engine.generate_model()
+        mock_engine.solve()
+        assert storage.energy.evaluate()[0] == pytest.approx(2, abs=1e-5)
+        assert np.allclose(pv.power.evaluate(), 4, atol=1e-5)
+
+        self.builder.build(self._component_data(energy=4), self._forecasts(pv=3))
+        mock_engine.solve()
+
+        assert mock_engine.model.status == 'optimal'
+        assert storage.energy.evaluate()[0] == pytest.approx(4, abs=1e-5)
+        assert np.allclose(pv.power.evaluate(), 3, atol=1e-5)
+
+    def test_build_from_microgrid(self):
+        self._set_up()
+        grid_model = SimpleNamespace(control_component_data=self._grid_data(), buses=["bus_1", "bus_0"])
+        microgrid_model = SimpleNamespace(
+            grid_model=grid_model, control_component_data=lambda: self._component_data()
+        )
+
+        components = self.builder.build_from_microgrid(microgrid_model, self._forecasts())
+
+        assert len(components) == 5
+        assert components[4]._data.buses == ["bus_1", "bus_0"]
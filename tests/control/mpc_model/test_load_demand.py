@@ -1,6 +1,9 @@
-from common.timeseries.domain import Timestamps, ConstantTimeseriesData, Bounds
+import pytest
+
+from common.timeseries.domain import Timestamps, ConstantTimeseriesData, Bounds, TimeseriesData
 from control.mpc_model.component.load_demand import LoadDemand
 from control.mpc_model.control_data_model import ControlLoadDemandData
+from control.optimisation_engine.domain import UnknownTimestampError
 from tests.control.mock_optimisation_engine import MockOptimisationEngine
 
 
@@ -18,3 +21,30 @@ class TestLoadDemand:
         assert all([load.power[i].evaluate() == power_forecast.get_value(t)
                     for i, t in enumerate(timestamps)])
         assert mock_engine.variable[0] == load.power.optimisation_value
+
+    def test_update_extended_parameter(self):
+        timestamps = Timestamps([1, 2, 3])
+        data = ControlLoadDemandData('load', timestamps, ConstantTimeseriesData(timestamps, 10), Bounds(0, 10))
+        load = LoadDemand(data)
+        mock_engine = MockOptimisationEngine()
+        load.extend_optimisation_model(mock_engine)
+
+        load.update(ControlLoadDemandData('load', timestamps, TimeseriesData(timestamps, [4, 5, 6]), Bounds(0, 10)))
+
+        assert list(load.power.optimisation_value.evaluate()) == [4, 5, 6]
+        assert [p.evaluate() for p in load.power.value] == [4, 5, 6]
+
+    def test_update_parameter_timestamps(self):
+        timestamps = Timestamps([1, 2, 3])
+        load = LoadDemand(
+            ControlLoadDemandData('load', timestamps, ConstantTimeseriesData(timestamps, 10), Bounds(0, 10))
+        )
+        shifted_timestamps = Timestamps([2, 3, 4])
+
+        with pytest.raises(UnknownTimestampError):
+            load.power.update_parameter_value(ConstantTimeseriesData(shifted_timestamps, 5))
+        load.power.update_parameter_value(ConstantTimeseriesData(shifted_timestamps, 5), rekey=True)
+
+        assert load.power.timestamps is shifted_timestamps
+        assert [p.name for p in load.power.value] == ['load_power_2', 'load_power_3', 'load_power_4']
+        assert [p.parameter_value for p in load.power.value] == [5] * 3
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from common.model.component import GridLine
+from common.timeseries.domain import Bounds, Timestamps, TimeseriesData
+from control.mpc_model.component.grid_model import ControlGridNetwork
+from control.mpc_model.component.load_demand import LoadDemand
+from control.mpc_model.component.power_balance import NodalPowerBalance, UnknownBusError, unit_bus_matrix
+from control.mpc_model.component.storage_unit import ControlStoragePowerPlant
+from control.mpc_model.control_data_model import (
+    ControlGridNetworkData,
+    ControlLoadDemandData,
+    ControlStoragePowerPlantData,
+)
+from control.optimisation_engine.domain import OptimisationExpression
+from tests.control.mock_optimisation_engine import MockOptimisationEngine
+
+
+class TestNodalPowerBalance:
+    def _set_up(self):
+        self.timestamps = Timestamps([360, 720, 1080])
+        self.buses = ['bus_0', 'bus_1', 'bus_2']
+        lines = [
+            GridLine('bus_0', 'bus_1', 1, Bounds(-10, 10)),
+            GridLine('bus_1', 'bus_2', 1, Bounds(-10, 10)),
+        ]
+        self.grid = ControlGridNetwork(ControlGridNetworkData('grid', self.timestamps, lines, self.buses))
+        self.storage = ControlStoragePowerPlant(
+            ControlStoragePowerPlantData('storage', self.timestamps, Bounds(-10, 10), Bounds(0, 50), 25)
+        )
+        self.loads = [
+            LoadDemand(ControlLoadDemandData(
+                f'load_{i}', self.timestamps, TimeseriesData(self.timestamps, values), Bounds(0, 10)
+            ))
+            for i, values in enumerate([[1, 2, 3], [2, 2, 2]])
+        ]
+
+    def test_unit_bus_matrix(self):
+        matrix = unit_bus_matrix(['bus_0', 'bus_1'], ['bus_1', 'bus_0', 'bus_1'])
+
+        assert np.array_equal(matrix.toarray(), [[0, 1], [1, 0], [0, 1]])
+        with pytest.raises(UnknownBusError):
+            unit_bus_matrix(['bus_0'], ['bus_1'])
+
+    def test_reorder_bus_columns(self):
+        self._set_up()
+        balance = NodalPowerBalance(
+            'balance', self.grid, [self.storage], self.loads,
+            np.array([[0, 0, 1], [1, 0, 0], [0, 1, 0]]), bus_ids=['bus_2', 'bus_0', 'bus_1']
+        )
+
+        number_buses = len(self.buses)
+        assert np.array_equal(balance._generator_bus_matrix.toarray()[:number_buses], [[0], [1], [0]])
+        assert np.array_equal(balance._load_bus_matrix.toarray()[:number_buses], [[0, -1], [0, 0], [-1, 0]])
+        with pytest.raises(ValueError):
+            NodalPowerBalance('balance', self.grid, [self.storage], self.loads, np.ones((2, 3)))
+
+    def test_dispatch_network(self):
+        self._set_up()
+        balance = NodalPowerBalance.from_bus_ids(
+            'balance', self.grid, [self.storage], self.loads, ['bus_2'], ['bus_0', 'bus_1']
+        )
+        mock_engine = MockOptimisationEngine()
+        for component in [self.grid, self.storage, *self.loads, balance]:
+            component.extend_optimisation_model(mock_engine)
+        mock_engine.add_objective(
+            'obj', OptimisationExpression(sum(self.storage.power.optimisation_value.value))
+        )
+
+        mock_engine.generate_model()
+        mock_engine.solve()
+
+        assert mock_engine.model.status == 'optimal'
+        assert np.allclose(self.storage.power.optimisation_value.evaluate(), [3, 4, 5], atol=1e-5)
+        bus_power = np.array([b.optimisation_value.evaluate() for b in self.grid.bus_power])
+        assert np.allclose(bus_power, [[-1, -2, -3], [-2, -2, -2], [3, 4, 5]], atol=1e-5)
+        assert np.allclose(balance.constraint.value.residual, 0, atol=1e-5)
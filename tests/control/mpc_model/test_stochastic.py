@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+
+from common.model.component import GridLine
+from common.timeseries.domain import Bounds, Timestamps, TimeseriesData
+from control.mpc_model.control_data_model import (
+    ControlGridNetworkData,
+    ControlLoadDemandData,
+    ControlRenewableUnitData,
+    ControlStoragePowerPlantData,
+    ControlThermalGeneratorData,
+    ForecastScenarios,
+)
+from control.mpc_model.stochastic import StochasticMPCModel, non_anticipativity_matrix, repeat_scenarios
+from tests.control.mock_optimisation_engine import MockOptimisationEngine
+
+
+class TestStochasticMPCModel:
+    def _set_up(self):
+        self.timestamps = Timestamps([360, 720, 1080])
+        self.scenarios = ForecastScenarios(
+            self.timestamps,
+            [1, 3],
+            {
+                'load': [[2, 3, 4], [2, 5, 6]],
+                'renewable': [[1, 1, 1], [1, 4, 0]],
+            },
+        )
+        self.storage = ControlStoragePowerPlantData('storage', self.timestamps, Bounds(-10, 10), Bounds(0, 50), 25)
+        self.renewable = ControlRenewableUnitData(
+            'renewable', self.timestamps, TimeseriesData(self.timestamps, [1, 1, 1]), Bounds(0, 10)
+        )
+        self.load = ControlLoadDemandData(
+            'load', self.timestamps, TimeseriesData(self.timestamps, [2, 3, 4]), Bounds(0, 10)
+        )
+
+    def test_forecast_scenarios(self):
+        self._set_up()
+
+        assert self.scenarios.number_scenarios == 2
+        assert np.allclose(self.scenarios.weights, [0.25, 0.75])
+        with pytest.raises(ValueError):
+            ForecastScenarios(self.timestamps, [1, 1], {'load': [[1, 2, 3]]})
+
+        scenarios = ForecastScenarios.from_scenarios(
+            self.timestamps,
+            [
+                {'load': TimeseriesData(self.timestamps, [1, 2, 3])},
+                {'load': TimeseriesData(self.timestamps, [1, 3, 3])},
+            ],
+            [1, 1],
+        )
+        assert np.array_equal(scenarios.forecasts['load'], [[1, 2, 3], [1, 3, 3]])
+
+    def test_scenario_matrices(self):
+        assert np.array_equal(repeat_scenarios([1, 2], 2, 3), [[1] * 3, [1] * 3, [2] * 3, [2] * 3])
+        assert np.array_equal(
+            non_anticipativity_matrix(2, 3).toarray(),
+            [[-1, 1, 0, 0, 0, 0], [-1, 0, 1, 0, 0, 0], [0, 0, 0, -1, 1, 0], [0, 0, 0, -1, 0, 1]],
+        )
+
+    def test_dispatch_scenarios(self):
+        self._set_up()
+        model = StochasticMPCModel(
+            'mpc', self.scenarios, storage=[self.storage], renewable=[self.renewable], loads=[self.load]
+        )
+        mock_engine = MockOptimisationEngine()
+        model.extend_optimisation_model(mock_engine)
+        model.add_expected_power_cost(mock_engine, {'storage': 1})
+
+        mock_engine.generate_model()
+        mock_engine.solve()
+
+        assert mock_engine.model.status == 'optimal'
+        power = model.scenario_power()
+        assert np.allclose(power['storage'], [[1, 2, 3], [1, 1, 6]], atol=1e-5)
+        assert np.allclose(power['renewable'], [[1, 1, 1], [1, 4, 0]], atol=1e-5)
+        assert np.allclose(power['load'], [[2, 3, 4], [2, 5, 6]])
+        assert model.first_stage_setpoints() == pytest.approx({'storage': 1, 'renewable': 1}, abs=1e-5)
+        assert len(model.non_anticipativity_constraints) == 2
+
+    def test_dispatch_network_scenarios(self):
+        self._set_up()
+        buses = ['bus_0', 'bus_1']
+        grid = ControlGridNetworkData('grid', self.timestamps, [GridLine('bus_0', 'bus_1', 1, Bounds(-5, 5))], buses)
+        thermal = ControlThermalGeneratorData('thermal', self.timestamps, Bounds(1, 10), current_switch_state=True)
+        model = StochasticMPCModel(
+            'mpc', self.scenarios, storage=[self.storage], thermal=[thermal], renewable=[self.renewable],
+            loads=[self.load], grid=grid,
+            bus_ids={'storage': 'bus_1', 'thermal': 'bus_0', 'renewable': 'bus_1', 'load': 'bus_1'},
+        )
+        mock_engine = MockOptimisationEngine()
+        model.extend_optimisation_model(mock_engine)
+        model.add_expected_power_cost(mock_engine, {'storage': 2, 'thermal': 1})
+
+        mock_engine.generate_model()
+        mock_engine.solve()
+
+        assert mock_engine.model.status == 'optimal'
+        power = model.scenario_power()
+        line_power = np.asarray(model.grid.line_power.evaluate())
+        assert np.allclose(line_power, power['thermal'], atol=1e-5)
+        assert np.all(line_power <= 5 + 1e-5)
+        assert np.allclose(power['thermal'][:, 0], power['thermal'][0, 0], atol=1e-5)
+        assert np.allclose(power['thermal'] + power['storage'] + power['renewable'], power['load'], atol=1e-5)
+
+    def test_thermal_commitment_scenarios(self):
+        timestamps = Timestamps([0, 3600, 7200])
+        scenarios = ForecastScenarios(
+            timestamps, [1, 1], {'load': [[2, 2, 2], [2, 3, 2]], 'renewable': [[5] * 3] * 2}
+        )
+        renewable = ControlRenewableUnitData(
+            'renewable', timestamps, TimeseriesData(timestamps, [5] * 3), Bounds(0, 10)
+        )
+        load = ControlLoadDemandData('load', timestamps, TimeseriesData(timestamps, [2] * 3), Bounds(0, 10))
+
+        switch_states = []
+        for current_switch_state in (True, False):
+            thermal = ControlThermalGeneratorData(
+                'thermal', timestamps, Bounds(1, 10), current_switch_state=current_switch_state, min_up_time=7200,
+                current_state_duration=0, shutdown_power=4,
+            )
+            model = StochasticMPCModel('mpc', scenarios, thermal=[thermal], renewable=[renewable], loads=[load])
+            mock_engine = MockOptimisationEngine()
+            model.extend_optimisation_model(mock_engine)
+            model.add_expected_power_cost(mock_engine, {'thermal': 1})
+
+            mock_engine.generate_model()
+            mock_engine.solve()
+
+            assert mock_engine.model.status == 'optimal'
+            constraints = set(model.blocks[0].constraints)
+            assert {'transition', 'min_up_time', 'shutdown_power'} <= constraints
+            assert ('initial_state' in constraints) == current_switch_state
+            switch_states.append(np.asarray(model.blocks[0].switch_state.evaluate()))
+
+        assert np.allclose(switch_states[0], [[1, 1, 0], [1, 1, 0]], atol=1e-5)
+        assert np.allclose(switch_states[1], 0, atol=1e-5)
+
+    def test_missing_bus(self):
+        self._set_up()
+        grid = ControlGridNetworkData(
+            'grid', self.timestamps, [GridLine('bus_0', 'bus_1', 1, Bounds(-5, 5))], ['bus_0', 'bus_1']
+        )
+        model = StochasticMPCModel('mpc', self.scenarios, storage=[self.storage], grid=grid, bus_ids={})
+
+        with pytest.raises(ValueError):
+            model.extend_optimisation_model(MockOptimisationEngine())
@@ -1,3 +1,8 @@
+from dataclasses import replace
+
+import cvxpy as cp
+import numpy as np
+
 from common.timeseries.domain import Timestamps, ConstantTimeseriesData, Bounds, BoundTimeseries
 from control.mpc_model.component.thermal_unit import ControlThermalGenerator
 from control.mpc_model.control_data_model import ControlThermalGeneratorData
@@ -109,3 +114,75 @@ class TestControlThermalUnit:
         self.mock_engine.solve()
 
         assert self.mock_engine.model.status == 'infeasible'
+
+
+class TestControlThermalUnitCommitment:
+    def _solve(self, demand, var_cost: float, power_cost: float, **kwargs):
+        timestamps = Timestamps(list(range(1, len(demand) + 1)))
+        current_switch_state = kwargs.pop('current_switch_state', False)
+        self.data = ControlThermalGeneratorData('unit', timestamps, Bounds(2, 10), current_switch_state, **kwargs)
+        self.thermal_unit = ControlThermalGenerator(data=self.data)
+        self.mock_engine = MockOptimisationEngine()
+        self.thermal_unit.extend_optimisation_model(self.mock_engine)
+
+        var_1 = self.mock_engine.add_timeindex_variable(
+            'var_1', BoundTimeseries.constant_bound_timeseries(timestamps, 0, 10), ConstantTimeseriesData(timestamps, 0)
+        ).value
+        power = self.thermal_unit.power.optimisation_value.value
+        self.mock_engine.constraints.append(var_1 + power == demand)
+        self.mock_engine.add_objective('obj_1', OptimisationExpression(cp.sum(var_cost * var_1 + power_cost * power)))
+
+        self.mock_engine.generate_model()
+        self.mock_engine.solve()
+        return np.around(self.thermal_unit.switch_state.optimisation_value.evaluate())
+
+    def test_compact_formulation(self):
+        self.data = ControlThermalGeneratorData('unit', Timestamps([1, 2, 3]), Bounds(2, 10), False)
+        thermal_unit = ControlThermalGenerator(data=self.data)
+        thermal_unit.extend_optimisation_model(MockOptimisationEngine())
+
+        assert thermal_unit.startup is None and thermal_unit.shutdown is None
+        assert list(thermal_unit.constraints) == ['power_min', 'power_max']
+
+    def test_without_min_up_time(self):
+        switch_state = self._solve([12, 3, 3, 3, 3, 3], var_cost=0.1, power_cost=1)
+
+        assert list(switch_state) == [1, 0, 0, 0, 0, 0]
+
+    def test_min_up_time(self):
+        switch_state = self._solve([12, 3, 3, 3, 3, 3], var_cost=0.1, power_cost=1, min_up_time=3)
+
+        assert self.mock_engine.model.status == 'optimal'
+        assert list(switch_state) == [1, 1, 1, 0, 0, 0]
+        assert list(np.around(self.thermal_unit.startup.optimisation_value.evaluate())) == [1, 0, 0, 0, 0, 0]
+        assert list(np.around(self.thermal_unit.shutdown.optimisation_value.evaluate())) == [0, 0, 0, 1, 0, 0]
+
+    def test_min_down_time_of_initial_state(self):
+        switch_state = self._solve(
+            [3, 3, 3, 3], var_cost=1, power_cost=0.1, min_down_time=2, current_state_duration=0
+        )
+
+        assert list(switch_state) == [0, 0, 1, 1]
+
+    def test_update_initial_state_of_extended_model(self):
+        self._solve([3, 3, 3, 3], var_cost=1, power_cost=0.1, min_down_time=2, current_state_duration=0)
+
+        self.thermal_unit.update(replace(self.data, current_switch_state=True))
+        self.mock_engine.solve()
+
+        assert list(np.around(self.thermal_unit.switch_state.optimisation_value.evaluate())) == [1, 1, 1, 1]
+
+    def test_startup_power(self):
+        self._solve([12, 12, 12], var_cost=1, power_cost=0.1, startup_power=3)
+
+        assert list(np.around(self.thermal_unit.power.optimisation_value.evaluate(), 4)) == [3, 10, 10]
+
+    def test_startup_power_of_running_unit(self):
+        self._solve([12, 12, 12], var_cost=1, power_cost=0.1, startup_power=3, current_switch_state=True)
+
+        assert list(np.around(self.thermal_unit.power.optimisation_value.evaluate(), 4)) == [10, 10, 10]
+
+    def test_shutdown_power(self):
+        self._solve([12, 12, 0], var_cost=1, power_cost=0.1, shutdown_power=4, current_switch_state=True)
+
+        assert list(np.around(self.thermal_unit.power.optimisation_value.evaluate(), 4)) == [10, 4, 0]
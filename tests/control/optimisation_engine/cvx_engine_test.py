@@ -3,6 +3,8 @@ from control.optimisation_engine.cvx_engine.cvx_engine import CvxEngine, Duplica
     OptimisationEngineStatus
 from control.optimisation_engine.domain import OptimisationExpression
 import cvxpy as cp
+import numpy as np
+from scipy import sparse
 
 import pytest
 
@@ -104,6 +106,45 @@ class TestCvxEngineInterface:
         with pytest.raises(DuplicateOptimisationEngineValue):
             cvx_engine.add_variable('test', bounds=Bounds(0, 10), initial_value=1.5)
 
+    def test_solve_linear_matrix_constraint(self):
+        cvx_engine = CvxEngine()
+        timestamps = Timestamps([1, 2])
+        bounds = BoundTimeseries.constant_bound_timeseries(timestamps, 0, 10)
+        initial_value = ConstantTimeseriesData(timestamps, 0)
+        var_1 = cvx_engine.add_timeindex_variable('var_1', bounds, initial_value)
+        var_2 = cvx_engine.add_timeindex_variable('var_2', bounds, initial_value)
+        demand = cvx_engine.add_timeindex_parameter('demand', ConstantTimeseriesData(timestamps, 3))
+
+        constraint = cvx_engine.add_linear_matrix_constraint(
+            'balance', [(sparse.csr_matrix([[1, 1]]), [var_1, var_2]), (-sparse.identity(1), [demand])]
+        )
+        cvx_engine.add_objective('objective', OptimisationExpression(cp.sum(var_1.value) + 2 * cp.sum(var_2.value)))
+
+        cvx_engine.generate_optimisation_model()
+        cvx_engine.solve()
+
+        assert cvx_engine.status == OptimisationEngineStatus.Optimal
+        assert var_1.evaluate() == pytest.approx([3, 3], abs=1e-5)
+        assert constraint.residual.ravel() == pytest.approx([0, 0], abs=1e-5)
+        with pytest.raises(DuplicateOptimisationEngineValue):
+            cvx_engine.add_linear_matrix_constraint('balance', [(sparse.identity(1), [demand])])
+
+    def test_resolve_matrix_parameter(self):
+        cvx_engine = CvxEngine()
+        variable = cvx_engine.add_matrix_variable('var', np.zeros((2, 2)), np.full((2, 2), np.inf), np.zeros((2, 2)))
+        target = cvx_engine.add_matrix_parameter('target', np.ones((2, 2)))
+        cvx_engine.update_objective(variable, lambda value, t: cp.sum_squares(value - t), target.value)
+
+        cvx_engine.generate_optimisation_model()
+        cvx_engine.resolve()
+        model = cvx_engine._model
+        target.value.value = np.array([[2, -1], [3, 4]])
+        cvx_engine.resolve()
+
+        assert cvx_engine._model is model
+        assert cvx_engine.status == OptimisationEngineStatus.Optimal
+        assert variable.evaluate().ravel() == pytest.approx([2, 0, 3, 4], abs=1e-4)
+
     def test_solving_cvx_solver(self):
         cvx_engine = CvxEngine()
         cvx_var_1 = cvx_engine.add_variable('var_1', Bounds(0, 10), 0)
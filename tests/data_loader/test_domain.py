@@ -1,7 +1,8 @@
+import numpy as np
 import pytest
 
 from common.timeseries.domain import Bounds
-from microgrid.data_loader.domain import SamplePointsToPowerTable
+from microgrid.data_loader.domain import PowerCurveInterpolation, SamplePointsToPowerTable
 from microgrid.data_loader.interface import IGeneratorDataLoader
 
 
@@ -29,6 +30,87 @@ class TestSamplePointsToPowerTable:
         with pytest.raises(ValueError):
             point_power_table.available_power_at_sample_point(6)
 
+    def test_lookup_table_exact(self):
+        points = list(range(0, 5))
+        power_values = [0, 5, 30, 40, 40]
+        point_power_table = SamplePointsToPowerTable(points=points, power_values=power_values)
+        sample_points = np.linspace(0, 4, 41)
+
+        assert point_power_table.lookup_table.max_error == 0
+        assert point_power_table.available_power_at_sample_point(2.5) == 35
+        assert np.allclose(
+            point_power_table.available_power_at_sample_points(sample_points),
+            np.interp(sample_points, points, power_values)
+        )
+
+    def test_lookup_table_error_bound(self):
+        points = [0, 3.3, 7.1, 12.25, 25]
+        power_values = [0, 120, 900, 2000, 2000]
+        coarse_table = SamplePointsToPowerTable(points=points, power_values=power_values, resolution=1)
+        fine_table = SamplePointsToPowerTable(points=points, power_values=power_values, resolution=1, max_error=1)
+        sample_points = np.linspace(0, 25, 1001)
+        exact_power = np.interp(sample_points, points, power_values)
+
+        assert coarse_table.lookup_table.max_error > 1
+        assert fine_table.lookup_table.max_error <= 1
+        assert np.max(np.abs(fine_table.available_power_at_sample_points(sample_points) - exact_power)) <= 1
+        assert np.max(np.abs(coarse_table.available_power_at_sample_points(sample_points) - exact_power)) <= \
+            coarse_table.lookup_table.max_error + 1e-9
+
+    def test_lookup_table_non_uniform_knots(self):
+        points = [0, 3, 5, 12, 25]
+        power_values = [0, 120, 900, 2000, 2000]
+        point_power_table = SamplePointsToPowerTable(points=points, power_values=power_values)
+        sample_points = np.linspace(0, 25, 1001)
+
+        assert point_power_table.lookup_table.resolution == 1
+        assert point_power_table.available_power_at_sample_point(5) == pytest.approx(900)
+        assert np.allclose(
+            point_power_table.available_power_at_sample_points(sample_points),
+            np.interp(sample_points, points, power_values)
+        )
+
+        fractional_table = SamplePointsToPowerTable(points=[0, 3.3, 7.1, 12.25, 25], power_values=power_values)
+        assert fractional_table.available_power_at_sample_point(7.1) == pytest.approx(900)
+        assert fractional_table.lookup_table.max_error <= 1e-6
+
+    def test_lookup_table_fallback_to_interpolation(self):
+        random = np.random.default_rng(3)
+        points = np.concatenate([[0], np.sort(random.uniform(0, 25, 49))]).tolist()
+        power_values = np.concatenate([[0], random.uniform(0, 2000, 49)]).tolist()
+        point_power_table = SamplePointsToPowerTable(points=points, power_values=power_values)
+        sample_points = np.linspace(0, points[-1], 1001)
+
+        assert isinstance(point_power_table.lookup_table, PowerCurveInterpolation)
+        assert point_power_table.lookup_table.max_error == 0
+        assert [point_power_table.available_power_at_sample_point(p) for p in points] == pytest.approx(power_values)
+        assert [point_power_table.available_power_at_sample_point(p) for p in sample_points] == pytest.approx(
+            np.interp(sample_points, points, power_values).tolist()
+        )
+        assert np.allclose(
+            point_power_table.available_power_at_sample_points(sample_points),
+            np.interp(sample_points, points, power_values)
+        )
+        with pytest.raises(ValueError):
+            point_power_table.available_power_at_sample_point(points[-1] + 1)
+
+    def test_shared_lookup_table(self):
+        points = list(range(0, 5))
+        power_values = list(range(0, 50, 10))
+
+        table = SamplePointsToPowerTable(points=points, power_values=power_values)
+        other_table = SamplePointsToPowerTable(points=list(points), power_values=list(power_values))
+
+        assert table.lookup_table is other_table.lookup_table
+
+    def test_not_existance_sample_points_to_table(self):
+        points = list(range(0, 5))
+        power_values = list(range(0, 50, 10))
+        point_power_table = SamplePointsToPowerTable(points=points, power_values=power_values)
+
+        with pytest.raises(ValueError):
+            point_power_table.available_power_at_sample_points(np.array([1, 2, 6]))
+
 
 class TestUnitDataLoader:
     def test_unit_data_loader(self):
@@ -20,6 +20,42 @@ class TestSimulationTimeSeries:
         assert simulation_series.resample(1350) == 15
         assert simulation_series.resample(-900) == -10
 
+    def test_resample_many(self):
+        timestamps = [0, 900, 1800, 3600, 4500]
+        values = np.array([0, 10, 5, 20, -5])
+        simulation_series = SimulationTimeSeries(timestamps, values)
+        resample_timestamps = np.array([-900, 0, 450, 900, 1000, 2700, 4500, 5400])
+
+        expected_values = [-10, 0, 5, 10, 10 - 5 / 9, 12.5, -5, -30]
+
+        assert not simulation_series.is_uniform
+        assert np.allclose(simulation_series.resample_many(resample_timestamps), expected_values)
+        assert np.allclose([simulation_series.resample(t) for t in resample_timestamps], expected_values)
+
+    def test_uniform_resample_many(self):
+        timestamps = list(range(0, 9000, 900))
+        values = np.sin(np.arange(len(timestamps)))
+        simulation_series = SimulationTimeSeries(timestamps, values)
+        resample_timestamps = np.linspace(-1000, 10000, 101)
+
+        expected_values = np.interp(resample_timestamps, timestamps, values)
+        inside = (resample_timestamps >= 0) & (resample_timestamps <= timestamps[-1])
+
+        assert simulation_series.is_uniform
+        assert np.allclose(simulation_series.resample_many(resample_timestamps)[inside], expected_values[inside])
+        assert np.isclose(simulation_series.resample(-900), values[0] - (values[1] - values[0]))
+
+    def test_cursor(self):
+        timestamps = [0, 900, 1800, 3600, 4500]
+        values = np.array([0, 10, 5, 20, -5])
+        simulation_series = SimulationTimeSeries(timestamps, values)
+        cursor = simulation_series.cursor()
+        resample_timestamps = [0, 300, 1000, 1000, 4000, 100, 2000, 6000]
+
+        assert np.allclose(
+            [cursor.resample(t) for t in resample_timestamps], simulation_series.resample_many(resample_timestamps)
+        )
+
     def test_unequal_simulation_timeseries(self):
         timestamps = list(range(0, 4500, 900))
         values = np.array(list(range(0, 60, 10)))
@@ -8,7 +8,7 @@ from microgrid.data_loader.component.grid_model import GridNetworkDataLoader, \
     SingleBusGridNetworkDataLoader
 import pytest
 
-from microgrid.model.exception import UnknownComponentError
+from microgrid.model.exception import UnknownComponentError, SimulationGridError
 
 
 class TestGridModel:
@@ -154,6 +154,85 @@ class TestGridModel:
         assert abs(grid_network.current_power) == 1
         assert all([p in expected_bus_power for p in grid_network.buses_power])
 
+    def _mesh_grid_network(self, initial_timestamp: int):
+        grid_lines = [GridLine(from_bus='bus_0', to_bus='bus_1', admittance=20),
+                      GridLine(from_bus='bus_1', to_bus='bus_2', admittance=10),
+                      GridLine(from_bus='bus_2', to_bus='bus_0', admittance=20),
+                      GridLine(from_bus='bus_2', to_bus='bus_3', admittance=20)]
+        grid_network_data = GridNetworkDataLoader(
+            initial_timestamp=initial_timestamp, grid_line=grid_lines
+        )
+        grid_network = GridNetwork(name='network', data_loader=grid_network_data)
+        for bus_id, power in zip(['bus_0', 'bus_1', 'bus_2', 'bus_3'], [-3, 5, -4, 2]):
+            grid_network.set_bus_power(bus_id, power)
+
+        return grid_network, grid_lines
+
+    def test_remove_restore_line(self):
+        initial_timestamp = 1645825124
+        grid_network, grid_lines = self._mesh_grid_network(initial_timestamp)
+        line_power = grid_network.calculate_line_power()
+
+        grid_network.remove_line(grid_lines[0])
+        outage_line_power = grid_network.calculate_line_power()
+
+        outage_network_data = GridNetworkDataLoader(
+            initial_timestamp=initial_timestamp, grid_line=grid_lines[1:]
+        )
+        outage_network = GridNetwork(name='outage', data_loader=outage_network_data)
+        for bus_id, power in zip(grid_network.buses, grid_network.buses_power):
+            outage_network.set_bus_power(bus_id, power)
+
+        assert grid_network.validate_grid_model()
+        assert len(grid_network.control_component_data.grid_lines) == 3
+        assert outage_line_power[0] == 0
+        assert np.allclose(outage_line_power[1:], outage_network.calculate_line_power())
+
+        grid_network.restore_line(grid_lines[0])
+
+        assert np.allclose(grid_network.calculate_line_power(), line_power)
+        assert grid_network.power_flow_solver.number_rank_updates == 0
+
+    def test_fork(self):
+        initial_timestamp = 1645825124
+        grid_network, grid_lines = self._mesh_grid_network(initial_timestamp)
+        line_power = grid_network.calculate_line_power()
+
+        forked_network = grid_network.fork()
+        forked_network.remove_line(grid_lines[0])
+        forked_network.set_bus_power(grid_network.buses[0], 0)
+
+        assert forked_network.data_loader is grid_network.data_loader
+        assert all(grid_network.line_status)
+        assert np.allclose(grid_network.calculate_line_power(), line_power)
+        assert not np.allclose(forked_network.calculate_line_power(), line_power)
+
+        forked_network.set_line_status(grid_network.line_status)
+        assert all(forked_network.line_status)
+
+    def test_remove_line_islanding(self):
+        initial_timestamp = 1645825124
+        grid_network, grid_lines = self._mesh_grid_network(initial_timestamp)
+        line_power = grid_network.calculate_line_power()
+
+        grid_network.remove_line(grid_lines[3])
+
+        assert not grid_network.validate_grid_model()
+        with pytest.raises(SimulationGridError):
+            grid_network.step(initial_timestamp + 900)
+
+        grid_network.restore_line(grid_lines[3])
+
+        assert grid_network.validate_grid_model()
+        assert np.allclose(grid_network.calculate_line_power(), line_power)
+
+    def test_remove_unknown_line(self):
+        initial_timestamp = 1645825124
+        grid_network, _ = self._mesh_grid_network(initial_timestamp)
+
+        with pytest.raises(UnknownComponentError):
+            grid_network.remove_line(GridLine(from_bus='bus_0', to_bus='bus_3', admittance=20))
+
 
 if __name__ == '__main__':
 
@@ -0,0 +1,61 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from microgrid.data_loader.component.load_demand import LoadDemandDataLoader
+from microgrid.shared.memory_mapped_timeseries import MemoryMappedTimeSeries
+from microgrid.shared.timeseries import SimulationTimeSeries, SimulationTimeseriesError
+
+
+def create_time_series(directory, window_size=16):
+    timestamps = np.arange(0, 900 * 200, 900)
+    values = np.sin(np.arange(len(timestamps)) / 10)
+    return MemoryMappedTimeSeries.create(str(directory), timestamps, values, window_size=window_size), \
+        SimulationTimeSeries(timestamps, values)
+
+
+class TestMemoryMappedTimeSeries:
+    def test_resample(self, tmp_path):
+        time_series, expected_time_series = create_time_series(tmp_path)
+        resample_timestamps = [-900, 0, 450, 100000, 2000, 179100, 200000]
+
+        assert time_series.start_timestamp == 0
+        assert time_series.end_timestamp == 900 * 199
+        assert np.allclose(
+            [time_series.resample(t) for t in resample_timestamps],
+            expected_time_series.resample_many(resample_timestamps)
+        )
+        assert np.allclose(
+            time_series.resample_many(resample_timestamps), expected_time_series.resample_many(resample_timestamps)
+        )
+
+    def test_cursor(self, tmp_path):
+        time_series, expected_time_series = create_time_series(tmp_path)
+        cursor = time_series.cursor()
+        resample_timestamps = np.arange(-1000, 181000, 333)
+
+        assert np.allclose(
+            [cursor.resample(t) for t in resample_timestamps], expected_time_series.resample_many(resample_timestamps)
+        )
+
+    def test_pickle(self, tmp_path):
+        time_series, _ = create_time_series(tmp_path)
+        pickled_time_series = pickle.dumps(time_series)
+        unpickled_time_series = pickle.loads(pickled_time_series)
+
+        assert len(pickled_time_series) < 1000
+        assert unpickled_time_series.resample(1234) == time_series.resample(1234)
+
+    def test_data_loader(self, tmp_path):
+        time_series, expected_time_series = create_time_series(tmp_path)
+        data_loader = LoadDemandDataLoader(initial_timestamp=0, demand_time_series=time_series)
+
+        assert data_loader.get_data(45000) == pytest.approx(expected_time_series.resample(45000))
+
+    def test_invalid_time_series(self, tmp_path):
+        with pytest.raises(SimulationTimeseriesError):
+            MemoryMappedTimeSeries.create(str(tmp_path), [0, 900, 900], [1, 2, 3])
+
+        with pytest.raises(SimulationTimeseriesError):
+            MemoryMappedTimeSeries(str(tmp_path / 'missing'))
@@ -3,6 +3,8 @@ import copy
 import pytest
 
 from common.timeseries.domain import Bounds
+from microgrid.data_loader.interface import IRenewableUnitDataLoader
+from microgrid.model.component.renewable_unit import RenewablePowerUnit
 from microgrid.model.domain import MicrogridModelData
 from microgrid.model.exception import MicrogirdModellingError, StepPreviousTimestamp
 from microgrid.model.microgrid_model import MicrogridModel
@@ -178,3 +180,85 @@ def test_calculate_delta_frequency():
 
     delta_frequency = model.calculate_delta_frequency()
     assert delta_frequency == -1
+
+
+def test_snapshot_restore():
+    initial_timestamp = 1639396720
+    model = MicrogridModel(microgird_model_data(initial_timestamp))
+
+    model.set_power_setpoints([-1, 1])
+    model.step(initial_timestamp + 900)
+    snapshot = model.snapshot()
+
+    model.set_power_setpoints([2, 3])
+    model.step(initial_timestamp + 1800)
+    model.restore(snapshot)
+
+    assert [g.current_timestamp for g in model.generators] == [initial_timestamp + 900] * 2
+    assert [g.power_setpoint for g in model.generators] == [-1, 1]
+    assert list(model.current_power) == list(snapshot.current_power)
+    assert list(model.grid_model._current_power) == list(snapshot.line_power)
+
+    model.step(initial_timestamp + 1800)
+
+
+class TimestampRenewableDataLoader(IRenewableUnitDataLoader):
+    def get_data(self, timestamp: int):
+        return timestamp % 7
+
+
+def test_snapshot_restore_renewable_available_power():
+    initial_timestamp = 1639396720
+    model_data = microgird_model_data(initial_timestamp)
+    renewable = RenewablePowerUnit(
+        'renewable', TimestampRenewableDataLoader(initial_timestamp=initial_timestamp, power_bounds=Bounds(0, 10))
+    )
+    model = MicrogridModel(MicrogridModelData(
+        name='microgrid', generators=[renewable, model_data.generators[1]], loads=model_data.loads,
+        grid_model=model_data.grid_model, generator_bus_ids=model_data.generator_bus_ids,
+        load_bus_ids=model_data.load_bus_ids
+    ))
+
+    model.set_power_setpoints([10, 1])
+    model.step(initial_timestamp + 900)
+    snapshot = model.snapshot()
+    available_power = renewable.current_simulation_data().values['available_power']
+
+    model.step(initial_timestamp + 1800)
+    assert renewable.current_simulation_data().values['available_power'] != available_power
+    model.restore(snapshot)
+
+    assert renewable.current_simulation_data().values['available_power'] == available_power
+
+
+def test_restore_mismatched_snapshot():
+    initial_timestamp = 1639396720
+    model = MicrogridModel(microgird_model_data(initial_timestamp))
+    snapshot = model.snapshot()
+
+    model_data = microgird_model_data(initial_timestamp)
+    other_model = MicrogridModel(MicrogridModelData(
+        name='microgrid', generators=model_data.generators[:1], loads=model_data.loads,
+        grid_model=model_data.grid_model, generator_bus_ids=model_data.generator_bus_ids[:1],
+        load_bus_ids=model_data.load_bus_ids
+    ))
+
+    with pytest.raises(MicrogirdModellingError):
+        other_model.restore(snapshot)
+
+
+def test_fork():
+    initial_timestamp = 1639396720
+    model = MicrogridModel(microgird_model_data(initial_timestamp))
+    model.set_power_setpoints([-1, 1])
+    model.step(initial_timestamp + 900)
+
+    forked_model = model.fork()
+    forked_model.set_power_setpoints([2, 3])
+    forked_model.step(initial_timestamp + 1800)
+
+    assert forked_model.generators[0].data_loader is model.generators[0].data_loader
+    assert [g.power_setpoint for g in model.generators] == [-1, 1]
+    assert [g.current_timestamp for g in model.generators] == [initial_timestamp + 900] * 2
+    assert list(forked_model.current_power) == [2, 3, 0]
+    assert list(model.current_power) == [-1, 1, 0]
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from microgrid.data_loader.component.load_demand import LoadDemandDataLoader
+from microgrid.shared.streaming_timeseries import (
+    CsvChunkReader,
+    ParquetChunkReader,
+    StreamingTimeSeries,
+    prefetch,
+)
+from microgrid.shared.timeseries import SimulationTimeSeries
+
+
+def profile_frame():
+    timestamps = np.arange(0, 900 * 100, 900)
+    return pd.DataFrame({'timestamp': timestamps, 'power': np.cos(np.arange(len(timestamps)) / 7), 'other': 1})
+
+
+class TestPrefetch:
+    def test_prefetch(self):
+        assert list(prefetch(range(10), buffer_size=2)) == list(range(10))
+
+    def test_prefetch_error(self):
+        def failing_chunks():
+            yield 1
+            raise ValueError('corrupt chunk')
+
+        with pytest.raises(ValueError):
+            list(prefetch(failing_chunks()))
+
+
+class TestStreamingTimeSeries:
+    def test_csv_stream(self, tmp_path):
+        frame = profile_frame()
+        path = str(tmp_path / 'profile.csv')
+        frame.to_csv(path, index=False)
+        expected_time_series = SimulationTimeSeries(frame['timestamp'].to_numpy(), frame['power'].to_numpy())
+
+        time_series = StreamingTimeSeries(CsvChunkReader(path, 'timestamp', 'power', chunk_size=7))
+        resample_timestamps = np.arange(-500, 91000, 450)
+
+        assert time_series.start_timestamp == 0
+        assert time_series.end_timestamp == 900 * 99
+        assert np.allclose(
+            [time_series.resample(t) for t in resample_timestamps],
+            expected_time_series.resample_many(resample_timestamps)
+        )
+        assert np.allclose(time_series.resample(1000), expected_time_series.resample(1000))
+        assert np.allclose(
+            time_series.resample_many([80000, 100, 5000]), expected_time_series.resample_many([80000, 100, 5000])
+        )
+
+    def test_single_row_chunks(self, tmp_path):
+        path = str(tmp_path / 'profile.csv')
+        pd.DataFrame({'timestamp': [0, 30, 60, 90], 'value': [1, 4, 2, 0]}).to_csv(path, index=False)
+        expected_time_series = SimulationTimeSeries(np.array([0, 30, 60, 90]), np.array([1, 4, 2, 0]))
+
+        time_series = StreamingTimeSeries(CsvChunkReader(path, 'timestamp', 'value', chunk_size=1))
+        resample_timestamps = np.arange(0, 91, 15)
+
+        assert time_series.resample(15) == pytest.approx(2.5)
+        assert np.allclose(
+            [time_series.resample(t) for t in resample_timestamps],
+            expected_time_series.resample_many(resample_timestamps)
+        )
+
+    def test_parquet_stream(self, tmp_path):
+        pytest.importorskip('pyarrow')
+        frame = profile_frame()
+        path = str(tmp_path / 'profile.parquet')
+        frame.to_parquet(path, index=False, row_group_size=30)
+        expected_time_series = SimulationTimeSeries(frame['timestamp'].to_numpy(), frame['power'].to_numpy())
+
+        time_series = StreamingTimeSeries(ParquetChunkReader(path, 'timestamp', 'power', chunk_size=11))
+        resample_timestamps = np.arange(0, 89100, 300)
+
+        assert time_series.start_timestamp == 0
+        assert time_series.end_timestamp == 900 * 99
+        assert np.allclose(
+            time_series.resample_many(resample_timestamps), expected_time_series.resample_many(resample_timestamps)
+        )
+
+    def test_data_loader(self, tmp_path):
+        frame = profile_frame()
+        path = str(tmp_path / 'profile.csv')
+        frame.to_csv(path, index=False)
+        time_series = StreamingTimeSeries(CsvChunkReader(path, 'timestamp', 'power', chunk_size=10))
+        data_loader = LoadDemandDataLoader(initial_timestamp=0, demand_time_series=time_series)
+
+        for timestamp in range(900, 90000, 900):
+            assert data_loader.get_data(timestamp) == pytest.approx(frame['power'].iloc[timestamp // 900])
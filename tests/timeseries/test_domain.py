@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 
 from common.timeseries.domain import Bounds, Timestamps, TimeseriesData, UnknownTimestampError, BoundTimeseries, \
-    ConstantTimeseriesData
+    ConstantTimeseriesData, UniformTimestamps
 from datetime import datetime, timedelta
 
 
@@ -24,6 +24,45 @@ def test_timestamps():
         Timestamps(timestamp)
 
 
+def test_uniform_timestamps():
+    timestamps = UniformTimestamps(start=1000, step=900, count=10)
+    expected_timestamps = Timestamps(list(range(1000, 1000 + 900 * 10, 900)))
+
+    assert len(timestamps) == 10
+    assert list(timestamps) == expected_timestamps.values
+    assert timestamps == expected_timestamps
+    assert timestamps[3] == expected_timestamps[3]
+    assert timestamps[-1] == expected_timestamps[-1]
+    assert list(timestamps[2:5]) == expected_timestamps[2:5]
+    assert timestamps.get_timestamp_index(1000 + 900 * 4) == 4
+    assert np.array_equal(timestamps.to_array(), expected_timestamps.to_array())
+    assert timestamps.slice(2, 9, 3) == expected_timestamps.slice(2, 9, 3)
+    assert isinstance(timestamps.slice(2, 9, 3), UniformTimestamps)
+
+    for t in [1000 - 900, 1100, 1000 + 900 * 10]:
+        with pytest.raises(UnknownTimestampError):
+            timestamps.get_timestamp_index(t)
+
+    with pytest.raises(AssertionError):
+        UniformTimestamps(start=1000, step=0, count=10)
+
+
+def test_uniform_timestamps_large():
+    timestamps = UniformTimestamps.from_range(0, 10 ** 12, 1)
+
+    assert len(timestamps) == 10 ** 12
+    assert timestamps.get_timestamp_index(10 ** 11) == 10 ** 11
+    assert len(timestamps.slice(10, 20)) == 10
+
+
+def test_uniform_timeseries():
+    timestamps = UniformTimestamps(start=0, step=60, count=10)
+    data = TimeseriesData(timestamps, values=list(range(10)))
+
+    assert data.get_value(120) == 2
+    assert BoundTimeseries.constant_bound_timeseries(timestamps, 0, 1).get_value(540) == (0, 1)
+
+
 def test_timeseries():
     timestamp = [(datetime(2022, 10, 1) + timedelta(minutes=i)).timestamp()
                  for i in range(0, 10)]
@@ -45,6 +84,20 @@ def test_timeseries():
         constant_data.get_value(100)
 
 
+def test_timeseries_equality():
+    timestamps = Timestamps([0, 60, 120])
+
+    assert TimeseriesData(timestamps, [1, 2, 3]) == TimeseriesData(Timestamps([0, 60, 120]), [1, 2, 3])
+    assert TimeseriesData(timestamps, [1, 2, 3]) == TimeseriesData(UniformTimestamps(0, 60, 3), [1, 2, 3])
+    assert TimeseriesData(timestamps, [1, 2, 3]) != TimeseriesData(timestamps, [1, 2, 4])
+    assert TimeseriesData(timestamps, [1, 2, 3]) != TimeseriesData(Timestamps([0, 60, 180]), [1, 2, 3])
+    assert TimeseriesData(timestamps, [1, 1, 1]) != ConstantTimeseriesData(timestamps, 1)
+
+    bounds = BoundTimeseries(TimeseriesData(timestamps, [0, 1, 2]), TimeseriesData(timestamps, [3, 4, 5]))
+    assert bounds == BoundTimeseries(TimeseriesData(timestamps, [0, 1, 2]), TimeseriesData(timestamps, [3, 4, 5]))
+    assert bounds != BoundTimeseries(TimeseriesData(timestamps, [0, 1, 2]), TimeseriesData(timestamps, [3, 4, 6]))
+
+
 def test_bounds():
     bound = Bounds(0, 10)
     assert bound.min == 0
@@ -73,3 +126,38 @@ def test_bounds():
     for i, t in enumerate(timestamps):
         assert time_series_bounds.get_value(t)[0] == min_value[i]
         assert time_series_bounds.get_value(t)[1] == max_value[i]
+
+
+def test_bound_timeseries_arrays():
+    timestamps = UniformTimestamps(start=0, step=60, count=5)
+    bounds = BoundTimeseries(
+        min=TimeseriesData(timestamps, values=[0, 1, 2, 3, 4]),
+        max=ConstantTimeseriesData(timestamps, 10)
+    )
+
+    assert np.array_equal(bounds.min_array, [0, 1, 2, 3, 4])
+    assert np.array_equal(bounds.max_array, np.full(5, 10))
+    assert bounds.get_value(120) == (2, 10)
+
+    with pytest.raises(AssertionError):
+        BoundTimeseries(
+            min=TimeseriesData(timestamps, values=[0, 1, 20, 3, 4]),
+            max=ConstantTimeseriesData(timestamps, 10)
+        )
+
+    with pytest.raises(AssertionError):
+        BoundTimeseries(
+            min=ConstantTimeseriesData(timestamps, 0),
+            max=ConstantTimeseriesData(UniformTimestamps(start=60, step=60, count=5), 10)
+        )
+
+
+def test_long_bound_timeseries():
+    timestamps = Timestamps(list(range(0, 900 * 100000, 900)))
+    bounds = BoundTimeseries(
+        min=TimeseriesData(timestamps, values=np.zeros(len(timestamps))),
+        max=TimeseriesData(timestamps, values=np.ones(len(timestamps)))
+    )
+
+    assert bounds.get_value(900 * 99999) == (0, 1)
+    assert len(bounds.min_array) == len(timestamps)
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from microgrid.data_loader.domain import UnknownComponentQueryError
+from microgrid.shared.simulation_data import ComponentSimulationData
+from microgrid.shared.timeseries import SimulationTimeseriesError
+from microgrid.utils.memory_storage import MemoryDataStorage, GrowableColumn
+
+
+def fill_storage(storage: MemoryDataStorage, num_steps: int = 200):
+    for step in range(num_steps):
+        timestamp = storage.initial_timestamp + 900 * step
+        storage.add_simulation_data(
+            timestamp, ComponentSimulationData('load', values={'current_power': step})
+        )
+        storage.add_simulation_data(
+            timestamp, ComponentSimulationData(
+                'thermal', values={'current_power': 0.5 * step, 'switch_state': step % 2 == 0}
+            )
+        )
+        storage.add_simulation_data(
+            timestamp, ComponentSimulationData('grid', values={'bus_power': np.array([step, -step])})
+        )
+
+
+class TestGrowableColumn:
+    def test_append(self):
+        column = GrowableColumn(initial_capacity=2)
+        for i in range(10):
+            column.append(i)
+        column.append(0.5)
+
+        assert len(column) == 11
+        assert column.values.dtype == float
+        assert column.values[-1] == 0.5
+
+    def test_object_column(self):
+        column = GrowableColumn()
+        column.append(np.array([1, 2]))
+        column.append(np.array([1, 2, 3]))
+
+        assert column.values.dtype == object
+        assert len(column.values[1]) == 3
+
+
+class TestMemoryDataStorage:
+    def test_historical_arrays(self):
+        storage = MemoryDataStorage(initial_timestamp=0)
+        fill_storage(storage)
+
+        timestamps, fields = storage.get_historical_arrays('thermal', since=900 * 9, until=900 * 20)
+
+        assert list(timestamps) == list(range(900 * 10, 900 * 21, 900))
+        assert np.allclose(fields['current_power'], 0.5 * np.arange(10, 21))
+        assert fields['switch_state'].dtype == bool
+        assert storage.current_timestamp == 900 * 199
+
+        timestamps, fields = storage.get_historical_arrays('grid', since=900 * 197)
+        assert fields['bus_power'].shape == (2, 2)
+
+    def test_historical_data(self):
+        storage = MemoryDataStorage(initial_timestamp=0)
+        fill_storage(storage, num_steps=10)
+
+        data = storage.get_historical_data('load', since=900 * 7)
+
+        assert data == [ComponentSimulationData('load', values={'current_power': i}) for i in [8, 9]]
+        assert len(storage.get_historical_data(None, since=900 * 7)) == 6
+        assert storage.get_historical_data('load', since=900 * 20) == []
+
+    def test_unknown_unit(self):
+        storage = MemoryDataStorage(initial_timestamp=0)
+
+        with pytest.raises(UnknownComponentQueryError):
+            storage.get_historical_data('load', since=0)
+
+    def test_past_timestamp(self):
+        storage = MemoryDataStorage(initial_timestamp=0)
+        fill_storage(storage, num_steps=10)
+
+        with pytest.raises(SimulationTimeseriesError):
+            storage.add_simulation_data(900, ComponentSimulationData('load', values={'current_power': 1}))
@@ -139,6 +139,13 @@ class MockGridNetwork(IGridNetwork):
         except Exception:
             raise ValueError(f'{bus_id} not in the grid buses')
 
+    @property
+    def line_status(self) -> np.ndarray:
+        return np.array([], dtype=bool)
+
+    def set_line_status(self, line_status: np.ndarray):
+        pass
+
     def step(self, timestamp: int):
         pass
 
@@ -0,0 +1,86 @@
+import numpy as np
+
+from microgrid.config.fleet import FleetModelBuilder
+from microgrid.config.registry import default_component_registry
+from microgrid.model.microgrid_model import MicrogridModel
+from microgrid.shared.memory_mapped_timeseries import MemoryMappedTimeSeries
+from microgrid.utils.model_cache import MicrogridModelCache, model_config_hash
+from tests.config.test_fleet import fleet_definition
+
+
+class CountingBuilder:
+    def __init__(self):
+        self.number_builds = 0
+
+    def __call__(self, fleet: dict):
+        self.number_builds += 1
+        return FleetModelBuilder(default_component_registry()).create_data_loader(fleet).microgrid_model_data()
+
+
+class UnhashableConfig:
+    def __getstate__(self):
+        raise TypeError('unhashable config')
+
+
+class TestMicrogridModelCache:
+    def test_config_hash(self):
+        fleet = fleet_definition()
+
+        assert model_config_hash(fleet) == model_config_hash(fleet_definition())
+        fleet['components'][0]['bus_id'] = 'bus_1'
+        assert model_config_hash(fleet) != model_config_hash(fleet_definition())
+        assert model_config_hash({'values': np.arange(3)}) != model_config_hash({'values': np.arange(4)})
+
+    def test_get_or_build(self, tmp_path):
+        cache = MicrogridModelCache(str(tmp_path), min_mapped_bytes=0)
+        build = CountingBuilder()
+
+        built_data = cache.get_or_build(fleet_definition(), build)
+        cached_data = cache.get_or_build(fleet_definition(), build)
+
+        assert build.number_builds == 1
+        assert [g.name for g in cached_data.generators] == [g.name for g in built_data.generators]
+        assert isinstance(cached_data.grid_model.buses_power, np.memmap)
+
+        model = MicrogridModel(cached_data)
+        grid_model = cached_data.grid_model
+        grid_model.set_bus_power('bus_0', 1)
+        grid_model.set_bus_power('bus_1', -1)
+        assert np.allclose(np.abs(grid_model.calculate_line_power()), [1])
+        assert model.name == 'site'
+
+        reloaded_data = cache.get_or_build(fleet_definition(), build)
+        assert np.allclose(reloaded_data.grid_model.buses_power, 0)
+
+    def test_changed_config_rebuilds(self, tmp_path):
+        cache = MicrogridModelCache(str(tmp_path))
+        build = CountingBuilder()
+        fleet = fleet_definition()
+
+        cache.get_or_build(fleet, build)
+        fleet['components'][0]['name'] = 'renamed_load'
+        data = cache.get_or_build(fleet, build)
+
+        assert build.number_builds == 2
+        assert data.loads[0].name == 'renamed_load'
+        assert len([entry for entry in tmp_path.iterdir() if not entry.name.startswith('.')]) == 2
+
+    def test_regenerated_memory_mapped_files_change_hash(self, tmp_path):
+        directory = str(tmp_path / 'series')
+        series = MemoryMappedTimeSeries.create(directory, [0, 900, 1800], [1, 2, 3])
+        config = {'irradiance': series}
+        key = model_config_hash(config)
+
+        MemoryMappedTimeSeries.create(directory, [0, 900, 1800, 2700], [1, 2, 3, 4])
+
+        assert model_config_hash(config) != key
+
+    def test_unhashable_config_builds(self, tmp_path):
+        cache = MicrogridModelCache(str(tmp_path))
+        built = []
+        config = {'build': UnhashableConfig()}
+
+        cache.get_or_build(config, lambda c: built.append(c) or 'model')
+
+        assert built == [config]
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from microgrid.data_loader.domain import UnknownComponentQueryError
+from microgrid.shared.simulation_data import ComponentSimulationData
+from microgrid.shared.timeseries import SimulationTimeseriesError
+
+pytest.importorskip("pyarrow")
+
+from microgrid.utils.parquet_storage import ParquetDataStorage  # noqa: E402
+
+
+def fill_storage(storage: ParquetDataStorage, steps: range):
+    for step in steps:
+        timestamp = 900 * step
+        storage.add_simulation_data(
+            timestamp, ComponentSimulationData('load', values={'current_power': step})
+        )
+        storage.add_simulation_data(
+            timestamp, ComponentSimulationData('grid', values={'bus_power': np.array([step, -step])})
+        )
+
+
+class TestParquetDataStorage:
+    def test_range_query(self, tmp_path):
+        with ParquetDataStorage(str(tmp_path), initial_timestamp=0, batch_size=16) as storage:
+            fill_storage(storage, range(100))
+
+            data = storage.get_historical_data('load', since=900 * 49, until=900 * 52)
+            assert data == [ComponentSimulationData('load', values={'current_power': i}) for i in [50, 51, 52]]
+
+            grid_data = storage.get_historical_data('grid', since=900 * 98)
+            assert len(grid_data) == 1
+            assert np.allclose(grid_data[0].values['bus_power'], [99, -99])
+
+            assert len(storage.get_historical_data(None, since=900 * 97)) == 4
+
+        assert len(list((tmp_path / 'unit=load').iterdir())) == 7
+
+    def test_predicate_pushdown_table(self, tmp_path):
+        with ParquetDataStorage(str(tmp_path), initial_timestamp=0, batch_size=10) as storage:
+            fill_storage(storage, range(30))
+            storage.flush()
+
+            table = storage.get_historical_table('load', since=900 * 14, until=900 * 17, columns=['current_power'])
+
+        assert table.column('current_power').to_pylist() == [15, 16, 17]
+
+    def test_restart(self, tmp_path):
+        with ParquetDataStorage(str(tmp_path), initial_timestamp=0) as storage:
+            fill_storage(storage, range(10))
+
+        with ParquetDataStorage(str(tmp_path), initial_timestamp=900 * 10) as storage:
+            with pytest.raises(SimulationTimeseriesError):
+                storage.add_simulation_data(900 * 5, ComponentSimulationData('load', values={'current_power': 1.5}))
+            fill_storage(storage, range(10, 20))
+
+            data = storage.get_historical_data('load', since=900 * 8, until=900 * 11)
+
+        assert [d.values['current_power'] for d in data] == [9, 10, 11]
+
+    def test_unknown_unit(self, tmp_path):
+        with ParquetDataStorage(str(tmp_path), initial_timestamp=0) as storage:
+            with pytest.raises(UnknownComponentQueryError):
+                storage.get_historical_data('load', since=0)
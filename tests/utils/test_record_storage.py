@@ -0,0 +1,97 @@
+import copy
+
+import numpy as np
+import pytest
+
+from common.model.component import GridLine
+from common.timeseries.domain import Bounds
+from microgrid.data_loader.component.grid_forming_unit import StoragePowerPlantDataLoader, \
+    ThermalGeneratorDataLoader
+from microgrid.data_loader.component.grid_model import GridNetworkDataLoader
+from microgrid.data_loader.domain import UnknownComponentQueryError
+from microgrid.model.component.grid_forming_unit import StoragePowerPlant, ThermalGenerator
+from microgrid.model.component.grid_model import GridNetwork
+from microgrid.shared.simulation_data import ComponentSimulationData
+from microgrid.shared.timeseries import SimulationTimeseriesError
+from microgrid.utils.record_storage import RecordDataStorage
+from tests.utils.test_mocks import create_pv_plant, MockComponent, MockComponentDataLoader
+
+INITIAL_TIMESTAMP = 1639396720
+
+
+def create_components():
+    storage_plant = StoragePowerPlant(
+        name='storage', data_loader=StoragePowerPlantDataLoader(
+            INITIAL_TIMESTAMP, power_bounds=Bounds(-5, 5), droop_gain=1, energy_bounds=Bounds(0, 10), initial_energy=5
+        )
+    )
+    thermal_plant = ThermalGenerator(
+        name='thermal', data_loader=ThermalGeneratorDataLoader(
+            INITIAL_TIMESTAMP, power_bounds=Bounds(1, 5), droop_gain=1, switch_state=False
+        )
+    )
+    grid_network = GridNetwork(
+        name='grid', data_loader=GridNetworkDataLoader(
+            initial_timestamp=INITIAL_TIMESTAMP, grid_line=[GridLine(from_bus='bus_0', to_bus='bus_1', admittance=20)]
+        )
+    )
+    pv_plant = create_pv_plant(initial_timestamp=INITIAL_TIMESTAMP)
+    return [storage_plant, thermal_plant, grid_network, pv_plant]
+
+
+class TestRecordDataStorage:
+    def test_component_records_match_simulation_data(self):
+        data_storage = RecordDataStorage(initial_timestamp=INITIAL_TIMESTAMP, initial_capacity=2)
+        components = create_components()
+        storage_plant, thermal_plant, grid_network, pv_plant = components
+
+        expected_data = {component.name: [] for component in components}
+        for step in range(1, 6):
+            timestamp = INITIAL_TIMESTAMP + 900 * step
+            storage_plant.power_setpoint = step % 3 - 1
+            thermal_plant.power_setpoint = step
+            pv_plant.power_setpoint = 100
+            grid_network.set_bus_power('bus_0', step)
+            grid_network.set_bus_power('bus_1', -step)
+            for component in components:
+                component.step(timestamp)
+                component.add_simulation_data(data_storage)
+                expected_data[component.name].append(copy.deepcopy(component.current_simulation_data()))
+
+        for component in components:
+            assert set(component.simulation_data_dtype.names) == set(expected_data[component.name][0].values)
+            data = data_storage.get_historical_data(component.name, since=INITIAL_TIMESTAMP)
+            assert len(data) == 5
+            for stored, expected in zip(data, expected_data[component.name]):
+                for field, value in expected.values.items():
+                    assert np.allclose(stored.values[field], value)
+
+        timestamps, records = data_storage.get_historical_records('thermal', since=INITIAL_TIMESTAMP + 1800)
+        assert list(records['current_power']) == [3, 4, 5]
+        assert records['switch_state'].all()
+        assert records.base is not None
+
+    def test_component_without_schema(self):
+        data_storage = RecordDataStorage(initial_timestamp=0)
+        component = MockComponent(
+            'mock', MockComponentDataLoader(0, ComponentSimulationData('mock', values={'current_power': 0}))
+        )
+
+        component.add_simulation_data(data_storage)
+        data_storage.add_simulation_data(900, ComponentSimulationData('mock', values={'current_power': 0.5}))
+
+        assert data_storage.get_historical_data('mock', since=-1) == [
+            ComponentSimulationData('mock', values={'current_power': 0}),
+            ComponentSimulationData('mock', values={'current_power': 0.5}),
+        ]
+
+    def test_errors(self):
+        data_storage = RecordDataStorage(initial_timestamp=0)
+        data_storage.add_simulation_data(900, ComponentSimulationData('mock', values={'current_power': 1}))
+
+        with pytest.raises(SimulationTimeseriesError):
+            data_storage.add_simulation_data(900, ComponentSimulationData('mock', values={'current_power': 1}))
+        with pytest.raises(ValueError):
+            data_storage.next_record('mock', 1800, np.dtype([('power', float)]))
+        with pytest.raises(UnknownComponentQueryError):
+            data_storage.get_historical_data('load', since=0)
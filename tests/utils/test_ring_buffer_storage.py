@@ -0,0 +1,136 @@
+import numpy as np
+import pytest
+
+from microgrid.data_loader.domain import UnknownComponentQueryError
+from microgrid.shared.simulation_data import ComponentSimulationData
+from microgrid.shared.timeseries import SimulationTimeseriesError
+from microgrid.utils.ring_buffer_storage import FieldRetention, RingBuffer, RingBufferDataStorage
+
+
+def fill_storage(storage: RingBufferDataStorage, num_steps: int):
+    for step in range(num_steps):
+        timestamp = 900 * step
+        storage.add_simulation_data(
+            timestamp, ComponentSimulationData(
+                'thermal', values={'current_power': float(step), 'switch_state': step % 2 == 0}
+            )
+        )
+        storage.add_simulation_data(
+            timestamp, ComponentSimulationData('grid', values={'bus_power': np.array([step, -step])})
+        )
+
+
+class TestRingBuffer:
+    def test_wrap_around(self):
+        buffer = RingBuffer(initial_capacity=4)
+        for i in range(3):
+            buffer.append(i, 10 * i)
+        buffer.evict_until(1)
+        for i in range(3, 6):
+            buffer.append(i, 10 * i)
+
+        assert buffer.capacity == 4
+        assert list(buffer.timestamps) == [2, 3, 4, 5]
+        assert list(buffer.values) == [20, 30, 40, 50]
+
+        buffer.append(6, 60)
+        assert buffer.capacity == 8
+        assert list(buffer.timestamps) == [2, 3, 4, 5, 6]
+
+    def test_evict(self):
+        buffer = RingBuffer(initial_capacity=4)
+        for i in range(4):
+            buffer.append(i, 10 * i)
+
+        timestamps, values = buffer.evict_until(1)
+
+        assert list(timestamps) == [0, 1]
+        assert list(values) == [0, 10]
+        assert len(buffer) == 2
+
+    def test_evict_wrapped(self):
+        buffer = RingBuffer(initial_capacity=4)
+        for i in range(4):
+            buffer.append(i, 10 * i)
+        buffer.evict_until(1)
+        buffer.append(4, 40)
+        buffer.append(5, 50)
+
+        timestamps, values = buffer.evict_until(4)
+
+        assert list(timestamps) == [2, 3, 4]
+        assert list(values) == [20, 30, 40]
+        assert list(buffer.timestamps) == [5]
+        assert len(buffer.evict_until(4)[0]) == 0
+
+
+class TestRingBufferDataStorage:
+    def test_retention_is_bounded(self):
+        storage = RingBufferDataStorage(initial_timestamp=0, default_retention=FieldRetention(window=900 * 10))
+        fill_storage(storage, num_steps=1000)
+
+        timestamps, values = storage.get_historical_arrays('thermal', since=-1)['current_power']
+
+        assert list(timestamps) == list(range(900 * 990, 900 * 1000, 900))
+        assert list(values) == list(range(990, 1000))
+        assert storage._units['thermal'].fields['current_power'].capacity == 64
+
+    def test_per_field_retention(self):
+        storage = RingBufferDataStorage(
+            initial_timestamp=0,
+            default_retention=FieldRetention(window=900 * 10),
+            field_retention={'switch_state': FieldRetention(window=1800)},
+        )
+        fill_storage(storage, num_steps=100)
+
+        data = storage.get_historical_data('thermal', since=900 * 96)
+
+        assert data == [
+            ComponentSimulationData('thermal', values={'current_power': 97.0}),
+            ComponentSimulationData('thermal', values={'current_power': 98.0, 'switch_state': True}),
+            ComponentSimulationData('thermal', values={'current_power': 99.0, 'switch_state': False}),
+        ]
+        assert len(storage.get_historical_data(None, since=900 * 96, until=900 * 98)) == 4
+
+    def test_aggregated_history(self):
+        storage = RingBufferDataStorage(
+            initial_timestamp=0,
+            default_retention=FieldRetention(window=900 * 4, aggregation_interval=3600),
+        )
+        fill_storage(storage, num_steps=16)
+
+        history = storage.get_aggregated_history('thermal', 'current_power')
+        assert list(history.timestamps) == [0, 3600, 7200]
+        assert list(history.minimum) == [0, 4, 8]
+        assert list(history.maximum) == [3, 7, 11]
+        assert list(history.mean) == [1.5, 5.5, 9.5]
+        assert list(history.count) == [4, 4, 4]
+
+        history = storage.get_aggregated_history('grid', 'bus_power', since=0)
+        assert np.allclose(history.mean, [[5.5, -5.5], [9.5, -9.5]])
+
+        assert list(storage.get_aggregated_history('thermal', 'switch_state').mean) == [0.5, 0.5, 0.5]
+
+    def test_aggregate_window(self):
+        storage = RingBufferDataStorage(
+            initial_timestamp=0,
+            default_retention=FieldRetention(window=0, aggregation_interval=3600, aggregate_window=7200),
+        )
+        fill_storage(storage, num_steps=100)
+
+        assert list(storage.get_aggregated_history('thermal', 'current_power').timestamps) == [82800, 86400]
+        with pytest.raises(SimulationTimeseriesError):
+            storage.add_simulation_data(900 * 99, ComponentSimulationData('thermal', values={'current_power': 1}))
+
+    def test_errors(self):
+        storage = RingBufferDataStorage(initial_timestamp=0, default_retention=FieldRetention(window=900))
+        fill_storage(storage, num_steps=4)
+
+        with pytest.raises(UnknownComponentQueryError):
+            storage.get_historical_data('load', since=0)
+        with pytest.raises(UnknownComponentQueryError):
+            storage.get_aggregated_history('thermal', 'current_power')
+        with pytest.raises(SimulationTimeseriesError):
+            storage.add_simulation_data(0, ComponentSimulationData('thermal', values={'current_power': 1}))
+        with pytest.raises(ValueError):
+            FieldRetention(window=-1)
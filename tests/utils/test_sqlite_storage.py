@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from microgrid.data_loader.domain import UnknownComponentQueryError
+from microgrid.shared.simulation_data import ComponentSimulationData
+from microgrid.shared.timeseries import SimulationTimeseriesError
+from microgrid.utils.sqlite_storage import SQLiteDataStorage, SIMULATION_DATA_TABLE
+
+
+def fill_storage(storage: SQLiteDataStorage, steps: range):
+    for step in steps:
+        timestamp = 900 * step
+        storage.add_simulation_data(
+            timestamp, ComponentSimulationData(
+                'thermal', values={'current_power': np.float64(step), 'switch_state': step % 2 == 0}
+            )
+        )
+        storage.add_simulation_data(
+            timestamp, ComponentSimulationData('grid', values={'bus_power': np.array([step, -step])})
+        )
+
+
+class TestSQLiteDataStorage:
+    def test_range_query(self, tmp_path):
+        with SQLiteDataStorage(str(tmp_path / 'history.db'), initial_timestamp=0, batch_size=16) as storage:
+            fill_storage(storage, range(100))
+
+            data = storage.get_historical_data('thermal', since=900 * 49, until=900 * 51)
+            grid_data = storage.get_historical_data('grid', since=900 * 98)
+
+            assert data == [
+                ComponentSimulationData('thermal', values={'current_power': 50.0, 'switch_state': True}),
+                ComponentSimulationData('thermal', values={'current_power': 51.0, 'switch_state': False}),
+            ]
+            assert len(grid_data) == 1
+            assert np.allclose(grid_data[0].values['bus_power'], [99, -99])
+            assert len(storage.get_historical_data(None, since=900 * 97)) == 4
+            assert storage.unit_ids == ['grid', 'thermal']
+
+    def test_range_query_uses_index(self, tmp_path):
+        with SQLiteDataStorage(str(tmp_path / 'history.db'), initial_timestamp=0) as storage:
+            plan = storage._connection.execute(
+                f"EXPLAIN QUERY PLAN SELECT data_values FROM {SIMULATION_DATA_TABLE} "
+                f"WHERE unit = ? AND timestamp > ? AND timestamp <= ?", ('thermal', 0, 900)
+            ).fetchall()
+            journal_mode, = storage._connection.execute("PRAGMA journal_mode").fetchone()
+
+        assert 'unit_timestamp' in plan[0][-1]
+        assert journal_mode == 'wal'
+
+    def test_restart(self, tmp_path):
+        path = str(tmp_path / 'history.db')
+        with SQLiteDataStorage(path, initial_timestamp=0) as storage:
+            fill_storage(storage, range(10))
+
+        with SQLiteDataStorage(path, initial_timestamp=900 * 10) as storage:
+            with pytest.raises(SimulationTimeseriesError):
+                storage.add_simulation_data(900 * 9, ComponentSimulationData('thermal', values={'current_power': 1}))
+            fill_storage(storage, range(10, 20))
+
+            data = storage.get_historical_data('thermal', since=900 * 8, until=900 * 11)
+
+        assert [d.values['current_power'] for d in data] == [9, 10, 11]
+
+    def test_unknown_unit(self, tmp_path):
+        with SQLiteDataStorage(str(tmp_path / 'history.db'), initial_timestamp=0) as storage:
+            with pytest.raises(UnknownComponentQueryError):
+                storage.get_historical_data('load', since=0)